@@ -2,15 +2,509 @@
 prefect-google-sheets tasks
 """
 
-from typing import Dict, List, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Union
+from urllib.parse import quote
 
-import gspread
+import requests
+from gspread.exceptions import APIError
+from gspread.worksheet import Worksheet
 from pandas import DataFrame
 from prefect import task
+from prefect.context import TaskRunContext
+from prefect.utilities.hashing import hash_objects
 
-from prefect_google_sheets.exceptions import GoogleSheetsConfigurationException
-from prefect_google_sheets.utils.dataframe import get_sheet_dataframe
-from prefect_google_sheets.utils.google import generate_google_credentials
+from prefect_google_sheets.exceptions import (
+    GoogleSheetsConfigurationException,
+    GoogleSheetServiceAccountError,
+)
+from prefect_google_sheets.utils.arrow import (
+    arrow_table_to_dataframe,
+    get_sheet_arrow_table,
+)
+from prefect_google_sheets.utils.dataframe import (
+    aget_private_sheet_dataframe,
+    aget_public_sheet_dataframe,
+    get_new_rows_dataframe,
+    get_revision_cached_dataframe,
+    get_sheet_dataframe,
+    get_sheets_dataframes,
+    iter_sheet_dataframes,
+)
+from prefect_google_sheets.utils.export import (
+    EXPORT_FORMAT_ENGINES,
+    get_public_sheets_dataframes,
+)
+from prefect_google_sheets.utils.google import (
+    aget_gspread_client,
+    get_gspread_client,
+    get_service_account_fingerprint,
+    get_spreadsheet_revision,
+)
+from prefect_google_sheets.utils.query import aget_query_dataframe, get_query_dataframe
+from prefect_google_sheets.utils.state import SheetStateStore
+from prefect_google_sheets.utils.values import (
+    get_sheet_columns,
+    get_sheet_values,
+    get_unformatted_sheet_dataframe,
+)
+from prefect_google_sheets.utils.write import (
+    APPENDER_MAX_ROWS,
+    APPENDER_MAX_WAIT,
+    MAX_BATCH_UPDATE_BYTES,
+    MAX_BATCH_UPDATE_CELLS,
+    VALUE_INPUT_OPTIONS,
+    BufferedSheetAppender,
+    upsert_dataframe,
+    write_dataframe,
+)
+
+
+def _validate_read_parameters(
+    is_public_sheet: bool,
+    google_service_account: Union[Dict, str],
+    google_sheet_key: Optional[str],
+    google_sheet_name: Optional[str],
+) -> None:
+    """
+    Validate the parameters shared by the read tasks.
+    """
+    if not is_public_sheet and not google_service_account:
+        exc_message = "Missing Google Service Account information."
+        raise GoogleSheetsConfigurationException(exc_message)
+
+    if not google_sheet_key:
+        exc_message = "Missing the Google Sheet key identifier."
+        raise GoogleSheetsConfigurationException(exc_message)
+
+    if not google_sheet_name:
+        exc_message = "Missing the Google Sheet name identifier."
+        raise GoogleSheetsConfigurationException(exc_message)
+
+
+def _validate_query_parameters(
+    query: Optional[str], columns: Optional[List[str]], raw: Optional[bool] = False
+) -> None:
+    """
+    Validate the parameters that can't be used together with a query.
+    """
+    if query and columns:
+        exc_message = "A query and a list of columns can't be read together."
+        raise GoogleSheetsConfigurationException(exc_message)
+
+    if query and raw:
+        exc_message = "A query can't be read as raw values."
+        raise GoogleSheetsConfigurationException(exc_message)
+
+
+def _validate_schema_parameters(
+    dtype: Optional[Dict[str, str]],
+    date_formats: Optional[Dict[str, str]],
+    query: Optional[str],
+    engine: Optional[str] = None,
+    raw: Optional[bool] = False,
+) -> None:
+    """
+    Validate the parameters that can't be used together with a schema.
+    """
+    if (dtype or date_formats) and (query or engine or raw):
+        exc_message = (
+            "A dtype and date formats can't be applied to a query, "
+            "to raw values nor to the pyarrow engine."
+        )
+        raise GoogleSheetsConfigurationException(exc_message)
+
+
+def _validate_unformatted_parameters(
+    unformatted_values: Optional[bool],
+    serial_date_columns: Optional[List[str]],
+    is_public_sheet: bool,
+    **parsing_parameters: Any,
+) -> None:
+    """
+    Validate the parameters of the unformatted values read mode, which can't
+    be used together with the other ways of parsing the sheet content.
+    """
+    if serial_date_columns and not unformatted_values:
+        exc_message = "Serial date columns can only be read as unformatted values."
+        raise GoogleSheetsConfigurationException(exc_message)
+
+    if unformatted_values and (is_public_sheet or any(parsing_parameters.values())):
+        exc_message = (
+            "Unformatted values can only be read from private Google Sheets, "
+            f"without {', '.join(parsing_parameters)}."
+        )
+        raise GoogleSheetsConfigurationException(exc_message)
+
+
+def _validate_engine(engine: Optional[str], query: Optional[str]) -> None:
+    """
+    Validate the engine parsing the sheet content.
+    """
+    if engine not in (None, "pyarrow"):
+        exc_message = "Wrong engine. Valid ones: pyarrow"
+        raise GoogleSheetsConfigurationException(exc_message)
+
+    if engine and query:
+        exc_message = "A query can't be read with the pyarrow engine."
+        raise GoogleSheetsConfigurationException(exc_message)
+
+
+def _validate_chunk_size(chunk_size: Optional[int]) -> None:
+    """
+    Validate the number of rows of the chunks of a streamed read.
+    """
+    if not chunk_size or chunk_size < 1:
+        exc_message = "The chunk size must be at least 1."
+        raise GoogleSheetsConfigurationException(exc_message)
+
+
+def _validate_write_parameters(
+    data_frame: Optional[DataFrame],
+    value_input_option: str,
+    max_cells_per_request: int,
+    max_bytes_per_request: int,
+) -> None:
+    """
+    Validate the parameters shared by the write tasks.
+    """
+    if data_frame is None:
+        exc_message = "Missing the DataFrame to write."
+        raise GoogleSheetsConfigurationException(exc_message)
+
+    if value_input_option not in VALUE_INPUT_OPTIONS:
+        exc_message = (
+            f"Wrong value input option. Valid ones: {', '.join(VALUE_INPUT_OPTIONS)}"
+        )
+        raise GoogleSheetsConfigurationException(exc_message)
+
+    if (
+        not max_cells_per_request
+        or max_cells_per_request < 1
+        or not max_bytes_per_request
+        or max_bytes_per_request < 1
+    ):
+        exc_message = "The cells and bytes per request must be at least 1."
+        raise GoogleSheetsConfigurationException(exc_message)
+
+
+def _get_public_sheet_url(google_sheet_key: str, google_sheet_name: str) -> str:
+    """
+    Get the CSV export URL of a public sheet.
+    """
+    return (
+        f"https://docs.google.com/spreadsheets/d/{google_sheet_key}"
+        f"/export?format=csv&sheet={quote(google_sheet_name)}"
+    )
+
+
+def _get_google_sheet(
+    is_public_sheet: bool,
+    google_service_account: Union[Dict, str],
+    google_sheet_key: Optional[str],
+    google_sheet_name: Optional[str],
+) -> Union[Worksheet, str]:
+    """
+    Validate the task parameters and get the reference of the sheet to read:
+    the CSV export URL if the sheet is public, the gspread Worksheet otherwise.
+    """
+    _validate_read_parameters(
+        is_public_sheet, google_service_account, google_sheet_key, google_sheet_name
+    )
+
+    if is_public_sheet:
+        return _get_public_sheet_url(google_sheet_key, google_sheet_name)
+
+    gspread_client = get_gspread_client(google_service_account=google_service_account)
+    return gspread_client.open_by_key(google_sheet_key).worksheet(google_sheet_name)
+
+
+def _read_google_sheet_data_frame(
+    is_public_sheet: bool,
+    google_service_account: Union[Dict, str],
+    google_sheet_key: Optional[str],
+    google_sheet_name: Optional[str],
+    first_row_header: Optional[bool],
+    on_bad_lines: Optional[str],
+    clean: Optional[bool],
+    google_sheet_range: Optional[str],
+    columns: Optional[List[str]],
+    query: Optional[str],
+    use_cache: Optional[bool],
+    cache_directory: Optional[str],
+    dtype: Optional[Dict[str, str]] = None,
+    date_formats: Optional[Dict[str, str]] = None,
+    engine: Optional[str] = None,
+    unformatted_values: Optional[bool] = False,
+    serial_date_columns: Optional[List[str]] = None,
+) -> DataFrame:
+    """
+    Read a sheet as a pandas DataFrame, as done by the sync read tasks,
+    through the revision-aware local cache if asked to.
+    """
+    _validate_query_parameters(query, columns)
+    _validate_engine(engine, query)
+    _validate_schema_parameters(dtype, date_formats, query, engine)
+    _validate_unformatted_parameters(
+        unformatted_values,
+        serial_date_columns,
+        is_public_sheet,
+        query=query,
+        engine=engine,
+        dtype=dtype,
+        date_formats=date_formats,
+    )
+
+    def read_dataframe() -> DataFrame:
+        if query:
+            _validate_read_parameters(
+                is_public_sheet,
+                google_service_account,
+                google_sheet_key,
+                google_sheet_name,
+            )
+            return get_query_dataframe(
+                (
+                    None
+                    if is_public_sheet
+                    else get_gspread_client(
+                        google_service_account=google_service_account
+                    )
+                ),
+                google_sheet_key,
+                google_sheet_name,
+                query,
+                header=0 if first_row_header is True else None,
+                clean=clean,
+                sheet_range=google_sheet_range,
+            )
+
+        sheet = _get_google_sheet(
+            is_public_sheet=is_public_sheet,
+            google_service_account=google_service_account,
+            google_sheet_key=google_sheet_key,
+            google_sheet_name=google_sheet_name,
+        )
+        if unformatted_values:
+            return get_unformatted_sheet_dataframe(
+                sheet,
+                header=0 if first_row_header is True else None,
+                clean=clean,
+                sheet_range=google_sheet_range,
+                columns=columns,
+                serial_date_columns=serial_date_columns,
+            )
+        if engine == "pyarrow":
+            return arrow_table_to_dataframe(
+                get_sheet_arrow_table(
+                    sheet,
+                    header=first_row_header is True,
+                    clean=clean,
+                    sheet_range=google_sheet_range,
+                    columns=columns,
+                )
+            )
+        return get_sheet_dataframe(
+            sheet,
+            header=0 if first_row_header is True else None,
+            parse_dates=True,
+            on_bad_lines=on_bad_lines,
+            clean=clean,
+            sheet_range=google_sheet_range,
+            columns=columns,
+            dtype=dtype,
+            date_formats=date_formats,
+        )
+
+    # Public sheets have no Drive metadata readable without credentials
+    if not use_cache or is_public_sheet:
+        return read_dataframe()
+
+    _validate_read_parameters(
+        is_public_sheet, google_service_account, google_sheet_key, google_sheet_name
+    )
+    return get_revision_cached_dataframe(
+        get_gspread_client(google_service_account=google_service_account),
+        google_sheet_key,
+        (
+            google_sheet_name,
+            google_sheet_range,
+            columns,
+            query,
+            first_row_header,
+            clean,
+            dtype,
+            date_formats,
+            engine,
+            unformatted_values,
+            serial_date_columns,
+        ),
+        read_dataframe,
+        SheetStateStore(cache_directory),
+    )
+
+
+def google_sheet_revision_cache_key(
+    context: TaskRunContext, arguments: Dict[str, Any]
+) -> Optional[str]:
+    """
+    A task cache key built from the Drive revision of the Google Sheets to read
+    and the read parameters, so that Prefect reuses the result of a read
+    for as long as the Google Sheets don't change. The revisions are checked
+    with a single Drive metadata request per Google Sheet.
+    Public sheets, whose revision can't be read without credentials,
+    are never cached.
+    Example:
+        Cache the reads of a reference sheet:
+        ```python
+        from prefect import flow
+        from prefect_google_sheets.tasks import (
+            GOOGLE_SHEET_REVISION_CACHE_OPTIONS,
+            read_google_sheet_as_data_frame,
+        )
+
+        cached_read = read_google_sheet_as_data_frame.with_options(
+            **GOOGLE_SHEET_REVISION_CACHE_OPTIONS
+        )
+
+        @flow
+        def example_flow():
+            return cached_read(
+                google_service_account=service_account,
+                google_sheet_key="foo",
+                google_sheet_name="bar",
+            )
+        ```
+    Args:
+        context: The context of the task run.
+        arguments: The arguments the task is called with.
+    Returns:
+        The cache key, None if the revisions could not be read.
+    """
+
+    google_service_account = arguments.get("google_service_account")
+    google_sheet_keys = sorted(
+        arguments.get("google_sheets") or [arguments.get("google_sheet_key")]
+    )
+    if (
+        arguments.get("is_public_sheet")
+        or not google_service_account
+        or not all(google_sheet_keys)
+    ):
+        return None
+
+    try:
+        gspread_client = get_gspread_client(
+            google_service_account=google_service_account
+        )
+        revisions = [
+            get_spreadsheet_revision(gspread_client, google_sheet_key)
+            for google_sheet_key in google_sheet_keys
+        ]
+        service_account_fingerprint = get_service_account_fingerprint(
+            google_service_account
+        )
+    except (
+        APIError,
+        GoogleSheetServiceAccountError,
+        requests.RequestException,
+        KeyError,
+        ValueError,
+    ):
+        # Let the task run, and fail, as if it was not cached
+        return None
+
+    read_parameters = {
+        name: value
+        for name, value in arguments.items()
+        if name != "google_service_account"
+    }
+    return hash_objects(
+        context.task.task_key,
+        context.task.fn.__code__.co_code.hex(),
+        service_account_fingerprint,
+        read_parameters,
+        dict(zip(google_sheet_keys, revisions)),
+    )
+
+
+# Task options caching a read task on the Google Sheet revision
+GOOGLE_SHEET_REVISION_CACHE_OPTIONS = {
+    "cache_key_fn": google_sheet_revision_cache_key,
+    "persist_result": True,
+}
+
+
+async def _aread_google_sheet(
+    is_public_sheet: bool,
+    google_service_account: Union[Dict, str],
+    google_sheet_key: Optional[str],
+    google_sheet_name: Optional[str],
+    first_row_header: Optional[bool],
+    on_bad_lines: Optional[str],
+    clean: Optional[bool],
+    google_sheet_range: Optional[str],
+    columns: Optional[List[str]],
+    query: Optional[str],
+    dtype: Optional[Dict[str, str]],
+    date_formats: Optional[Dict[str, str]],
+) -> DataFrame:
+    """
+    Read a sheet as a pandas DataFrame on the running event loop,
+    as done by the async read tasks.
+    """
+    _validate_read_parameters(
+        is_public_sheet, google_service_account, google_sheet_key, google_sheet_name
+    )
+    _validate_query_parameters(query, columns)
+    _validate_schema_parameters(dtype, date_formats, query)
+
+    if query:
+        return await aget_query_dataframe(
+            (
+                None
+                if is_public_sheet
+                else await aget_gspread_client(
+                    google_service_account=google_service_account
+                )
+            ),
+            google_sheet_key,
+            google_sheet_name,
+            query,
+            header=0 if first_row_header is True else None,
+            clean=clean,
+            sheet_range=google_sheet_range,
+        )
+
+    if is_public_sheet:
+        return await aget_public_sheet_dataframe(
+            _get_public_sheet_url(google_sheet_key, google_sheet_name),
+            header=0 if first_row_header is True else None,
+            parse_dates=True,
+            on_bad_lines=on_bad_lines,
+            clean=clean,
+            sheet_range=google_sheet_range,
+            columns=columns,
+            dtype=dtype,
+            date_formats=date_formats,
+        )
+
+    gspread_client = await aget_gspread_client(
+        google_service_account=google_service_account
+    )
+    return await aget_private_sheet_dataframe(
+        gspread_client,
+        google_sheet_key,
+        google_sheet_name,
+        header=0 if first_row_header is True else None,
+        parse_dates=True,
+        on_bad_lines=on_bad_lines,
+        clean=clean,
+        sheet_range=google_sheet_range,
+        columns=columns,
+        dtype=dtype,
+        date_formats=date_formats,
+    )
 
 
 @task
@@ -22,6 +516,16 @@ def read_google_sheet_as_data_frame(
     first_row_header: Optional[bool] = True,
     on_bad_lines: Optional[str] = "error",
     clean: Optional[bool] = False,
+    google_sheet_range: Optional[str] = None,
+    columns: Optional[List[str]] = None,
+    query: Optional[str] = None,
+    dtype: Optional[Dict[str, str]] = None,
+    date_formats: Optional[Dict[str, str]] = None,
+    unformatted_values: Optional[bool] = False,
+    serial_date_columns: Optional[List[str]] = None,
+    use_cache: Optional[bool] = False,
+    cache_directory: Optional[str] = None,
+    engine: Optional[str] = None,
 ) -> DataFrame:
     """
     This task leverages the Google Sheets API v4 through the gspread library
@@ -45,6 +549,38 @@ def read_google_sheet_as_data_frame(
             Default set to 'error'
         clean: Used in order to remove blank columns and rows left
             in the Google Sheet.
+        google_sheet_range: The A1 notation of the range to read, e.g. "A1:F5000".
+            If set, only that range is requested to Google. Default set to None
+        columns: The names of the columns to read, as they appear in the header.
+            If set, only those columns are requested to Google.
+            Can't be used together with google_sheet_range. Default set to None
+        query: A query in the Google Visualization API Query Language, e.g.
+            "select A, C where D > 100". If set, the rows are filtered and projected
+            by Google, and only the result is sent. Can be restricted to
+            google_sheet_range. Can't be used together with columns.
+            Default set to None
+        dtype: The types of the columns, by header name, e.g. {"amount": "float64"}.
+            If set, those columns are not inferred and dates are not sniffed.
+            Default set to None
+        date_formats: The formats of the date columns, by header name,
+            e.g. {"day": "%d/%m/%Y"}. If set, those columns are converted with
+            their format instead of guessing it for each value. Default set to None
+        unformatted_values: Whether to ask Google for unformatted values: numbers
+            are sent as numbers and dates as serial numbers, so that no string
+            is parsed. Only for private Google Sheets. Default set to False
+        serial_date_columns: The columns holding dates, converted from their serial
+            numbers when reading unformatted values. Default set to None
+        use_cache: Whether to serve the previous result from a local snapshot
+            if the Google Sheet didn't change since then, checked with a single
+            Drive metadata request. Ignored for public sheets. Default set to False
+        cache_directory: The directory of the local cache.
+            Default set to the google_sheets directory inside the Prefect home
+        engine: The engine parsing the Google Sheet content. If set to "pyarrow",
+            the columns types are inferred by the multithreaded pyarrow CSV reader
+            and, with pandas 1.5 or later, the DataFrame is backed by Arrow arrays.
+            Older pandas versions, such as the pinned 1.3, lack ArrowDtype and get
+            a DataFrame backed by numpy arrays. Requires the pyarrow package.
+            Default set to None
     Raises:
         - `GoogleSheetsConfigurationException`
             if google_service_account not provided or None
@@ -52,42 +588,43 @@ def read_google_sheet_as_data_frame(
             if google_sheet_key not provided or None
         - `GoogleSheetsConfigurationException`
             if google_sheet_name not provided or None
+        - `GoogleSheetsConfigurationException`
+            if both google_sheet_range and columns are provided
+        - `GoogleSheetsConfigurationException`
+            if both query and columns are provided
+        - `GoogleSheetsConfigurationException`
+            if dtype or date_formats are provided along with query or engine
+        - `GoogleSheetsConfigurationException`
+            if serial_date_columns are provided without unformatted_values
+        - `GoogleSheetsConfigurationException`
+            if unformatted_values are read from a public sheet, or along with
+            query, engine, dtype or date_formats
+        - `GoogleSheetsConfigurationException`
+            if engine is not valid, or pyarrow is not installed
         - `GoogleSheetServiceAccountError`
             if the google_service_account is not valid or malformed
     Returns:
         The content of a specific Sheet as a pandas dataframe.
     """
 
-    if not is_public_sheet and not google_service_account:
-        exc_message = "Missing Google Service Account information."
-        raise GoogleSheetsConfigurationException(exc_message)
-
-    if not google_sheet_key:
-        exc_message = "Missing the Google Sheet key identifier."
-        raise GoogleSheetsConfigurationException(exc_message)
-
-    if not google_sheet_name:
-        exc_message = "Missing the Google Sheet name identifier."
-        raise GoogleSheetsConfigurationException(exc_message)
-
-    if is_public_sheet:
-        sheet = f"""https://docs.google.com/spreadsheets/d/{google_sheet_key}/
-            export?format=csv&sheet={google_sheet_name}"""
-    else:
-        google_credentials = generate_google_credentials(
-            google_service_account=google_service_account
-        )
-        gspread_client = gspread.authorize(google_credentials)
-        sheet = gspread_client.open_by_key(google_sheet_key).worksheet(
-            google_sheet_name
-        )
-
-    sheet_df = get_sheet_dataframe(
-        sheet,
-        header=0 if first_row_header is True else None,
-        parse_dates=True,
+    sheet_df = _read_google_sheet_data_frame(
+        is_public_sheet=is_public_sheet,
+        google_service_account=google_service_account,
+        google_sheet_key=google_sheet_key,
+        google_sheet_name=google_sheet_name,
+        first_row_header=first_row_header,
         on_bad_lines=on_bad_lines,
         clean=clean,
+        google_sheet_range=google_sheet_range,
+        columns=columns,
+        query=query,
+        dtype=dtype,
+        date_formats=date_formats,
+        unformatted_values=unformatted_values,
+        serial_date_columns=serial_date_columns,
+        use_cache=use_cache,
+        cache_directory=cache_directory,
+        engine=engine,
     )
     return sheet_df
 
@@ -101,6 +638,16 @@ def read_google_sheet_as_list_of_lists(
     first_row_header: Optional[bool] = True,
     on_bad_lines: Optional[str] = "error",
     clean: Optional[bool] = False,
+    google_sheet_range: Optional[str] = None,
+    columns: Optional[List[str]] = None,
+    query: Optional[str] = None,
+    dtype: Optional[Dict[str, str]] = None,
+    date_formats: Optional[Dict[str, str]] = None,
+    unformatted_values: Optional[bool] = False,
+    serial_date_columns: Optional[List[str]] = None,
+    raw: Optional[bool] = False,
+    use_cache: Optional[bool] = False,
+    cache_directory: Optional[str] = None,
 ) -> List[List]:
     """
     This task leverages the Google Sheets API v4 through the gspread library
@@ -122,6 +669,35 @@ def read_google_sheet_as_list_of_lists(
             'skip': The line is skipped with no warnings
             Default set to 'error'
         clean: Used in order to remove blank columns and rows left in the Google Sheet.
+        google_sheet_range: The A1 notation of the range to read, e.g. "A1:F5000".
+            If set, only that range is requested to Google. Default set to None
+        columns: The names of the columns to read, as they appear in the header.
+            If set, only those columns are requested to Google.
+            Can't be used together with google_sheet_range. Default set to None
+        query: A query in the Google Visualization API Query Language, e.g.
+            "select A, C where D > 100". If set, the rows are filtered and projected
+            by Google, and only the result is sent. Can be restricted to
+            google_sheet_range. Can't be used together with columns.
+            Default set to None
+        dtype: The types of the columns, by header name, e.g. {"amount": "float64"}.
+            If set, those columns are not inferred and dates are not sniffed.
+            Default set to None
+        date_formats: The formats of the date columns, by header name,
+            e.g. {"day": "%d/%m/%Y"}. If set, those columns are converted with
+            their format instead of guessing it for each value. Default set to None
+        unformatted_values: Whether to ask Google for unformatted values: numbers
+            are sent as numbers and dates as serial numbers, so that no string
+            is parsed. Only for private Google Sheets. Default set to False
+        serial_date_columns: The columns holding dates, converted from their serial
+            numbers when reading unformatted values. Default set to None
+        raw: Whether to return the values as sent by Google, without parsing
+            them through pandas: blank cells are kept as empty strings and dates
+            are not parsed. Faster and lighter on big sheets. Default set to False
+        use_cache: Whether to serve the previous result from a local snapshot
+            if the Google Sheet didn't change since then, checked with a single
+            Drive metadata request. Ignored for public sheets. Default set to False
+        cache_directory: The directory of the local cache.
+            Default set to the google_sheets directory inside the Prefect home
     Raises:
         - `GoogleSheetsConfigurationException`
             if google_service_account not provided or None
@@ -129,42 +705,62 @@ def read_google_sheet_as_list_of_lists(
             if google_sheet_key not provided or None
         - `GoogleSheetsConfigurationException`
             if google_sheet_name not provided or None
+        - `GoogleSheetsConfigurationException`
+            if both google_sheet_range and columns are provided
+        - `GoogleSheetsConfigurationException`
+            if both query and columns are provided
+        - `GoogleSheetsConfigurationException`
+            if both query and raw are provided
+        - `GoogleSheetsConfigurationException`
+            if dtype or date_formats are provided along with query or raw
+        - `GoogleSheetsConfigurationException`
+            if serial_date_columns are provided without unformatted_values
+        - `GoogleSheetsConfigurationException`
+            if unformatted_values are read from a public sheet, or along with
+            raw, query, dtype or date_formats
         - `GoogleSheetServiceAccountError`
             if the google_service_account is not valid or malformed
     Returns:
         The content of a specific Sheet as a list of lists.
     """
 
-    if not is_public_sheet and not google_service_account:
-        exc_message = "Missing Google Service Account information."
-        raise GoogleSheetsConfigurationException(exc_message)
-
-    if not google_sheet_key:
-        exc_message = "Missing the Google Sheet key identifier."
-        raise GoogleSheetsConfigurationException(exc_message)
-
-    if not google_sheet_name:
-        exc_message = "Missing the Google Sheet name identifier."
-        raise GoogleSheetsConfigurationException(exc_message)
-
-    if is_public_sheet:
-        sheet = f"""https://docs.google.com/spreadsheets/d/{google_sheet_key}/
-            export?format=csv&sheet={google_sheet_name}"""
-    else:
-        google_credentials = generate_google_credentials(
-            google_service_account=google_service_account
+    if raw:
+        _validate_query_parameters(query, columns, raw)
+        _validate_schema_parameters(dtype, date_formats, query, raw=raw)
+        _validate_unformatted_parameters(
+            unformatted_values, serial_date_columns, is_public_sheet, raw=raw
         )
-        gspread_client = gspread.authorize(google_credentials)
-        sheet = gspread_client.open_by_key(google_sheet_key).worksheet(
-            google_sheet_name
+        sheet = _get_google_sheet(
+            is_public_sheet=is_public_sheet,
+            google_service_account=google_service_account,
+            google_sheet_key=google_sheet_key,
+            google_sheet_name=google_sheet_name,
+        )
+        return get_sheet_values(
+            sheet,
+            header=first_row_header is True,
+            clean=clean,
+            sheet_range=google_sheet_range,
+            columns=columns,
         )
 
-    sheet_df = get_sheet_dataframe(
-        sheet,
-        header=0 if first_row_header is True else None,
-        parse_dates=True,
+    sheet_df = _read_google_sheet_data_frame(
+        is_public_sheet=is_public_sheet,
+        google_service_account=google_service_account,
+        google_sheet_key=google_sheet_key,
+        google_sheet_name=google_sheet_name,
+        first_row_header=first_row_header,
         on_bad_lines=on_bad_lines,
         clean=clean,
+        google_sheet_range=google_sheet_range,
+        columns=columns,
+        query=query,
+        dtype=dtype,
+        date_formats=date_formats,
+        unformatted_values=unformatted_values,
+        serial_date_columns=serial_date_columns,
+        use_cache=use_cache,
+        cache_directory=cache_directory,
     )
     return sheet_df.values.tolist()
 
@@ -178,6 +774,16 @@ def read_google_sheet_as_dict_of_lists(
     first_row_header: Optional[bool] = True,
     on_bad_lines: Optional[str] = "error",
     clean: Optional[bool] = False,
+    google_sheet_range: Optional[str] = None,
+    columns: Optional[List[str]] = None,
+    query: Optional[str] = None,
+    dtype: Optional[Dict[str, str]] = None,
+    date_formats: Optional[Dict[str, str]] = None,
+    unformatted_values: Optional[bool] = False,
+    serial_date_columns: Optional[List[str]] = None,
+    raw: Optional[bool] = False,
+    use_cache: Optional[bool] = False,
+    cache_directory: Optional[str] = None,
 ) -> List[Dict]:
     """
     This task leverages the Google Sheets API v4 through the gspread library
@@ -199,6 +805,36 @@ def read_google_sheet_as_dict_of_lists(
             'skip': The line is skipped with no warnings
             Default set to 'error'
         clean: Used in order to remove blank columns and rows left in the Google Sheet.
+        google_sheet_range: The A1 notation of the range to read, e.g. "A1:F5000".
+            If set, only that range is requested to Google. Default set to None
+        columns: The names of the columns to read, as they appear in the header.
+            If set, only those columns are requested to Google.
+            Can't be used together with google_sheet_range. Default set to None
+        query: A query in the Google Visualization API Query Language, e.g.
+            "select A, C where D > 100". If set, the rows are filtered and projected
+            by Google, and only the result is sent. Can be restricted to
+            google_sheet_range. Can't be used together with columns.
+            Default set to None
+        dtype: The types of the columns, by header name, e.g. {"amount": "float64"}.
+            If set, those columns are not inferred and dates are not sniffed.
+            Default set to None
+        date_formats: The formats of the date columns, by header name,
+            e.g. {"day": "%d/%m/%Y"}. If set, those columns are converted with
+            their format instead of guessing it for each value. Default set to None
+        unformatted_values: Whether to ask Google for unformatted values: numbers
+            are sent as numbers and dates as serial numbers, so that no string
+            is parsed. Only for private Google Sheets. Default set to False
+        serial_date_columns: The columns holding dates, converted from their serial
+            numbers when reading unformatted values. Default set to None
+        raw: Whether to build the lists straight from the values sent by Google,
+            without parsing them through pandas: blank cells are kept as empty
+            strings and dates are not parsed. Faster and lighter on big sheets.
+            Default set to False
+        use_cache: Whether to serve the previous result from a local snapshot
+            if the Google Sheet didn't change since then, checked with a single
+            Drive metadata request. Ignored for public sheets. Default set to False
+        cache_directory: The directory of the local cache.
+            Default set to the google_sheets directory inside the Prefect home
     Raises:
         - `GoogleSheetsConfigurationException`
             if google_service_account not provided or None
@@ -206,44 +842,1054 @@ def read_google_sheet_as_dict_of_lists(
             if google_sheet_key not provided or None
         - `GoogleSheetsConfigurationException`
             if google_sheet_name not provided or None
+        - `GoogleSheetsConfigurationException`
+            if both google_sheet_range and columns are provided
+        - `GoogleSheetsConfigurationException`
+            if both query and columns are provided
+        - `GoogleSheetsConfigurationException`
+            if both query and raw are provided
+        - `GoogleSheetsConfigurationException`
+            if dtype or date_formats are provided along with query or raw
+        - `GoogleSheetsConfigurationException`
+            if serial_date_columns are provided without unformatted_values
+        - `GoogleSheetsConfigurationException`
+            if unformatted_values are read from a public sheet, or along with
+            raw, query, dtype or date_formats
         - `GoogleSheetServiceAccountError`
             if the google_service_account is not valid or malformed
     Returns:
         The content of a specific Sheet as a dict of lists.
     """
 
-    if not is_public_sheet and not google_service_account:
-        exc_message = "Missing Google Service Account information."
-        raise GoogleSheetsConfigurationException(exc_message)
-
-    if not google_sheet_key:
-        exc_message = "Missing the Google Sheet key identifier."
-        raise GoogleSheetsConfigurationException(exc_message)
-
-    if not google_sheet_name:
-        exc_message = "Missing the Google Sheet name identifier."
-        raise GoogleSheetsConfigurationException(exc_message)
-
-    if is_public_sheet:
-        sheet = f"""https://docs.google.com/spreadsheets/d/{google_sheet_key}/
-            export?format=csv&sheet={google_sheet_name}"""
-    else:
-        google_credentials = generate_google_credentials(
-            google_service_account=google_service_account
+    if raw:
+        _validate_query_parameters(query, columns, raw)
+        _validate_schema_parameters(dtype, date_formats, query, raw=raw)
+        _validate_unformatted_parameters(
+            unformatted_values, serial_date_columns, is_public_sheet, raw=raw
         )
-        gspread_client = gspread.authorize(google_credentials)
-        sheet = gspread_client.open_by_key(google_sheet_key).worksheet(
-            google_sheet_name
+        sheet = _get_google_sheet(
+            is_public_sheet=is_public_sheet,
+            google_service_account=google_service_account,
+            google_sheet_key=google_sheet_key,
+            google_sheet_name=google_sheet_name,
+        )
+        return get_sheet_columns(
+            sheet,
+            header=first_row_header is True,
+            clean=clean,
+            sheet_range=google_sheet_range,
+            columns=columns,
         )
 
-    sheet_df = get_sheet_dataframe(
-        sheet,
-        header=0 if first_row_header is True else None,
-        parse_dates=True,
+    sheet_df = _read_google_sheet_data_frame(
+        is_public_sheet=is_public_sheet,
+        google_service_account=google_service_account,
+        google_sheet_key=google_sheet_key,
+        google_sheet_name=google_sheet_name,
+        first_row_header=first_row_header,
         on_bad_lines=on_bad_lines,
         clean=clean,
+        google_sheet_range=google_sheet_range,
+        columns=columns,
+        query=query,
+        dtype=dtype,
+        date_formats=date_formats,
+        unformatted_values=unformatted_values,
+        serial_date_columns=serial_date_columns,
+        use_cache=use_cache,
+        cache_directory=cache_directory,
     )
     return {
         column_name: sheet_df[column_name].values.tolist()
         for column_name in sheet_df.columns.values
     }
+
+
+@task
+def read_google_sheet_as_arrow_table(
+    is_public_sheet: bool = False,
+    google_service_account: Union[Dict, str] = None,
+    google_sheet_key: Optional[str] = None,
+    google_sheet_name: Optional[str] = None,
+    first_row_header: Optional[bool] = True,
+    clean: Optional[bool] = False,
+    google_sheet_range: Optional[str] = None,
+    columns: Optional[List[str]] = None,
+) -> "pyarrow.Table":  # noqa: F821
+    """
+    This task leverages the Google Sheets API v4 through the gspread library
+    in order to read the content of a Google Sheet and return it as a pyarrow Table,
+    whose column types are inferred by the multithreaded pyarrow CSV reader.
+    Requires the pyarrow package.
+    Args:
+        is_public_sheet: Whether the Google Sheet is public or not.
+            If True, the google_service_account param will be ignored.
+        google_service_account: The Service Account to be used in order to interact with
+            the Google Sheet. This can be a dict or a string representing the JSON
+            Service Account body.
+        google_sheet_key: The key of the Google Sheet to read data from.
+        google_sheet_name: The name of the Sheet to read data from.
+        first_row_header: Whether the first row is the header.
+            If True, the first row will be used as header and data won't be read.
+            Otherwise, if set to False. Default set to True
+        clean: Used in order to remove blank columns and rows left in the Google Sheet.
+        google_sheet_range: The A1 notation of the range to read, e.g. "A1:F5000".
+            If set, only that range is requested to Google. Default set to None
+        columns: The names of the columns to read, as they appear in the header.
+            If set, only those columns are requested to Google.
+            Can't be used together with google_sheet_range. Default set to None
+    Raises:
+        - `GoogleSheetsConfigurationException`
+            if google_service_account not provided or None
+        - `GoogleSheetsConfigurationException`
+            if google_sheet_key not provided or None
+        - `GoogleSheetsConfigurationException`
+            if google_sheet_name not provided or None
+        - `GoogleSheetsConfigurationException`
+            if both google_sheet_range and columns are provided
+        - `GoogleSheetsConfigurationException`
+            if pyarrow is not installed
+        - `GoogleSheetServiceAccountError`
+            if the google_service_account is not valid or malformed
+    Returns:
+        The content of a specific Sheet as a pyarrow Table.
+    """
+
+    sheet = _get_google_sheet(
+        is_public_sheet=is_public_sheet,
+        google_service_account=google_service_account,
+        google_sheet_key=google_sheet_key,
+        google_sheet_name=google_sheet_name,
+    )
+    return get_sheet_arrow_table(
+        sheet,
+        header=first_row_header is True,
+        clean=clean,
+        sheet_range=google_sheet_range,
+        columns=columns,
+    )
+
+
+@task
+def read_google_sheets_batch(
+    google_service_account: Union[Dict, str] = None,
+    google_sheet_key: Optional[str] = None,
+    google_sheet_names: Optional[List[str]] = None,
+    first_row_header: Optional[bool] = True,
+    on_bad_lines: Optional[str] = "error",
+    clean: Optional[bool] = False,
+    is_public_sheet: bool = False,
+    export_format: Optional[str] = "xlsx",
+    cache_directory: Optional[str] = None,
+    cache_max_age: Optional[float] = 0,
+) -> Dict[str, DataFrame]:
+    """
+    This task leverages the Google Sheets API v4 through the gspread library
+    in order to read many Sheets of the same Google Sheet with a single
+    request and return them as a dict of pandas Dataframes.
+    Public Google Sheets are downloaded once as a whole XLSX or ODS export,
+    kept locally, and only the wanted Sheets are parsed.
+    Args:
+        google_service_account: The Service Account to be used in order to interact with
+            the Google Sheet. This can be a dict or a string representing the JSON
+            Service Account body.
+        google_sheet_key: The key of the Google Sheet to read data from.
+        google_sheet_names: The names of the Sheets to read data from.
+            An A1 range such as "Sheet1!A1:F5000" can be used in place of a name.
+        first_row_header: Whether the first row is the header.
+            If True, the first row will be used as header and data won't be read.
+            Otherwise, if set to False. Default set to True
+        on_bad_lines: What to do if bad lines are discovered:
+            'error': An Exception is raised
+            'warn': A warning is printed and the line  is skipped
+            'skip': The line is skipped with no warnings
+            Default set to 'error'
+        clean: Used in order to remove blank columns and rows left in the Google Sheet.
+        is_public_sheet: Whether the Google Sheet is public or not.
+            If True, the google_service_account param will be ignored.
+        export_format: The format of the export of a public Google Sheet,
+            "xlsx" or "ods". Default set to "xlsx"
+        cache_directory: The directory keeping the exports of public Google Sheets.
+            Default set to the google_sheets directory inside the Prefect home
+        cache_max_age: The seconds the export of a public Google Sheet is reused
+            for by the following reads, 0 to always download it. Default set to 0
+    Raises:
+        - `GoogleSheetsConfigurationException`
+            if google_service_account not provided or None
+        - `GoogleSheetsConfigurationException`
+            if google_sheet_key not provided or None
+        - `GoogleSheetsConfigurationException`
+            if google_sheet_names not provided or empty
+        - `GoogleSheetsConfigurationException`
+            if export_format is not valid, or A1 ranges are read from a public sheet
+        - `GoogleSheetServiceAccountError`
+            if the google_service_account is not valid or malformed
+    Returns:
+        The content of each Sheet as a pandas dataframe, keyed by Sheet name.
+    """
+
+    if not is_public_sheet and not google_service_account:
+        exc_message = "Missing Google Service Account information."
+        raise GoogleSheetsConfigurationException(exc_message)
+
+    if not google_sheet_key:
+        exc_message = "Missing the Google Sheet key identifier."
+        raise GoogleSheetsConfigurationException(exc_message)
+
+    if not google_sheet_names:
+        exc_message = "Missing the Google Sheet names identifiers."
+        raise GoogleSheetsConfigurationException(exc_message)
+
+    if is_public_sheet:
+        if export_format not in EXPORT_FORMAT_ENGINES:
+            exc_message = (
+                "Wrong export format for the public Google Sheet. "
+                f"Valid ones: {', '.join(EXPORT_FORMAT_ENGINES)}"
+            )
+            raise GoogleSheetsConfigurationException(exc_message)
+
+        if any("!" in google_sheet_name for google_sheet_name in google_sheet_names):
+            exc_message = "A1 ranges can't be read from a public Google Sheet export."
+            raise GoogleSheetsConfigurationException(exc_message)
+
+        return get_public_sheets_dataframes(
+            google_sheet_key,
+            google_sheet_names,
+            header=0 if first_row_header is True else None,
+            clean=clean,
+            export_format=export_format,
+            cache_directory=cache_directory,
+            max_age=cache_max_age,
+        )
+
+    gspread_client = get_gspread_client(google_service_account=google_service_account)
+    return get_sheets_dataframes(
+        gspread_client,
+        google_sheet_key,
+        google_sheet_names,
+        header=0 if first_row_header is True else None,
+        parse_dates=True,
+        on_bad_lines=on_bad_lines,
+        clean=clean,
+    )
+
+
+@task
+def read_google_sheets_concurrently(
+    google_service_account: Union[Dict, str] = None,
+    google_sheets: Optional[Dict[str, List[str]]] = None,
+    first_row_header: Optional[bool] = True,
+    on_bad_lines: Optional[str] = "error",
+    clean: Optional[bool] = False,
+    max_concurrency: Optional[int] = 8,
+) -> Dict[str, Dict[str, DataFrame]]:
+    """
+    This task leverages the Google Sheets API v4 through the gspread library
+    in order to read many Google Sheets concurrently, sharing one authorized client,
+    and return them as pandas Dataframes. Each Google Sheet is read with a single
+    request, as done by `read_google_sheets_batch`.
+    Args:
+        google_service_account: The Service Account to be used in order to interact with
+            the Google Sheets. This can be a dict or a string representing the JSON
+            Service Account body.
+        google_sheets: The Sheets to read, as a dict having the Google Sheet keys
+            as keys and the list of Sheet names, or A1 ranges, as values.
+        first_row_header: Whether the first row is the header.
+            If True, the first row will be used as header and data won't be read.
+            Otherwise, if set to False. Default set to True
+        on_bad_lines: What to do if bad lines are discovered:
+            'error': An Exception is raised
+            'warn': A warning is printed and the line  is skipped
+            'skip': The line is skipped with no warnings
+            Default set to 'error'
+        clean: Used in order to remove blank columns and rows left in the Google Sheet.
+        max_concurrency: The maximum number of Google Sheets read at the same time.
+            Default set to 8
+    Raises:
+        - `GoogleSheetsConfigurationException`
+            if google_service_account not provided or None
+        - `GoogleSheetsConfigurationException`
+            if google_sheets not provided or empty
+        - `GoogleSheetsConfigurationException`
+            if max_concurrency is lower than 1
+        - `GoogleSheetServiceAccountError`
+            if the google_service_account is not valid or malformed
+    Returns:
+        The content of each Sheet as a pandas dataframe,
+        keyed by Google Sheet key and then by Sheet name.
+    """
+
+    if not google_service_account:
+        exc_message = "Missing Google Service Account information."
+        raise GoogleSheetsConfigurationException(exc_message)
+
+    if not google_sheets:
+        exc_message = "Missing the Google Sheets to read."
+        raise GoogleSheetsConfigurationException(exc_message)
+
+    if not max_concurrency or max_concurrency < 1:
+        exc_message = "The maximum concurrency must be at least 1."
+        raise GoogleSheetsConfigurationException(exc_message)
+
+    gspread_client = get_gspread_client(google_service_account=google_service_account)
+
+    def _read(google_sheet_key: str) -> Dict[str, DataFrame]:
+        return get_sheets_dataframes(
+            gspread_client,
+            google_sheet_key,
+            google_sheets[google_sheet_key],
+            header=0 if first_row_header is True else None,
+            parse_dates=True,
+            on_bad_lines=on_bad_lines,
+            clean=clean,
+        )
+
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        return dict(zip(google_sheets, executor.map(_read, google_sheets)))
+
+
+@task
+async def aread_google_sheet_as_data_frame(
+    is_public_sheet: bool = False,
+    google_service_account: Union[Dict, str] = None,
+    google_sheet_key: Optional[str] = None,
+    google_sheet_name: Optional[str] = None,
+    first_row_header: Optional[bool] = True,
+    on_bad_lines: Optional[str] = "error",
+    clean: Optional[bool] = False,
+    google_sheet_range: Optional[str] = None,
+    columns: Optional[List[str]] = None,
+    query: Optional[str] = None,
+    dtype: Optional[Dict[str, str]] = None,
+    date_formats: Optional[Dict[str, str]] = None,
+) -> DataFrame:
+    """
+    Async version of `read_google_sheet_as_data_frame`: the Google Sheets API
+    is called through a pooled async HTTP client, so that many reads can
+    overlap on the same event loop without blocking a thread each.
+    Args:
+        is_public_sheet: Whether the Google Sheet is public or not.
+            If True, the google_service_account param will be ignored.
+        google_service_account: The Service Account to be used in order to interact with
+            the Google Sheet. This can be a dict or a string representing the JSON
+            Service Account body.
+        google_sheet_key: The key of the Google Sheet to read data from.
+        google_sheet_name: The name of the Sheet to read data from.
+        first_row_header: Whether the first row is the header.
+            If True, the first row will be used as header and data won't be read.
+            Otherwise, if set to False. Default set to True
+        on_bad_lines: What to do if bad lines are discovered:
+            'error': An Exception is raised
+            'warn': A warning is printed and the line  is skipped
+            'skip': The line is skipped with no warnings
+            Default set to 'error'
+        clean: Used in order to remove blank columns and rows left in the Google Sheet.
+        google_sheet_range: The A1 notation of the range to read, e.g. "A1:F5000".
+            If set, only that range is requested to Google. Default set to None
+        columns: The names of the columns to read, as they appear in the header.
+            If set, only those columns are requested to Google.
+            Can't be used together with google_sheet_range. Default set to None
+        query: A query in the Google Visualization API Query Language, e.g.
+            "select A, C where D > 100". If set, the rows are filtered and projected
+            by Google, and only the result is sent. Can be restricted to
+            google_sheet_range. Can't be used together with columns.
+            Default set to None
+        dtype: The types of the columns, by header name, e.g. {"amount": "float64"}.
+            If set, those columns are not inferred and dates are not sniffed.
+            Default set to None
+        date_formats: The formats of the date columns, by header name,
+            e.g. {"day": "%d/%m/%Y"}. If set, those columns are converted with
+            their format instead of guessing it for each value. Default set to None
+    Raises:
+        - `GoogleSheetsConfigurationException`
+            if google_service_account not provided or None
+        - `GoogleSheetsConfigurationException`
+            if google_sheet_key not provided or None
+        - `GoogleSheetsConfigurationException`
+            if google_sheet_name not provided or None
+        - `GoogleSheetsConfigurationException`
+            if both google_sheet_range and columns are provided
+        - `GoogleSheetsConfigurationException`
+            if both query and columns are provided
+        - `GoogleSheetsConfigurationException`
+            if dtype or date_formats are provided along with query
+        - `GoogleSheetServiceAccountError`
+            if the google_service_account is not valid or malformed
+    Returns:
+        The content of a specific Sheet as a pandas Dataframe.
+    """
+
+    sheet_df = await _aread_google_sheet(
+        is_public_sheet=is_public_sheet,
+        google_service_account=google_service_account,
+        google_sheet_key=google_sheet_key,
+        google_sheet_name=google_sheet_name,
+        first_row_header=first_row_header,
+        on_bad_lines=on_bad_lines,
+        clean=clean,
+        google_sheet_range=google_sheet_range,
+        columns=columns,
+        query=query,
+        dtype=dtype,
+        date_formats=date_formats,
+    )
+    return sheet_df
+
+
+@task
+async def aread_google_sheet_as_list_of_lists(
+    is_public_sheet: bool = False,
+    google_service_account: Union[Dict, str] = None,
+    google_sheet_key: Optional[str] = None,
+    google_sheet_name: Optional[str] = None,
+    first_row_header: Optional[bool] = True,
+    on_bad_lines: Optional[str] = "error",
+    clean: Optional[bool] = False,
+    google_sheet_range: Optional[str] = None,
+    columns: Optional[List[str]] = None,
+    query: Optional[str] = None,
+    dtype: Optional[Dict[str, str]] = None,
+    date_formats: Optional[Dict[str, str]] = None,
+) -> List[List]:
+    """
+    Async version of `read_google_sheet_as_list_of_lists`: the Google Sheets API
+    is called through a pooled async HTTP client, so that many reads can
+    overlap on the same event loop without blocking a thread each.
+    Args:
+        is_public_sheet: Whether the Google Sheet is public or not.
+            If True, the google_service_account param will be ignored.
+        google_service_account: The Service Account to be used in order to interact with
+            the Google Sheet. This can be a dict or a string representing the JSON
+            Service Account body.
+        google_sheet_key: The key of the Google Sheet to read data from.
+        google_sheet_name: The name of the Sheet to read data from.
+        first_row_header: Whether the first row is the header.
+            If True, the first row will be used as header and data won't be read.
+            Otherwise, if set to False. Default set to True
+        on_bad_lines: What to do if bad lines are discovered:
+            'error': An Exception is raised
+            'warn': A warning is printed and the line  is skipped
+            'skip': The line is skipped with no warnings
+            Default set to 'error'
+        clean: Used in order to remove blank columns and rows left in the Google Sheet.
+        google_sheet_range: The A1 notation of the range to read, e.g. "A1:F5000".
+            If set, only that range is requested to Google. Default set to None
+        columns: The names of the columns to read, as they appear in the header.
+            If set, only those columns are requested to Google.
+            Can't be used together with google_sheet_range. Default set to None
+        query: A query in the Google Visualization API Query Language, e.g.
+            "select A, C where D > 100". If set, the rows are filtered and projected
+            by Google, and only the result is sent. Can be restricted to
+            google_sheet_range. Can't be used together with columns.
+            Default set to None
+        dtype: The types of the columns, by header name, e.g. {"amount": "float64"}.
+            If set, those columns are not inferred and dates are not sniffed.
+            Default set to None
+        date_formats: The formats of the date columns, by header name,
+            e.g. {"day": "%d/%m/%Y"}. If set, those columns are converted with
+            their format instead of guessing it for each value. Default set to None
+    Raises:
+        - `GoogleSheetsConfigurationException`
+            if google_service_account not provided or None
+        - `GoogleSheetsConfigurationException`
+            if google_sheet_key not provided or None
+        - `GoogleSheetsConfigurationException`
+            if google_sheet_name not provided or None
+        - `GoogleSheetsConfigurationException`
+            if both google_sheet_range and columns are provided
+        - `GoogleSheetsConfigurationException`
+            if both query and columns are provided
+        - `GoogleSheetsConfigurationException`
+            if dtype or date_formats are provided along with query
+        - `GoogleSheetServiceAccountError`
+            if the google_service_account is not valid or malformed
+    Returns:
+        The content of a specific Sheet as a list of lists.
+    """
+
+    sheet_df = await _aread_google_sheet(
+        is_public_sheet=is_public_sheet,
+        google_service_account=google_service_account,
+        google_sheet_key=google_sheet_key,
+        google_sheet_name=google_sheet_name,
+        first_row_header=first_row_header,
+        on_bad_lines=on_bad_lines,
+        clean=clean,
+        google_sheet_range=google_sheet_range,
+        columns=columns,
+        query=query,
+        dtype=dtype,
+        date_formats=date_formats,
+    )
+    return sheet_df.values.tolist()
+
+
+@task
+async def aread_google_sheet_as_dict_of_lists(
+    is_public_sheet: bool = False,
+    google_service_account: Union[Dict, str] = None,
+    google_sheet_key: Optional[str] = None,
+    google_sheet_name: Optional[str] = None,
+    first_row_header: Optional[bool] = True,
+    on_bad_lines: Optional[str] = "error",
+    clean: Optional[bool] = False,
+    google_sheet_range: Optional[str] = None,
+    columns: Optional[List[str]] = None,
+    query: Optional[str] = None,
+    dtype: Optional[Dict[str, str]] = None,
+    date_formats: Optional[Dict[str, str]] = None,
+) -> Dict[str, List]:
+    """
+    Async version of `read_google_sheet_as_dict_of_lists`: the Google Sheets API
+    is called through a pooled async HTTP client, so that many reads can
+    overlap on the same event loop without blocking a thread each.
+    Args:
+        is_public_sheet: Whether the Google Sheet is public or not.
+            If True, the google_service_account param will be ignored.
+        google_service_account: The Service Account to be used in order to interact with
+            the Google Sheet. This can be a dict or a string representing the JSON
+            Service Account body.
+        google_sheet_key: The key of the Google Sheet to read data from.
+        google_sheet_name: The name of the Sheet to read data from.
+        first_row_header: Whether the first row is the header.
+            If True, the first row will be used as header and data won't be read.
+            Otherwise, if set to False. Default set to True
+        on_bad_lines: What to do if bad lines are discovered:
+            'error': An Exception is raised
+            'warn': A warning is printed and the line  is skipped
+            'skip': The line is skipped with no warnings
+            Default set to 'error'
+        clean: Used in order to remove blank columns and rows left in the Google Sheet.
+        google_sheet_range: The A1 notation of the range to read, e.g. "A1:F5000".
+            If set, only that range is requested to Google. Default set to None
+        columns: The names of the columns to read, as they appear in the header.
+            If set, only those columns are requested to Google.
+            Can't be used together with google_sheet_range. Default set to None
+        query: A query in the Google Visualization API Query Language, e.g.
+            "select A, C where D > 100". If set, the rows are filtered and projected
+            by Google, and only the result is sent. Can be restricted to
+            google_sheet_range. Can't be used together with columns.
+            Default set to None
+        dtype: The types of the columns, by header name, e.g. {"amount": "float64"}.
+            If set, those columns are not inferred and dates are not sniffed.
+            Default set to None
+        date_formats: The formats of the date columns, by header name,
+            e.g. {"day": "%d/%m/%Y"}. If set, those columns are converted with
+            their format instead of guessing it for each value. Default set to None
+    Raises:
+        - `GoogleSheetsConfigurationException`
+            if google_service_account not provided or None
+        - `GoogleSheetsConfigurationException`
+            if google_sheet_key not provided or None
+        - `GoogleSheetsConfigurationException`
+            if google_sheet_name not provided or None
+        - `GoogleSheetsConfigurationException`
+            if both google_sheet_range and columns are provided
+        - `GoogleSheetsConfigurationException`
+            if both query and columns are provided
+        - `GoogleSheetsConfigurationException`
+            if dtype or date_formats are provided along with query
+        - `GoogleSheetServiceAccountError`
+            if the google_service_account is not valid or malformed
+    Returns:
+        The content of a specific Sheet as a dict of lists.
+    """
+
+    sheet_df = await _aread_google_sheet(
+        is_public_sheet=is_public_sheet,
+        google_service_account=google_service_account,
+        google_sheet_key=google_sheet_key,
+        google_sheet_name=google_sheet_name,
+        first_row_header=first_row_header,
+        on_bad_lines=on_bad_lines,
+        clean=clean,
+        google_sheet_range=google_sheet_range,
+        columns=columns,
+        query=query,
+        dtype=dtype,
+        date_formats=date_formats,
+    )
+    return {
+        column_name: sheet_df[column_name].values.tolist()
+        for column_name in sheet_df.columns.values
+    }
+
+
+def iter_google_sheet_as_data_frames(
+    is_public_sheet: bool = False,
+    google_service_account: Union[Dict, str] = None,
+    google_sheet_key: Optional[str] = None,
+    google_sheet_name: Optional[str] = None,
+    first_row_header: Optional[bool] = True,
+    on_bad_lines: Optional[str] = "error",
+    clean: Optional[bool] = False,
+    chunk_size: Optional[int] = 10000,
+) -> Iterator[DataFrame]:
+    """
+    This function leverages the Google Sheets API v4 through the gspread library
+    in order to stream the content of a Google Sheet as pandas Dataframes of at most
+    chunk_size rows. Private Sheets are paged through with sequential row range
+    requests, public Sheets are parsed chunk by chunk while being downloaded.
+    Being an iterator, it is meant to be consumed inside a flow or a task,
+    so that each chunk can be processed and discarded with constant memory.
+    Args:
+        is_public_sheet: Whether the Google Sheet is public or not.
+            If True, the google_service_account param will be ignored.
+        google_service_account: The Service Account to be used in order to interact with
+            the Google Sheet. This can be a dict or a string representing the JSON
+            Service Account body.
+        google_sheet_key: The key of the Google Sheet to read data from.
+        google_sheet_name: The name of the Sheet to read data from.
+        first_row_header: Whether the first row is the header.
+            If True, the first row will be used as header of every chunk.
+            Otherwise, if set to False. Default set to True
+        on_bad_lines: What to do if bad lines are discovered:
+            'error': An Exception is raised
+            'warn': A warning is printed and the line  is skipped
+            'skip': The line is skipped with no warnings
+            Default set to 'error'
+        clean: Used in order to remove blank columns and rows left in the Google Sheet,
+            chunk by chunk.
+        chunk_size: The maximum number of rows of each Dataframe. Default set to 10000
+    Raises:
+        - `GoogleSheetsConfigurationException`
+            if google_service_account not provided or None
+        - `GoogleSheetsConfigurationException`
+            if google_sheet_key not provided or None
+        - `GoogleSheetsConfigurationException`
+            if google_sheet_name not provided or None
+        - `GoogleSheetsConfigurationException`
+            if chunk_size is lower than 1
+        - `GoogleSheetServiceAccountError`
+            if the google_service_account is not valid or malformed
+    Returns:
+        An iterator over the content of a specific Sheet as pandas dataframes.
+    """
+
+    _validate_chunk_size(chunk_size)
+    sheet = _get_google_sheet(
+        is_public_sheet=is_public_sheet,
+        google_service_account=google_service_account,
+        google_sheet_key=google_sheet_key,
+        google_sheet_name=google_sheet_name,
+    )
+    return iter_sheet_dataframes(
+        sheet,
+        header=0 if first_row_header is True else None,
+        parse_dates=True,
+        on_bad_lines=on_bad_lines,
+        clean=clean,
+        chunk_size=chunk_size,
+    )
+
+
+@task
+def read_google_sheet_incrementally(
+    google_service_account: Union[Dict, str] = None,
+    google_sheet_key: Optional[str] = None,
+    google_sheet_name: Optional[str] = None,
+    first_row_header: Optional[bool] = True,
+    on_bad_lines: Optional[str] = "error",
+    clean: Optional[bool] = False,
+    include_previous_rows: Optional[bool] = False,
+    state_directory: Optional[str] = None,
+) -> DataFrame:
+    """
+    This task leverages the Google Sheets API v4 through the gspread library
+    in order to read only the rows appended to an append-only Google Sheet since
+    the previous run, and return them as a pandas Dataframe. The last row read is
+    kept, per Google Sheet and Sheet, in a local state store.
+    Args:
+        google_service_account: The Service Account to be used in order to interact with
+            the Google Sheet. This can be a dict or a string representing the JSON
+            Service Account body.
+        google_sheet_key: The key of the Google Sheet to read data from.
+        google_sheet_name: The name of the Sheet to read data from.
+        first_row_header: Whether the first row is the header.
+            If True, the first row will be used as header and data won't be read.
+            Otherwise, if set to False. Default set to True
+        on_bad_lines: What to do if bad lines are discovered:
+            'error': An Exception is raised
+            'warn': A warning is printed and the line  is skipped
+            'skip': The line is skipped with no warnings
+            Default set to 'error'
+        clean: Used in order to remove blank columns and rows left in the Google Sheet.
+        include_previous_rows: Whether to return the rows read by the previous runs
+            too, kept in a local snapshot, along with the new ones. Default set to False
+        state_directory: The directory of the local state store.
+            Default set to the google_sheets directory inside the Prefect home
+    Raises:
+        - `GoogleSheetsConfigurationException`
+            if google_service_account not provided or None
+        - `GoogleSheetsConfigurationException`
+            if google_sheet_key not provided or None
+        - `GoogleSheetsConfigurationException`
+            if google_sheet_name not provided or None
+        - `GoogleSheetServiceAccountError`
+            if the google_service_account is not valid or malformed
+    Returns:
+        The rows appended since the previous run, or all the rows if
+        include_previous_rows is True, as a pandas dataframe.
+    """
+
+    sheet = _get_google_sheet(
+        is_public_sheet=False,
+        google_service_account=google_service_account,
+        google_sheet_key=google_sheet_key,
+        google_sheet_name=google_sheet_name,
+    )
+    return get_new_rows_dataframe(
+        sheet,
+        header=0 if first_row_header is True else None,
+        parse_dates=True,
+        on_bad_lines=on_bad_lines,
+        clean=clean,
+        state_store=SheetStateStore(state_directory),
+        include_previous_rows=include_previous_rows,
+    )
+
+
+@task
+def write_data_frame_to_google_sheet(
+    google_service_account: Union[Dict, str] = None,
+    google_sheet_key: Optional[str] = None,
+    google_sheet_name: Optional[str] = None,
+    data_frame: Optional[DataFrame] = None,
+    first_row_header: Optional[bool] = True,
+    start_cell: Optional[str] = "A1",
+    resize: Optional[bool] = False,
+    value_input_option: Optional[str] = "USER_ENTERED",
+    max_cells_per_request: Optional[int] = MAX_BATCH_UPDATE_CELLS,
+    max_bytes_per_request: Optional[int] = MAX_BATCH_UPDATE_BYTES,
+    only_changed_cells: Optional[bool] = False,
+    use_cache: Optional[bool] = False,
+    cache_directory: Optional[str] = None,
+) -> Dict[str, int]:
+    """
+    This task leverages the Google Sheets API v4 through the gspread library
+    in order to write a pandas Dataframe to a Google Sheet. The values are sent
+    with as few `values:batchUpdate` requests as the cells and bytes bounds allow.
+    Args:
+        google_service_account: The Service Account to be used in order to interact with
+            the Google Sheet. This can be a dict or a string representing the JSON
+            Service Account body.
+        google_sheet_key: The key of the Google Sheet to write data to.
+        google_sheet_name: The name of the Sheet to write data to.
+        data_frame: The pandas Dataframe to write.
+        first_row_header: Whether to write the column names as the first row.
+            Default set to True
+        start_cell: The A1 notation of the top left cell to write. Default set to "A1"
+        resize: Whether to resize the Sheet before writing, so that it ends
+            with the last row and column written. Default set to False
+        value_input_option: How Google interprets the values:
+            'RAW': The values are stored as they are
+            'USER_ENTERED': The values are parsed as if typed in the UI,
+                e.g. numbers, dates and formulas
+            Default set to 'USER_ENTERED'
+        max_cells_per_request: The maximum number of cells sent by a request.
+            Default set to 50000
+        max_bytes_per_request: The maximum size of the values sent by a request.
+            Default set to 2000000
+        only_changed_cells: Whether to compare the Dataframe with the current values,
+            and send only the changed cells, coalesced into rectangular ranges.
+            Default set to False
+        use_cache: Whether to keep a local copy of the written values, compared
+            with the Dataframe by the following writes in place of reading the
+            Sheet. Changes made to the Sheet by others are then not noticed.
+            Default set to False
+        cache_directory: The directory of the local copy of the written values.
+            Default set to the google_sheets directory inside the Prefect home
+    Raises:
+        - `GoogleSheetsConfigurationException`
+            if google_service_account not provided or None
+        - `GoogleSheetsConfigurationException`
+            if google_sheet_key not provided or None
+        - `GoogleSheetsConfigurationException`
+            if google_sheet_name not provided or None
+        - `GoogleSheetsConfigurationException`
+            if data_frame not provided or None
+        - `GoogleSheetsConfigurationException`
+            if value_input_option is not valid, or the request bounds are lower than 1
+        - `GoogleSheetServiceAccountError`
+            if the google_service_account is not valid or malformed
+        - `GoogleSheetValueError`
+            if an exception is thrown while writing the Google Sheet
+    Returns:
+        The number of requests sent and of cells updated, as a dict
+        with the "requests" and "updated_cells" keys.
+    """
+
+    _validate_read_parameters(
+        False, google_service_account, google_sheet_key, google_sheet_name
+    )
+    _validate_write_parameters(
+        data_frame, value_input_option, max_cells_per_request, max_bytes_per_request
+    )
+
+    sheet = _get_google_sheet(
+        is_public_sheet=False,
+        google_service_account=google_service_account,
+        google_sheet_key=google_sheet_key,
+        google_sheet_name=google_sheet_name,
+    )
+    return write_dataframe(
+        sheet,
+        data_frame,
+        include_header=first_row_header is True,
+        start_cell=start_cell,
+        resize=resize,
+        value_input_option=value_input_option,
+        max_cells=max_cells_per_request,
+        max_bytes=max_bytes_per_request,
+        only_changed_cells=only_changed_cells,
+        state_store=SheetStateStore(cache_directory) if use_cache else None,
+    )
+
+
+@task
+def upsert_data_frame_to_google_sheet(
+    google_service_account: Union[Dict, str] = None,
+    google_sheet_key: Optional[str] = None,
+    google_sheet_name: Optional[str] = None,
+    data_frame: Optional[DataFrame] = None,
+    key_columns: Optional[List[str]] = None,
+    value_input_option: Optional[str] = "USER_ENTERED",
+    max_cells_per_request: Optional[int] = MAX_BATCH_UPDATE_CELLS,
+    max_bytes_per_request: Optional[int] = MAX_BATCH_UPDATE_BYTES,
+) -> Dict[str, int]:
+    """
+    This task leverages the Google Sheets API v4 through the gspread library
+    in order to upsert a pandas Dataframe into a Google Sheet having a header:
+    the rows matching the keys of the Dataframe are updated in place, while the
+    rows of the new keys are appended. Only the key columns of the Google Sheet
+    are read, and the updated rows are sent grouped into contiguous ranges.
+    Args:
+        google_service_account: The Service Account to be used in order to interact with
+            the Google Sheet. This can be a dict or a string representing the JSON
+            Service Account body.
+        google_sheet_key: The key of the Google Sheet to write data to.
+        google_sheet_name: The name of the Sheet to write data to.
+        data_frame: The pandas Dataframe to upsert. All its columns must be
+            in the header of the Sheet, while the other columns of the Sheet
+            are left untouched.
+        key_columns: The names of the columns identifying a row.
+        value_input_option: How Google interprets the values:
+            'RAW': The values are stored as they are
+            'USER_ENTERED': The values are parsed as if typed in the UI,
+                e.g. numbers, dates and formulas
+            Default set to 'USER_ENTERED'
+        max_cells_per_request: The maximum number of cells sent by a request.
+            Default set to 50000
+        max_bytes_per_request: The maximum size of the values sent by a request.
+            Default set to 2000000
+    Raises:
+        - `GoogleSheetsConfigurationException`
+            if google_service_account not provided or None
+        - `GoogleSheetsConfigurationException`
+            if google_sheet_key not provided or None
+        - `GoogleSheetsConfigurationException`
+            if google_sheet_name not provided or None
+        - `GoogleSheetsConfigurationException`
+            if data_frame not provided or None
+        - `GoogleSheetsConfigurationException`
+            if key_columns not provided or not in the data_frame
+        - `GoogleSheetsConfigurationException`
+            if value_input_option is not valid, or the request bounds are lower than 1
+        - `GoogleSheetServiceAccountError`
+            if the google_service_account is not valid or malformed
+        - `GoogleSheetValueError`
+            if an exception is thrown while reading or writing the Google Sheet
+    Returns:
+        The number of requests sent, of rows updated and of rows appended, as a dict
+        with the "requests", "updated_rows" and "appended_rows" keys.
+    """
+
+    _validate_read_parameters(
+        False, google_service_account, google_sheet_key, google_sheet_name
+    )
+    _validate_write_parameters(
+        data_frame, value_input_option, max_cells_per_request, max_bytes_per_request
+    )
+
+    if not key_columns:
+        exc_message = "Missing the key columns."
+        raise GoogleSheetsConfigurationException(exc_message)
+
+    missing_columns = [c for c in key_columns if c not in data_frame.columns]
+    if missing_columns:
+        exc_message = f"Key columns not found in the DataFrame: {missing_columns}"
+        raise GoogleSheetsConfigurationException(exc_message)
+
+    sheet = _get_google_sheet(
+        is_public_sheet=False,
+        google_service_account=google_service_account,
+        google_sheet_key=google_sheet_key,
+        google_sheet_name=google_sheet_name,
+    )
+    return upsert_dataframe(
+        sheet,
+        data_frame,
+        list(key_columns),
+        value_input_option=value_input_option,
+        max_cells=max_cells_per_request,
+        max_bytes=max_bytes_per_request,
+    )
+
+
+def google_sheet_appender(
+    google_service_account: Union[Dict, str] = None,
+    google_sheet_key: Optional[str] = None,
+    google_sheet_name: Optional[str] = None,
+    value_input_option: Optional[str] = "USER_ENTERED",
+    max_buffered_rows: Optional[int] = APPENDER_MAX_ROWS,
+    max_buffered_bytes: Optional[int] = MAX_BATCH_UPDATE_BYTES,
+    max_wait_seconds: Optional[float] = APPENDER_MAX_WAIT,
+) -> BufferedSheetAppender:
+    """
+    This function leverages the Google Sheets API v4 through the gspread library
+    in order to get an appender of rows to a Google Sheet, to be used as a context
+    manager. The rows are buffered in memory and sent with a single `values:append`
+    request once a threshold is reached, and when leaving the context unless
+    it raised, in which case the rows left are not sent.
+    Its `requests`, `appended_rows` and `rows_per_request` attributes report
+    the requests sent so far.
+    Args:
+        google_service_account: The Service Account to be used in order to interact with
+            the Google Sheet. This can be a dict or a string representing the JSON
+            Service Account body.
+        google_sheet_key: The key of the Google Sheet to write data to.
+        google_sheet_name: The name of the Sheet to append the rows to.
+        value_input_option: How Google interprets the values:
+            'RAW': The values are stored as they are
+            'USER_ENTERED': The values are parsed as if typed in the UI,
+                e.g. numbers, dates and formulas
+            Default set to 'USER_ENTERED'
+        max_buffered_rows: The number of buffered rows flushing the buffer.
+            Default set to 1000
+        max_buffered_bytes: The size of the buffered rows flushing the buffer.
+            Default set to 2000000
+        max_wait_seconds: The seconds the oldest buffered row waits before the next
+            append flushes the buffer. Default set to 10
+    Raises:
+        - `GoogleSheetsConfigurationException`
+            if google_service_account not provided or None
+        - `GoogleSheetsConfigurationException`
+            if google_sheet_key not provided or None
+        - `GoogleSheetsConfigurationException`
+            if google_sheet_name not provided or None
+        - `GoogleSheetsConfigurationException`
+            if value_input_option is not valid, or the thresholds are not valid
+        - `GoogleSheetServiceAccountError`
+            if the google_service_account is not valid or malformed
+    Returns:
+        The appender, whose append, extend and append_data_frame methods buffer rows.
+    """
+
+    _validate_read_parameters(
+        False, google_service_account, google_sheet_key, google_sheet_name
+    )
+
+    if value_input_option not in VALUE_INPUT_OPTIONS:
+        exc_message = (
+            f"Wrong value input option. Valid ones: {', '.join(VALUE_INPUT_OPTIONS)}"
+        )
+        raise GoogleSheetsConfigurationException(exc_message)
+
+    if (
+        not max_buffered_rows
+        or max_buffered_rows < 1
+        or not max_buffered_bytes
+        or max_buffered_bytes < 1
+        or max_wait_seconds is None
+        or max_wait_seconds < 0
+    ):
+        exc_message = (
+            "The buffered rows and bytes must be at least 1, "
+            "and the wait seconds not negative."
+        )
+        raise GoogleSheetsConfigurationException(exc_message)
+
+    sheet = _get_google_sheet(
+        is_public_sheet=False,
+        google_service_account=google_service_account,
+        google_sheet_key=google_sheet_key,
+        google_sheet_name=google_sheet_name,
+    )
+    return BufferedSheetAppender(
+        sheet,
+        value_input_option=value_input_option,
+        max_rows=max_buffered_rows,
+        max_bytes=max_buffered_bytes,
+        max_wait=max_wait_seconds,
+    )
+
+
+@task
+def append_rows_to_google_sheet(
+    google_service_account: Union[Dict, str] = None,
+    google_sheet_key: Optional[str] = None,
+    google_sheet_name: Optional[str] = None,
+    rows: Optional[Union[List[List], DataFrame]] = None,
+    value_input_option: Optional[str] = "USER_ENTERED",
+    max_rows_per_request: Optional[int] = APPENDER_MAX_ROWS,
+) -> Dict[str, Union[int, float]]:
+    """
+    This task leverages the Google Sheets API v4 through the gspread library
+    in order to append rows after the table of a Google Sheet, sending them
+    with `values:append` requests of up to max_rows_per_request rows each.
+    Args:
+        google_service_account: The Service Account to be used in order to interact with
+            the Google Sheet. This can be a dict or a string representing the JSON
+            Service Account body.
+        google_sheet_key: The key of the Google Sheet to write data to.
+        google_sheet_name: The name of the Sheet to append the rows to.
+        rows: The rows to append, as a list of lists or as a pandas Dataframe,
+            whose header is not appended.
+        value_input_option: How Google interprets the values:
+            'RAW': The values are stored as they are
+            'USER_ENTERED': The values are parsed as if typed in the UI,
+                e.g. numbers, dates and formulas
+            Default set to 'USER_ENTERED'
+        max_rows_per_request: The maximum number of rows sent by a request.
+            Default set to 1000
+    Raises:
+        - `GoogleSheetsConfigurationException`
+            if google_service_account not provided or None
+        - `GoogleSheetsConfigurationException`
+            if google_sheet_key not provided or None
+        - `GoogleSheetsConfigurationException`
+            if google_sheet_name not provided or None
+        - `GoogleSheetsConfigurationException`
+            if rows not provided or None
+        - `GoogleSheetsConfigurationException`
+            if value_input_option is not valid, or max_rows_per_request is lower than 1
+        - `GoogleSheetServiceAccountError`
+            if the google_service_account is not valid or malformed
+        - `GoogleSheetValueError`
+            if an exception is thrown while writing the Google Sheet
+    Returns:
+        The number of requests sent, of rows appended and of rows per request,
+        as a dict with the "requests", "appended_rows" and "rows_per_request" keys.
+    """
+
+    if rows is None:
+        exc_message = "Missing the rows to append."
+        raise GoogleSheetsConfigurationException(exc_message)
+
+    appender = google_sheet_appender(
+        google_service_account=google_service_account,
+        google_sheet_key=google_sheet_key,
+        google_sheet_name=google_sheet_name,
+        value_input_option=value_input_option,
+        max_buffered_rows=max_rows_per_request,
+    )
+    with appender:
+        if isinstance(rows, DataFrame):
+            appender.append_data_frame(rows)
+        else:
+            appender.extend(rows)
+    return {
+        "requests": appender.requests,
+        "appended_rows": appender.appended_rows,
+        "rows_per_request": appender.rows_per_request,
+    }
@@ -0,0 +1,171 @@
+"""
+utils function focus on the pyarrow engine
+"""
+
+import csv
+import io
+from typing import List, Optional, Union
+from urllib.parse import quote
+
+import pandas
+from gspread.utils import fill_gaps
+from gspread.worksheet import Worksheet
+from pandas import DataFrame
+
+from prefect_google_sheets.exceptions import (
+    GoogleSheetsConfigurationException,
+    GoogleSheetValueError,
+)
+from prefect_google_sheets.utils.google import open_public_sheet
+from prefect_google_sheets.utils.values import _read_sheet_values
+
+try:
+    import pyarrow
+    import pyarrow.compute as pyarrow_compute
+    from pyarrow import csv as pyarrow_csv
+except ImportError:
+    pyarrow = None
+
+
+def _check_pyarrow() -> None:
+    """
+    Raise a configuration error if the optional pyarrow package is missing.
+    """
+    if pyarrow is None:
+        exc_message = (
+            "The pyarrow engine requires the pyarrow package: "
+            "pip install prefect-google-sheets[pyarrow]"
+        )
+        raise GoogleSheetsConfigurationException(exc_message)
+
+
+def _get_csv_options(header: bool, columns: Optional[List[str]]) -> dict:
+    """
+    Get the options of the pyarrow CSV reader, inferring the column
+    types and parsing the dates on many threads. Only ISO 8601 dates are
+    parsed: pyarrow tries the parsers value by value, so the day first and
+    month first formats would silently mix within a column.
+    """
+    return {
+        "read_options": pyarrow_csv.ReadOptions(
+            use_threads=True, autogenerate_column_names=not header
+        ),
+        "convert_options": pyarrow_csv.ConvertOptions(
+            strings_can_be_null=True,
+            timestamp_parsers=[pyarrow_csv.ISO8601],
+            include_columns=columns,
+        ),
+    }
+
+
+def _drop_blank_columns_and_rows(table: "pyarrow.Table") -> "pyarrow.Table":
+    """
+    Remove the columns and rows of a table holding only nulls.
+    """
+    table = table.select(
+        [
+            position
+            for position, column in enumerate(table.columns)
+            if column.null_count < len(column)
+        ]
+    )
+    if not table.num_columns:
+        return table
+    is_filled = pyarrow_compute.is_valid(table.column(0))
+    for column in table.columns[1:]:
+        is_filled = pyarrow_compute.or_(is_filled, pyarrow_compute.is_valid(column))
+    return table.filter(is_filled)
+
+
+def values_to_arrow_table(values: List[List], header: bool) -> "pyarrow.Table":
+    """
+    Build an Arrow table out of the values sent by the Sheets API,
+    letting the multithreaded pyarrow CSV reader infer the column types.
+
+    Args:
+        - values: The rows of values, as returned by the Sheets API
+        - header: Whether the first row is the header
+
+    Return: The values as a pyarrow Table
+    """
+    _check_pyarrow()
+    buffer = io.StringIO()
+    # Google leaves out the trailing empty cells of each row
+    csv.writer(buffer).writerows(fill_gaps(values))
+    if not buffer.tell():
+        return pyarrow.table({})
+    return pyarrow_csv.read_csv(
+        io.BytesIO(buffer.getvalue().encode("utf-8")), **_get_csv_options(header, None)
+    )
+
+
+def get_sheet_arrow_table(
+    google_sheet: Union[Worksheet, str],
+    header: bool,
+    clean: bool,
+    sheet_range: Optional[str] = None,
+    columns: Optional[List[str]] = None,
+) -> "pyarrow.Table":
+    """
+    Read the content of a Google Sheet as an Arrow table, built from the
+    values sent by the Sheets API or straight from the public CSV export.
+
+    Args:
+        - google_sheet: The google sheet reference
+        - header: Whether the first row is the header
+        - clean: Whether to remove blank columns/rows if any
+        - sheet_range: The A1 notation of the range to read, if only
+            part of the sheet is needed
+        - columns: The header names of the columns to read, if only
+            some of them are needed
+
+    Raises:
+        - GoogleSheetsConfigurationException: If pyarrow is not installed,
+            or both sheet_range and columns are provided
+        - GoogleSheetValueError: If an exception is thrown
+            while reading the Google Sheet
+
+    Return: The Google Sheet content as a pyarrow Table
+    """
+    _check_pyarrow()
+    if isinstance(google_sheet, Worksheet):
+        values = _read_sheet_values(google_sheet, header, sheet_range, columns)
+        try:
+            table = values_to_arrow_table(values, header)
+        except Exception as exc:
+            exc_message = f"Error while reading the Sheet - {exc}"
+            raise GoogleSheetValueError(exc_message)
+    else:
+        if sheet_range and columns:
+            exc_message = "A range and a list of columns can't be read together."
+            raise GoogleSheetsConfigurationException(exc_message)
+        if sheet_range:
+            google_sheet = f"{google_sheet}&range={quote(sheet_range)}"
+        try:
+            with open_public_sheet(google_sheet) as stream:
+                table = pyarrow_csv.read_csv(
+                    stream, **_get_csv_options(header, columns)
+                )
+        except Exception as exc:
+            exc_message = f"Error while reading the Sheet - {exc}"
+            raise GoogleSheetValueError(exc_message)
+
+    if clean:
+        table = _drop_blank_columns_and_rows(table)
+    return table
+
+
+def arrow_table_to_dataframe(table: "pyarrow.Table") -> DataFrame:
+    """
+    Convert an Arrow table into a pandas DataFrame backed by Arrow arrays,
+    or by numpy arrays on pandas versions without ArrowDtype.
+
+    Args:
+        - table: The pyarrow Table to convert
+
+    Return: The pandas DataFrame
+    """
+    arrow_dtype = getattr(pandas, "ArrowDtype", None)
+    if arrow_dtype is None:
+        return table.to_pandas(split_blocks=True, self_destruct=True)
+    return table.to_pandas(types_mapper=arrow_dtype)
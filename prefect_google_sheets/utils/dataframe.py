@@ -2,13 +2,340 @@
 utils function focus on dataframes
 """
 
-from typing import Union
+from contextlib import ExitStack
+from io import BytesIO
+from itertools import chain
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
+from urllib.parse import quote
 
+from gspread import Client
+from gspread.exceptions import APIError
+from gspread.utils import (
+    absolute_range_name,
+    column_letter_to_index,
+    fill_gaps,
+    rowcol_to_a1,
+)
 from gspread.worksheet import Worksheet
 from gspread_dataframe import get_as_dataframe
-from pandas import DataFrame, read_csv
+from pandas import DataFrame, concat, read_csv, to_datetime
+from pandas.io.parsers import TextParser
 
-from prefect_google_sheets.exceptions import GoogleSheetValueError
+from prefect_google_sheets.exceptions import (
+    GoogleSheetsConfigurationException,
+    GoogleSheetValueError,
+)
+from prefect_google_sheets.utils.google import (
+    abatch_get_values,
+    aget_public_sheet_content,
+    batch_get_values,
+    get_spreadsheet_revision,
+    open_public_sheet,
+)
+from prefect_google_sheets.utils.state import SheetStateStore, make_state_key
+
+# Same rendering gspread_dataframe uses, so range reads match full reads
+VALUES_RENDER_PARAMS = {
+    "valueRenderOption": "FORMULA",
+    "dateTimeRenderOption": "FORMATTED_STRING",
+}
+
+# Numbers as JSON numbers and dates as serial numbers, nothing to parse
+UNFORMATTED_VALUES_RENDER_PARAMS = {
+    "valueRenderOption": "UNFORMATTED_VALUE",
+    "dateTimeRenderOption": "SERIAL_NUMBER",
+}
+
+
+def get_worksheet_values(
+    google_sheet: Worksheet,
+    sheet_range: Optional[str],
+    params: Dict = VALUES_RENDER_PARAMS,
+) -> List[List]:
+    """
+    Read the values of an A1 range of a Worksheet, asking the
+    Sheets API for that range only.
+
+    Args:
+        - google_sheet: The worksheet reference
+        - sheet_range: The A1 notation of the range to read, e.g. "A1:F5000",
+            None in order to read the whole sheet
+        - params: The render options of the values
+
+    Return: The values of the range, with ragged rows padded
+    """
+    response = google_sheet.spreadsheet.values_get(
+        absolute_range_name(google_sheet.title, sheet_range),
+        params=params,
+    )
+    return fill_gaps(response.get("values", []))
+
+
+def _is_blank(value) -> bool:
+    """
+    Whether a cell value is blank.
+    """
+    return value is None or value == ""
+
+
+def trim_blank_tail(values: List[List]) -> List[List]:
+    """
+    Remove the blank rows and cells trailing the filled values, padding
+    the ragged rows left, so that the grid padding is never parsed.
+    The blank rows and columns in between are kept, for the parsed
+    DataFrame to keep the positions, labels and index of the sheet.
+
+    Args:
+        - values: The rows of values, as returned by the Sheets API
+
+    Return: The rectangular rows of values, up to the last filled row and column
+    """
+    height = 0
+    width = 0
+    for position, row in enumerate(values):
+        filled = [index for index, value in enumerate(row) if not _is_blank(value)]
+        if filled:
+            height = position + 1
+            width = max(width, filled[-1] + 1)
+    return fill_gaps([row[:width] for row in values[:height]], cols=width)
+
+
+def _column_letter(column_index: int) -> str:
+    """
+    Convert a 1-based column index to its A1 letter, e.g. 28 -> "AB".
+    """
+    return rowcol_to_a1(1, column_index)[:-1]
+
+
+def _coalesce_column_indexes(column_indexes: List[int]) -> List[Tuple[int, int]]:
+    """
+    Group 1-based column indexes into the minimal list of contiguous
+    (first, last) spans, e.g. [1, 2, 3, 6] -> [(1, 3), (6, 6)].
+    """
+    spans = []
+    for column_index in sorted(set(column_indexes)):
+        if spans and spans[-1][1] == column_index - 1:
+            spans[-1] = (spans[-1][0], column_index)
+        else:
+            spans.append((column_index, column_index))
+    return spans
+
+
+def _get_columns_spans(
+    columns: List[str], header_values: Optional[List]
+) -> Tuple[List[Tuple[int, int]], List]:
+    """
+    Resolve the wanted columns against the header row, or read them as
+    A1 letters if header_values is None, and get the column spans to fetch
+    along with the labels the columns will have in the parsed DataFrame.
+    """
+    if header_values is None:
+        column_indexes = [column_letter_to_index(column) for column in columns]
+        spans = _coalesce_column_indexes(column_indexes)
+        fetched_indexes = [i for first, last in spans for i in range(first, last + 1)]
+        return spans, [fetched_indexes.index(i) for i in column_indexes]
+
+    missing_columns = [c for c in columns if c not in header_values]
+    if missing_columns:
+        raise ValueError(f"Columns not found in the header: {missing_columns}")
+    spans = _coalesce_column_indexes(
+        [header_values.index(column) + 1 for column in columns]
+    )
+    return spans, list(columns)
+
+
+def _get_columns_ranges(
+    google_sheet_name: str, spans: List[Tuple[int, int]]
+) -> List[str]:
+    """
+    Get the A1 notation of the whole-column ranges covering the spans.
+    """
+    return [
+        absolute_range_name(
+            google_sheet_name, f"{_column_letter(first)}:{_column_letter(last)}"
+        )
+        for first, last in spans
+    ]
+
+
+def _merge_columns_values(
+    value_ranges: List[List[List]], spans: List[Tuple[int, int]]
+) -> List[List]:
+    """
+    Merge the values of side by side column ranges into rows.
+    """
+    # Each range drops its own trailing empty rows and cells
+    rows = max((len(values) for values in value_ranges), default=0)
+    value_ranges = [
+        fill_gaps(values, rows=rows, cols=last - first + 1)
+        for values, (first, last) in zip(value_ranges, spans)
+    ]
+    return [list(chain.from_iterable(row)) for row in zip(*value_ranges)]
+
+
+def get_worksheet_columns_values(
+    google_sheet: Worksheet,
+    columns: List[str],
+    header: Optional[int],
+    params: Dict = VALUES_RENDER_PARAMS,
+) -> Tuple[List[List], List]:
+    """
+    Read only some columns of a Worksheet. The header row is resolved once,
+    the wanted columns are turned into the minimal set of column ranges
+    and all of them are fetched with a single values:batchGet call.
+
+    Args:
+        - google_sheet: The worksheet reference
+        - columns: The header names of the columns to read, or their
+            A1 letters if the sheet has no header
+        - header: The row representing the header of the sheet
+        - params: The render options of the values
+
+    Raises:
+        - ValueError: If a column is not in the header
+
+    Return: The values of the columns, in sheet order, and the
+        labels the wanted columns will have in the parsed DataFrame
+    """
+    header_values = None
+    if header is not None:
+        header_values = get_worksheet_values(
+            google_sheet, f"{header + 1}:{header + 1}", params
+        )
+        header_values = header_values[0] if header_values else []
+    spans, labels = _get_columns_spans(columns, header_values)
+
+    response = google_sheet.spreadsheet.values_batch_get(
+        _get_columns_ranges(google_sheet.title, spans),
+        params=params,
+    )
+    value_ranges = [
+        value_range.get("values", []) for value_range in response["valueRanges"]
+    ]
+    return _merge_columns_values(value_ranges, spans), labels
+
+
+def _clean_dataframe(sheet_df: DataFrame) -> None:
+    """
+    Remove, in place, the blank columns and rows of a DataFrame.
+    A DataFrame without rows keeps its columns, as none holds any data.
+    """
+    if len(sheet_df.index):
+        sheet_df.dropna(inplace=True, axis=1, how="all")
+    sheet_df.dropna(inplace=True, axis=0, how="all")
+
+
+def _get_parse_options(
+    parse_dates: bool,
+    dtype: Optional[Dict[str, str]],
+    date_formats: Optional[Dict[str, str]],
+) -> Dict:
+    """
+    Get the pandas parser options for the known column types: the typed
+    columns and the date columns, kept as strings until converted with
+    their format, are not inferred, and no date is sniffed.
+    """
+    if not dtype and not date_formats:
+        return {"parse_dates": parse_dates}
+    return {
+        "parse_dates": False,
+        "dtype": {
+            **{column: "object" for column in date_formats or {}},
+            **(dtype or {}),
+        },
+    }
+
+
+def _apply_date_formats(
+    sheet_df: DataFrame, date_formats: Optional[Dict[str, str]]
+) -> None:
+    """
+    Convert, in place, the date columns of a DataFrame with their known format.
+    """
+    for column, date_format in (date_formats or {}).items():
+        if column in sheet_df.columns:
+            sheet_df[column] = to_datetime(sheet_df[column], format=date_format)
+
+
+def _parse_values(
+    values: List[List],
+    header: Optional[int],
+    parse_dates: bool,
+    on_bad_lines: str,
+    dtype: Optional[Dict[str, str]] = None,
+    date_formats: Optional[Dict[str, str]] = None,
+) -> DataFrame:
+    """
+    Parse the values returned by the Sheets API into a DataFrame,
+    the same way gspread_dataframe does.
+    """
+    # Google sends no values at all for an empty sheet or range
+    if not any(values):
+        return DataFrame()
+    sheet_df = TextParser(
+        values,
+        header=header,
+        on_bad_lines=on_bad_lines,
+        **_get_parse_options(parse_dates, dtype, date_formats),
+    ).read()
+    _apply_date_formats(sheet_df, date_formats)
+    return sheet_df
+
+
+def get_sheets_dataframes(
+    gspread_client: Client,
+    google_sheet_key: str,
+    google_sheet_ranges: List[str],
+    header: int,
+    parse_dates: bool,
+    on_bad_lines: str,
+    clean: bool,
+) -> Dict[str, DataFrame]:
+    """
+    Read many sheets, or A1 ranges, of the same Google Sheet
+    with a single request.
+
+    Args:
+        - gspread_client: The authorized gspread client
+        - google_sheet_key: The key of the Google Sheet
+        - google_sheet_ranges: The sheet names, or A1 ranges such as
+            "Sheet1!A1:F100", to read
+        - header: The row representing the header of the sheets
+        - parse_dates: Whether to parse dates as date obj or not
+        - ob_bad_lines: What to do if bad rows are detected
+        - clean: Whether to remove blank columns/rows if any
+
+    Raises:
+        - GoogleSheetValueError: If an exception is thrown
+            while reading the Google Sheet
+
+    Return: The content of each sheet or range as a pandas DataFrame,
+        keyed by the sheet name or range
+    """
+    try:
+        values_list = batch_get_values(
+            gspread_client,
+            google_sheet_key,
+            [
+                sheet_range if "!" in sheet_range else absolute_range_name(sheet_range)
+                for sheet_range in google_sheet_ranges
+            ],
+            params=VALUES_RENDER_PARAMS,
+        )
+        sheets_df = {
+            sheet_range: _parse_values(
+                fill_gaps(values), header, parse_dates, on_bad_lines
+            )
+            for sheet_range, values in zip(google_sheet_ranges, values_list)
+        }
+    except Exception as exc:
+        exc_message = f"Error while reading the Sheet - {exc}"
+        raise GoogleSheetValueError(exc_message)
+    else:
+        if clean:
+            for sheet_df in sheets_df.values():
+                _clean_dataframe(sheet_df)
+        return sheets_df
 
 
 def get_sheet_dataframe(
@@ -17,6 +344,10 @@ def get_sheet_dataframe(
     parse_dates: bool,
     on_bad_lines: str,
     clean: bool,
+    sheet_range: Optional[str] = None,
+    columns: Optional[List[str]] = None,
+    dtype: Optional[Dict[str, str]] = None,
+    date_formats: Optional[Dict[str, str]] = None,
 ) -> DataFrame:
     """
     Read the content of a Google Sheet.
@@ -27,33 +358,475 @@ def get_sheet_dataframe(
         - parse_dates: Whether to parse dates as date obj or not
         - ob_bad_lines: What to do if bad rows are detected
         - clean: Whether to remove blank columns/rows if any
+        - sheet_range: The A1 notation of the range to read, if only
+            part of the sheet is needed
+        - columns: The header names of the columns to read, if only
+            some of them are needed
+        - dtype: The types of the columns, by header name, not to infer
+        - date_formats: The formats of the date columns, by header name,
+            converted without guessing the format of each value
 
     Raises:
+        - GoogleSheetsConfigurationException: If both sheet_range
+            and columns are provided
         - GoogleSheetValueError: If an exception is thrown
             while reading the Google Sheet
 
     Return: The Google Sheet content as a pandas DataFrame
     """
+    if sheet_range and columns:
+        exc_message = "A range and a list of columns can't be read together."
+        raise GoogleSheetsConfigurationException(exc_message)
+
     try:
-        if isinstance(google_sheet, Worksheet):
+        if isinstance(google_sheet, Worksheet) and (sheet_range or columns):
+            if columns:
+                values, labels = get_worksheet_columns_values(
+                    google_sheet, columns, header
+                )
+            else:
+                values = get_worksheet_values(google_sheet, sheet_range)
+            if clean:
+                values = trim_blank_tail(values)
+            sheet_df = _parse_values(
+                values, header, parse_dates, on_bad_lines, dtype, date_formats
+            )
+            if columns:
+                sheet_df = sheet_df.reindex(columns=labels)
+        elif isinstance(google_sheet, Worksheet) and clean:
+            # Unlike get_as_dataframe, which pads the values to the whole grid,
+            # only the data extent sent by values:get is parsed
+            values = trim_blank_tail(get_worksheet_values(google_sheet, None))
+            sheet_df = _parse_values(
+                values, header, parse_dates, on_bad_lines, dtype, date_formats
+            )
+        elif isinstance(google_sheet, Worksheet):
             sheet_df = get_as_dataframe(
                 google_sheet,
                 header=header,
-                parse_dates=parse_dates,
                 on_bad_lines=on_bad_lines,
+                **_get_parse_options(parse_dates, dtype, date_formats),
             )
+            _apply_date_formats(sheet_df, date_formats)
         else:
-            sheet_df = read_csv(
-                google_sheet,
-                header=header,
-                parse_dates=parse_dates,
-                on_bad_lines=on_bad_lines,
+            if sheet_range:
+                google_sheet = f"{google_sheet}&range={quote(sheet_range)}"
+            with open_public_sheet(google_sheet) as stream:
+                sheet_df = read_csv(
+                    stream,
+                    header=header,
+                    on_bad_lines=on_bad_lines,
+                    usecols=columns,
+                    **_get_parse_options(parse_dates, dtype, date_formats),
+                )
+            _apply_date_formats(sheet_df, date_formats)
+    except Exception as exc:
+        exc_message = f"Error while reading the Sheet - {exc}"
+        raise GoogleSheetValueError(exc_message)
+    else:
+        if clean:
+            _clean_dataframe(sheet_df)
+        return sheet_df
+
+
+def get_new_rows_dataframe(
+    google_sheet: Worksheet,
+    header: Optional[int],
+    parse_dates: bool,
+    on_bad_lines: str,
+    clean: bool,
+    state_store: SheetStateStore,
+    include_previous_rows: bool = False,
+) -> DataFrame:
+    """
+    Read only the rows appended to a Worksheet since the previous read.
+    The last row read is kept in the state store, per Google Sheet and
+    sheet, and the header and the new rows are fetched with a single
+    values:batchGet call.
+
+    Args:
+        - google_sheet: The worksheet reference
+        - header: The row representing the header of the sheet
+        - parse_dates: Whether to parse dates as date obj or not
+        - ob_bad_lines: What to do if bad rows are detected
+        - clean: Whether to remove blank columns/rows if any
+        - state_store: The store keeping the last row read
+        - include_previous_rows: Whether to return the rows read by the
+            previous reads too, from a local snapshot, along with the new ones
+
+    Raises:
+        - GoogleSheetValueError: If an exception is thrown
+            while reading the Google Sheet
+
+    Return: The new rows, or all the rows, as a pandas DataFrame
+    """
+    state_key = make_state_key(
+        "incremental", google_sheet.spreadsheet.id, google_sheet.title, header
+    )
+    state = state_store.get_state(state_key) or {}
+    first_row = 1 if header is None else header + 2
+    start = state.get("last_row", first_row - 1) + 1
+    previous_df = None
+    if include_previous_rows:
+        # The snapshot may lag behind reads done without include_previous_rows
+        if state.get("snapshot_row") is not None:
+            previous_df = state_store.load_snapshot(state_key)
+        start = first_row if previous_df is None else state["snapshot_row"] + 1
+
+    try:
+        ranges = []
+        if header is not None:
+            ranges.append(
+                absolute_range_name(google_sheet.title, f"{header + 1}:{header + 1}")
+            )
+        if start <= google_sheet.row_count:
+            ranges.append(
+                absolute_range_name(
+                    google_sheet.title, f"{start}:{google_sheet.row_count}"
+                )
+            )
+        value_ranges = []
+        if ranges:
+            response = google_sheet.spreadsheet.values_batch_get(
+                ranges, params=VALUES_RENDER_PARAMS
+            )
+            value_ranges = [
+                value_range.get("values", []) for value_range in response["valueRanges"]
+            ]
+        header_values = []
+        if header is not None:
+            header_values = value_ranges.pop(0)
+            header_values = header_values[0] if header_values else []
+        rows = value_ranges[0] if value_ranges else []
+
+        if rows:
+            width = max(len(header_values), max(len(row) for row in rows))
+            values = fill_gaps(
+                ([header_values] if header is not None else []) + rows, cols=width
+            )
+            new_df = _parse_values(
+                values, 0 if header is not None else None, parse_dates, on_bad_lines
+            )
+            new_df.index += start - first_row
+        else:
+            new_df = DataFrame(columns=header_values or None)
+    except Exception as exc:
+        exc_message = f"Error while reading the Sheet - {exc}"
+        raise GoogleSheetValueError(exc_message)
+
+    state["last_row"] = start + len(rows) - 1
+    sheet_df = new_df
+    if include_previous_rows:
+        if previous_df is not None:
+            sheet_df = concat([previous_df, new_df]) if rows else previous_df
+        if rows or previous_df is None:
+            state_store.save_snapshot(state_key, sheet_df)
+        state["snapshot_row"] = state["last_row"]
+    state_store.set_state(state_key, state)
+
+    if clean:
+        _clean_dataframe(sheet_df)
+    return sheet_df
+
+
+def get_revision_cached_dataframe(
+    gspread_client: Client,
+    google_sheet_key: str,
+    cache_key_parts: Tuple,
+    read_dataframe: Callable[[], DataFrame],
+    state_store: SheetStateStore,
+) -> DataFrame:
+    """
+    Read a pandas DataFrame through a local cache, checked against the Drive
+    revision of the spreadsheet. If the spreadsheet didn't change since the
+    cached read, the snapshot is returned and only the Drive metadata is fetched.
+
+    Args:
+        - gspread_client: The authorized gspread client
+        - google_sheet_key: The key of the spreadsheet
+        - cache_key_parts: The parameters identifying the read,
+            e.g. the sheet name and the range
+        - read_dataframe: The function reading the DataFrame on a cache miss
+        - state_store: The store keeping the revisions and snapshots
+
+    Return: The cached or freshly read pandas DataFrame
+    """
+    try:
+        revision = get_spreadsheet_revision(gspread_client, google_sheet_key)
+    except APIError:
+        # Without access to the Drive metadata the cache can't be trusted
+        return read_dataframe()
+
+    state_key = make_state_key("revision", google_sheet_key, *cache_key_parts)
+    state = state_store.get_state(state_key)
+    if state is not None and state.get("revision") == revision:
+        sheet_df = state_store.load_snapshot(state_key)
+        if sheet_df is not None:
+            return sheet_df
+
+    sheet_df = read_dataframe()
+    state_store.save_snapshot(state_key, sheet_df)
+    state_store.set_state(state_key, {"revision": revision})
+    return sheet_df
+
+
+def _iter_worksheet_dataframes(
+    google_sheet: Worksheet,
+    header: Optional[int],
+    parse_dates: bool,
+    on_bad_lines: str,
+    chunk_size: int,
+) -> Iterator[DataFrame]:
+    """
+    Page through the rows of a Worksheet with sequential range requests,
+    parsing each window of rows into its own DataFrame. Google leaves out
+    the trailing empty rows of a range, so the paging stops at the first
+    window coming back shorter than requested.
+    """
+    header_values = []
+    first_row = 1
+    if header is not None:
+        first_row = header + 2
+        header_values = get_worksheet_values(google_sheet, f"{header + 1}:{header + 1}")
+        header_values = header_values[0] if header_values else []
+
+    for start in range(first_row, google_sheet.row_count + 1, chunk_size):
+        end = min(start + chunk_size - 1, google_sheet.row_count)
+        rows = google_sheet.spreadsheet.values_get(
+            absolute_range_name(google_sheet.title, f"{start}:{end}"),
+            params=VALUES_RENDER_PARAMS,
+        ).get("values", [])
+        if not rows:
+            break
+        width = max(len(header_values), max(len(row) for row in rows))
+        values = fill_gaps(
+            ([header_values] if header is not None else []) + rows, cols=width
+        )
+        chunk_df = _parse_values(
+            values, 0 if header is not None else None, parse_dates, on_bad_lines
+        )
+        chunk_df.index += start - first_row
+        yield chunk_df
+        # The windows past the data would only cost quota
+        if len(rows) < end - start + 1:
+            break
+
+
+def iter_sheet_dataframes(
+    google_sheet: Union[Worksheet, str],
+    header: int,
+    parse_dates: bool,
+    on_bad_lines: str,
+    clean: bool,
+    chunk_size: int,
+) -> Iterator[DataFrame]:
+    """
+    Read the content of a Google Sheet as a stream of DataFrames,
+    each one holding at most chunk_size rows, so that the whole
+    sheet never needs to fit in memory.
+
+    Args:
+        - google_sheet: The google sheet reference
+        - header: The row representing the header of the sheet
+        - parse_dates: Whether to parse dates as date obj or not
+        - ob_bad_lines: What to do if bad rows are detected
+        - clean: Whether to remove blank columns/rows if any,
+            chunk by chunk
+        - chunk_size: The maximum number of rows of each DataFrame
+
+    Raises:
+        - GoogleSheetsConfigurationException: If chunk_size is lower than 1
+        - GoogleSheetValueError: If an exception is thrown
+            while reading the Google Sheet
+
+    Return: An iterator over the Google Sheet content as pandas DataFrames
+    """
+    if not chunk_size or chunk_size < 1:
+        exc_message = "The chunk size must be at least 1."
+        raise GoogleSheetsConfigurationException(exc_message)
+
+    return _iter_clean_dataframes(
+        google_sheet, header, parse_dates, on_bad_lines, clean, chunk_size
+    )
+
+
+def _iter_clean_dataframes(
+    google_sheet: Union[Worksheet, str],
+    header: int,
+    parse_dates: bool,
+    on_bad_lines: str,
+    clean: bool,
+    chunk_size: int,
+) -> Iterator[DataFrame]:
+    """
+    Stream the chunks of a Google Sheet, cleaning them if needed
+    and wrapping the reading errors.
+    """
+    try:
+        with ExitStack() as stack:
+            if isinstance(google_sheet, Worksheet):
+                chunks = _iter_worksheet_dataframes(
+                    google_sheet, header, parse_dates, on_bad_lines, chunk_size
+                )
+            else:
+                # The response stays open while the chunks are parsed out of it
+                chunks = read_csv(
+                    stack.enter_context(open_public_sheet(google_sheet)),
+                    header=header,
+                    parse_dates=parse_dates,
+                    on_bad_lines=on_bad_lines,
+                    chunksize=chunk_size,
+                )
+            for chunk_df in chunks:
+                if clean:
+                    _clean_dataframe(chunk_df)
+                yield chunk_df
+    except Exception as exc:
+        exc_message = f"Error while reading the Sheet - {exc}"
+        raise GoogleSheetValueError(exc_message)
+
+
+async def aget_private_sheet_dataframe(
+    gspread_client: Client,
+    google_sheet_key: str,
+    google_sheet_name: str,
+    header: int,
+    parse_dates: bool,
+    on_bad_lines: str,
+    clean: bool,
+    sheet_range: Optional[str] = None,
+    columns: Optional[List[str]] = None,
+    dtype: Optional[Dict[str, str]] = None,
+    date_formats: Optional[Dict[str, str]] = None,
+) -> DataFrame:
+    """
+    Async version of get_sheet_dataframe for private Google Sheets.
+    The values are requested straight to the Sheets API, without
+    fetching the spreadsheet metadata first.
+
+    Args:
+        - gspread_client: The authorized gspread client
+        - google_sheet_key: The key of the Google Sheet
+        - google_sheet_name: The name of the sheet to read
+        - header: The row representing the header of the sheet
+        - parse_dates: Whether to parse dates as date obj or not
+        - ob_bad_lines: What to do if bad rows are detected
+        - clean: Whether to remove blank columns/rows if any
+        - sheet_range: The A1 notation of the range to read, if only
+            part of the sheet is needed
+        - columns: The header names of the columns to read, if only
+            some of them are needed
+        - dtype: The types of the columns, by header name, not to infer
+        - date_formats: The formats of the date columns, by header name,
+            converted without guessing the format of each value
+
+    Raises:
+        - GoogleSheetsConfigurationException: If both sheet_range
+            and columns are provided
+        - GoogleSheetValueError: If an exception is thrown
+            while reading the Google Sheet
+
+    Return: The Google Sheet content as a pandas DataFrame
+    """
+    if sheet_range and columns:
+        exc_message = "A range and a list of columns can't be read together."
+        raise GoogleSheetsConfigurationException(exc_message)
+
+    try:
+        if columns:
+            header_values = None
+            if header is not None:
+                (header_values,) = await abatch_get_values(
+                    gspread_client,
+                    google_sheet_key,
+                    [
+                        absolute_range_name(
+                            google_sheet_name, f"{header + 1}:{header + 1}"
+                        )
+                    ],
+                    params=VALUES_RENDER_PARAMS,
+                )
+                header_values = header_values[0] if header_values else []
+            spans, labels = _get_columns_spans(columns, header_values)
+            value_ranges = await abatch_get_values(
+                gspread_client,
+                google_sheet_key,
+                _get_columns_ranges(google_sheet_name, spans),
+                params=VALUES_RENDER_PARAMS,
             )
+            values = _merge_columns_values(value_ranges, spans)
+        else:
+            (values,) = await abatch_get_values(
+                gspread_client,
+                google_sheet_key,
+                [absolute_range_name(google_sheet_name, sheet_range)],
+                params=VALUES_RENDER_PARAMS,
+            )
+            values = fill_gaps(values)
+        sheet_df = _parse_values(
+            values, header, parse_dates, on_bad_lines, dtype, date_formats
+        )
+        if columns:
+            sheet_df = sheet_df.reindex(columns=labels)
+    except Exception as exc:
+        exc_message = f"Error while reading the Sheet - {exc}"
+        raise GoogleSheetValueError(exc_message)
+    else:
+        if clean:
+            _clean_dataframe(sheet_df)
+        return sheet_df
+
+
+async def aget_public_sheet_dataframe(
+    google_sheet: str,
+    header: int,
+    parse_dates: bool,
+    on_bad_lines: str,
+    clean: bool,
+    sheet_range: Optional[str] = None,
+    columns: Optional[List[str]] = None,
+    dtype: Optional[Dict[str, str]] = None,
+    date_formats: Optional[Dict[str, str]] = None,
+) -> DataFrame:
+    """
+    Async version of get_sheet_dataframe for public Google Sheets.
+
+    Args:
+        - google_sheet: The CSV export URL of the sheet
+        - header: The row representing the header of the sheet
+        - parse_dates: Whether to parse dates as date obj or not
+        - ob_bad_lines: What to do if bad rows are detected
+        - clean: Whether to remove blank columns/rows if any
+        - sheet_range: The A1 notation of the range to read, if only
+            part of the sheet is needed
+        - columns: The header names of the columns to read, if only
+            some of them are needed
+        - dtype: The types of the columns, by header name, not to infer
+        - date_formats: The formats of the date columns, by header name,
+            converted without guessing the format of each value
+
+    Raises:
+        - GoogleSheetValueError: If an exception is thrown
+            while reading the Google Sheet
+
+    Return: The Google Sheet content as a pandas DataFrame
+    """
+    if sheet_range:
+        google_sheet = f"{google_sheet}&range={quote(sheet_range)}"
+
+    try:
+        sheet_df = read_csv(
+            BytesIO(await aget_public_sheet_content(google_sheet)),
+            header=header,
+            on_bad_lines=on_bad_lines,
+            usecols=columns,
+            **_get_parse_options(parse_dates, dtype, date_formats),
+        )
+        _apply_date_formats(sheet_df, date_formats)
     except Exception as exc:
         exc_message = f"Error while reading the Sheet - {exc}"
         raise GoogleSheetValueError(exc_message)
     else:
         if clean:
-            sheet_df.dropna(inplace=True, axis=1, how="all")
-            sheet_df.dropna(inplace=True, axis=0, how="all")
+            _clean_dataframe(sheet_df)
         return sheet_df
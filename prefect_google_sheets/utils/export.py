@@ -0,0 +1,124 @@
+"""
+utils function focus on the whole spreadsheet exports
+"""
+
+import os
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+from pandas import DataFrame, read_excel
+
+from prefect_google_sheets.exceptions import GoogleSheetValueError
+from prefect_google_sheets.utils.dataframe import _clean_dataframe
+from prefect_google_sheets.utils.google import open_public_sheet
+from prefect_google_sheets.utils.state import get_default_state_directory
+
+# The pandas engine parsing each export format
+EXPORT_FORMAT_ENGINES = {"xlsx": "openpyxl", "ods": "odf"}
+
+
+def get_public_spreadsheet_export_url(google_sheet_key: str, export_format: str) -> str:
+    """
+    Get the URL exporting a whole public spreadsheet in a single file.
+
+    Args:
+        - google_sheet_key: The key of the spreadsheet
+        - export_format: The format of the export, one of EXPORT_FORMAT_ENGINES
+
+    Return: The export URL
+    """
+    return (
+        f"https://docs.google.com/spreadsheets/d/{google_sheet_key}"
+        f"/export?format={export_format}"
+    )
+
+
+def download_public_spreadsheet_export(
+    google_sheet_key: str,
+    export_format: str,
+    cache_directory: Optional[Union[str, Path]] = None,
+    max_age: Optional[float] = 0,
+) -> Path:
+    """
+    Download the export of a whole public spreadsheet to a local file,
+    unless the file downloaded by a previous call is recent enough.
+
+    Args:
+        - google_sheet_key: The key of the spreadsheet
+        - export_format: The format of the export, one of EXPORT_FORMAT_ENGINES
+        - cache_directory: The directory keeping the downloaded exports
+        - max_age: The seconds a downloaded export is reused for,
+            0 to always download it again
+
+    Return: The path of the local export
+    """
+    directory = Path(cache_directory or get_default_state_directory()) / "exports"
+    directory.mkdir(parents=True, exist_ok=True)
+    export_path = directory / f"{google_sheet_key}.{export_format}"
+    if (
+        max_age
+        and export_path.exists()
+        and time.time() - export_path.stat().st_mtime <= max_age
+    ):
+        return export_path
+
+    temporary_path = export_path.with_suffix(
+        f".{os.getpid()}.{threading.get_ident()}.tmp"
+    )
+    url = get_public_spreadsheet_export_url(google_sheet_key, export_format)
+    with open_public_sheet(url) as stream, open(temporary_path, "wb") as export_file:
+        shutil.copyfileobj(stream, export_file)
+    os.replace(temporary_path, export_path)
+    return export_path
+
+
+def get_public_sheets_dataframes(
+    google_sheet_key: str,
+    google_sheet_names: List[str],
+    header: Optional[int],
+    clean: bool,
+    export_format: str = "xlsx",
+    cache_directory: Optional[Union[str, Path]] = None,
+    max_age: Optional[float] = 0,
+) -> Dict[str, DataFrame]:
+    """
+    Read many sheets of a public Google Sheet out of a single download
+    of the whole spreadsheet, parsing only the wanted sheets.
+
+    Args:
+        - google_sheet_key: The key of the Google Sheet
+        - google_sheet_names: The names of the sheets to read
+        - header: The row representing the header of the sheets
+        - clean: Whether to remove blank columns/rows if any
+        - export_format: The format of the export, one of EXPORT_FORMAT_ENGINES
+        - cache_directory: The directory keeping the downloaded exports
+        - max_age: The seconds a downloaded export is reused for,
+            0 to always download it again
+
+    Raises:
+        - GoogleSheetValueError: If an exception is thrown
+            while reading the Google Sheet
+
+    Return: The content of each sheet as a pandas DataFrame, keyed by name
+    """
+    try:
+        export_path = download_public_spreadsheet_export(
+            google_sheet_key, export_format, cache_directory, max_age
+        )
+        sheets_dfs = read_excel(
+            export_path,
+            sheet_name=list(google_sheet_names),
+            header=header,
+            engine=EXPORT_FORMAT_ENGINES[export_format],
+        )
+    except Exception as exc:
+        exc_message = f"Error while reading the Sheet - {exc}"
+        raise GoogleSheetValueError(exc_message)
+
+    if clean:
+        for sheet_df in sheets_dfs.values():
+            _clean_dataframe(sheet_df)
+    return sheets_dfs
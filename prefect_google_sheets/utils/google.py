@@ -2,12 +2,42 @@
 utils function focus on Google stuff
 """
 
+import asyncio
+import hashlib
 import json
-from typing import Dict, Union
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import IO, Dict, Iterator, List, Optional, Union
+from weakref import WeakKeyDictionary
 
+import gspread
+import httpx
+import requests
+from google.auth.transport.requests import Request
 from google.oauth2 import service_account
+from gspread.exceptions import APIError
+from gspread.urls import DRIVE_FILES_API_V3_URL, SPREADSHEET_VALUES_BATCH_URL
+from requests.adapters import HTTPAdapter
 
-from prefect_google_sheets.exceptions import GoogleSheetServiceAccountError
+from prefect_google_sheets.exceptions import (
+    GoogleSheetsConfigurationException,
+    GoogleSheetServiceAccountError,
+)
+from prefect_google_sheets.utils.rate_limit import (
+    SQLiteTokenBucket,
+    TokenBucket,
+    get_rate_limiter,
+    register_rate_limiter,
+)
+from prefect_google_sheets.utils.retry import (
+    DEFAULT_RETRY_POLICY,
+    RetryPolicy,
+    is_idempotent_request,
+    record_retry,
+)
 
 GOOGLE_CREDENTIALS_SCOPES = [
     "https://www.googleapis.com/auth/drive",
@@ -15,12 +45,31 @@ GOOGLE_CREDENTIALS_SCOPES = [
     "https://spreadsheets.google.com/feeds",
 ]
 
+GSPREAD_CLIENT_CACHE_MAX_SIZE = 32
+GOOGLE_TOKEN_REFRESH_MARGIN = timedelta(minutes=5)
 
-def generate_google_credentials(
-    google_service_account: Union[Dict, str]
-) -> service_account.Credentials:
+_gspread_client_cache: "OrderedDict[str, gspread.Client]" = OrderedDict()
+_gspread_client_cache_lock = threading.Lock()
+
+GVIZ_QUERY_URL = "https://docs.google.com/spreadsheets/d/%s/gviz/tq"
+
+PUBLIC_SHEET_POOL_MAX_SIZE = 20
+
+_public_sheet_timeout = (10.0, 60.0)
+_public_http_session: Optional[requests.Session] = None
+_public_http_session_lock = threading.Lock()
+
+ASYNC_HTTP_CLIENT_LIMITS = httpx.Limits(
+    max_connections=100, max_keepalive_connections=20
+)
+ASYNC_HTTP_CLIENT_TIMEOUT = httpx.Timeout(60.0, connect=10.0)
+
+_async_http_clients: "WeakKeyDictionary" = WeakKeyDictionary()
+
+
+def _load_service_account_info(google_service_account: Union[Dict, str]) -> Dict:
     """
-    Generate the Google credentials based on Service Account information
+    Load the Service Account information as a dict
 
     Args:
         - google_service_account: The service account information
@@ -28,27 +77,583 @@ def generate_google_credentials(
     Raises:
         - GoogleSheetServiceAccountError: If the service account
             format is wrong
-        - GoogleSheetServiceAccountError: If the service account
-            information are broken or wrong
 
-    Return: The Google credentials
+    Return: The service account information as a dict
     """
     if isinstance(google_service_account, dict):
-        service_account_dict = google_service_account
+        return google_service_account
     elif isinstance(google_service_account, str):
-        service_account_dict = json.loads(google_service_account)
+        return json.loads(google_service_account)
     else:
         exc_message = (
             "Wrong type for the Google Service Account param. Valid ones: dict, str"
         )
         raise GoogleSheetServiceAccountError(exc_message)
 
+
+def generate_google_credentials(
+    google_service_account: Union[Dict, str],
+    scopes: Optional[List[str]] = None,
+) -> service_account.Credentials:
+    """
+    Generate the Google credentials based on Service Account information
+
+    Args:
+        - google_service_account: The service account information
+        - scopes: The OAuth scopes to request, defaults to
+            GOOGLE_CREDENTIALS_SCOPES
+
+    Raises:
+        - GoogleSheetServiceAccountError: If the service account
+            format is wrong
+        - GoogleSheetServiceAccountError: If the service account
+            information are broken or wrong
+
+    Return: The Google credentials
+    """
+    service_account_dict = _load_service_account_info(google_service_account)
+
     try:
         credentials = service_account.Credentials.from_service_account_info(
             service_account_dict
-        ).with_scopes(GOOGLE_CREDENTIALS_SCOPES)
+        ).with_scopes(scopes or GOOGLE_CREDENTIALS_SCOPES)
     except ValueError as exc:
         exc_message = f"An error occurred while retrieving Google credentials - {exc}"
         raise GoogleSheetServiceAccountError(exc_message)
     else:
         return credentials
+
+
+def get_service_account_fingerprint(
+    google_service_account: Union[Dict, str],
+    scopes: Optional[List[str]] = None,
+) -> str:
+    """
+    Compute a stable fingerprint of a Service Account and its scopes
+
+    Args:
+        - google_service_account: The service account information
+        - scopes: The OAuth scopes, defaults to GOOGLE_CREDENTIALS_SCOPES
+
+    Raises:
+        - GoogleSheetServiceAccountError: If the service account
+            format is wrong
+
+    Return: A hex digest identifying the service account and scopes
+    """
+    service_account_dict = _load_service_account_info(google_service_account)
+    fingerprint = hashlib.sha256()
+    fingerprint.update(json.dumps(service_account_dict, sort_keys=True).encode())
+    fingerprint.update("|".join(sorted(scopes or GOOGLE_CREDENTIALS_SCOPES)).encode())
+    return fingerprint.hexdigest()
+
+
+def get_rate_limit_key(google_service_account: Union[Dict, str]) -> str:
+    """
+    Get the key identifying who the Sheets API quota of a Service Account
+    belongs to: its client email if any, its fingerprint otherwise.
+
+    Args:
+        - google_service_account: The service account information
+
+    Raises:
+        - GoogleSheetServiceAccountError: If the service account
+            format is wrong
+
+    Return: The rate limit key of the service account
+    """
+    service_account_dict = _load_service_account_info(google_service_account)
+    return service_account_dict.get("client_email") or get_service_account_fingerprint(
+        service_account_dict
+    )
+
+
+def set_sheets_api_rate_limit(
+    google_service_account: Union[Dict, str],
+    requests_per_minute: Optional[float],
+    burst: Optional[int] = None,
+    state_path: Optional[str] = None,
+) -> None:
+    """
+    Limit the rate of the Sheets API requests made with a Service Account,
+    across every task of the process. The limit is a token bucket: up to
+    burst requests can be sent at once, then requests_per_minute.
+
+    Args:
+        - google_service_account: The service account information
+        - requests_per_minute: The sustained number of requests per minute,
+            None in order to remove the limit
+        - burst: The maximum number of requests sent at once,
+            defaults to one second worth of requests
+        - state_path: The path of a SQLite file holding the bucket, in order
+            to share the same budget across the processes of the host
+
+    Raises:
+        - GoogleSheetsConfigurationException: If the limit is not positive
+        - GoogleSheetServiceAccountError: If the service account
+            format is wrong
+    """
+    rate_limit_key = get_rate_limit_key(google_service_account)
+    if requests_per_minute is None:
+        register_rate_limiter(rate_limit_key, None)
+        return
+
+    if requests_per_minute <= 0 or (burst is not None and burst < 1):
+        exc_message = "The rate limit and its burst must be positive."
+        raise GoogleSheetsConfigurationException(exc_message)
+
+    rate = requests_per_minute / 60
+    capacity = burst or max(1.0, rate)
+    if state_path:
+        rate_limiter = SQLiteTokenBucket(rate, capacity, state_path, rate_limit_key)
+    else:
+        rate_limiter = TokenBucket(rate, capacity)
+    register_rate_limiter(rate_limit_key, rate_limiter)
+
+
+class RateLimitedClient(gspread.Client):
+    """
+    A gspread client waiting for the Sheets API rate limit
+    of its Service Account, if any, before each request, and
+    retrying the requests failed because of transient errors.
+
+    Attributes:
+        rate_limit_key (str): The rate limit key of the Service Account.
+        retry_policy (RetryPolicy): How transient errors are retried.
+    """
+
+    rate_limit_key: Optional[str] = None
+    retry_policy: RetryPolicy = DEFAULT_RETRY_POLICY
+
+    def request(self, method, endpoint, *args, **kwargs):
+        """
+        Send a request to the Google API once the rate limit allows it,
+        retrying it on 429, 5xx and connection errors. The values:append
+        requests, which would add their rows twice, are retried on 429 only.
+        """
+        idempotent = is_idempotent_request(method, endpoint)
+        started_at = time.monotonic()
+        attempt = 0
+        while True:
+            rate_limiter = get_rate_limiter(self.rate_limit_key)
+            if rate_limiter is not None:
+                rate_limiter.acquire()
+            try:
+                return super().request(method, endpoint, *args, **kwargs)
+            except APIError as exc:
+                status_code = exc.response.status_code
+                retry_after = exc.response.headers.get("Retry-After")
+                error = exc
+            except (requests.ConnectionError, requests.Timeout) as exc:
+                status_code, retry_after, error = None, None, exc
+
+            delay = self.retry_policy.get_delay(
+                attempt, status_code, retry_after, started_at, idempotent
+            )
+            if delay is None:
+                raise error
+            record_retry(status_code)
+            time.sleep(delay)
+            attempt += 1
+
+
+def _refresh_credentials_if_expiring(gspread_client: gspread.Client) -> None:
+    """
+    Refresh the client token only if it is about to expire.
+    Tokens never fetched are left to the lazy refresh of the session.
+
+    Args:
+        - gspread_client: The authorized gspread client
+    """
+    credentials = getattr(gspread_client, "auth", None)
+    expiry = getattr(credentials, "expiry", None)
+    if not isinstance(expiry, datetime):
+        return
+    if expiry - datetime.utcnow() <= GOOGLE_TOKEN_REFRESH_MARGIN:
+        credentials.refresh(Request())
+
+
+def get_gspread_client(
+    google_service_account: Union[Dict, str],
+    scopes: Optional[List[str]] = None,
+) -> gspread.Client:
+    """
+    Get an authorized gspread client, reusing the one cached for the same
+    Service Account and scopes if any. The cache is process-wide, bounded
+    to GSPREAD_CLIENT_CACHE_MAX_SIZE entries and evicts the least
+    recently used client first.
+
+    Args:
+        - google_service_account: The service account information
+        - scopes: The OAuth scopes to request, defaults to
+            GOOGLE_CREDENTIALS_SCOPES
+
+    Raises:
+        - GoogleSheetServiceAccountError: If the service account
+            format is wrong
+        - GoogleSheetServiceAccountError: If the service account
+            information are broken or wrong
+
+    Return: The authorized gspread client
+    """
+    cache_key = get_service_account_fingerprint(google_service_account, scopes)
+
+    with _gspread_client_cache_lock:
+        gspread_client = _gspread_client_cache.get(cache_key)
+        if gspread_client is not None:
+            _gspread_client_cache.move_to_end(cache_key)
+
+    if gspread_client is None:
+        google_credentials = generate_google_credentials(
+            google_service_account=google_service_account, scopes=scopes
+        )
+        gspread_client = gspread.authorize(
+            google_credentials, client_factory=RateLimitedClient
+        )
+        gspread_client.rate_limit_key = get_rate_limit_key(google_service_account)
+        with _gspread_client_cache_lock:
+            gspread_client = _gspread_client_cache.setdefault(cache_key, gspread_client)
+            _gspread_client_cache.move_to_end(cache_key)
+            while len(_gspread_client_cache) > GSPREAD_CLIENT_CACHE_MAX_SIZE:
+                _gspread_client_cache.popitem(last=False)
+    else:
+        _refresh_credentials_if_expiring(gspread_client)
+
+    return gspread_client
+
+
+async def aget_gspread_client(
+    google_service_account: Union[Dict, str],
+    scopes: Optional[List[str]] = None,
+) -> gspread.Client:
+    """
+    Async version of get_gspread_client, run in a worker thread
+    as authorizing a client or refreshing its token blocks.
+
+    Args:
+        - google_service_account: The service account information
+        - scopes: The OAuth scopes to request, defaults to
+            GOOGLE_CREDENTIALS_SCOPES
+
+    Raises:
+        - GoogleSheetServiceAccountError: If the service account
+            format is wrong
+        - GoogleSheetServiceAccountError: If the service account
+            information are broken or wrong
+
+    Return: The authorized gspread client
+    """
+    return await asyncio.get_running_loop().run_in_executor(
+        None, get_gspread_client, google_service_account, scopes
+    )
+
+
+def clear_gspread_client_cache() -> None:
+    """
+    Remove every cached gspread client.
+    """
+    with _gspread_client_cache_lock:
+        _gspread_client_cache.clear()
+
+
+def batch_get_values(
+    gspread_client: gspread.Client,
+    google_sheet_key: str,
+    ranges: List[str],
+    params: Optional[Dict] = None,
+) -> List[List[List]]:
+    """
+    Read many A1 ranges of a spreadsheet with a single values:batchGet call,
+    without fetching the spreadsheet metadata first.
+
+    Args:
+        - gspread_client: The authorized gspread client
+        - google_sheet_key: The key of the spreadsheet
+        - ranges: The A1 notation of the ranges to read
+        - params: Extra query parameters, e.g. the render options
+
+    Return: The values of each range, in the same order as ranges
+    """
+    response = gspread_client.request(
+        "get",
+        SPREADSHEET_VALUES_BATCH_URL % google_sheet_key,
+        params={**(params or {}), "ranges": ranges},
+    )
+    return [
+        value_range.get("values", [])
+        for value_range in response.json().get("valueRanges", [])
+    ]
+
+
+def set_public_sheet_timeouts(connect_timeout: float, read_timeout: float) -> None:
+    """
+    Set the timeouts of the downloads of public Google Sheets,
+    made by every task of the process.
+
+    Args:
+        - connect_timeout: The seconds to wait for the connection to Google
+        - read_timeout: The seconds to wait for each chunk of the response
+
+    Raises:
+        - GoogleSheetsConfigurationException: If a timeout is not positive
+    """
+    global _public_sheet_timeout
+
+    if connect_timeout <= 0 or read_timeout <= 0:
+        exc_message = "The public sheet timeouts must be positive."
+        raise GoogleSheetsConfigurationException(exc_message)
+    _public_sheet_timeout = (connect_timeout, read_timeout)
+
+
+def get_public_http_session() -> requests.Session:
+    """
+    Get the HTTP session downloading the public Google Sheets,
+    whose connections are pooled and reused by every task of the process.
+
+    Return: The shared requests session
+    """
+    global _public_http_session
+
+    with _public_http_session_lock:
+        if _public_http_session is None:
+            session = requests.Session()
+            session.mount(
+                "https://", HTTPAdapter(pool_maxsize=PUBLIC_SHEET_POOL_MAX_SIZE)
+            )
+            _public_http_session = session
+        return _public_http_session
+
+
+@contextmanager
+def open_public_sheet(
+    google_sheet_url: str, params: Optional[Dict] = None
+) -> Iterator[IO[bytes]]:
+    """
+    Open a public Google Sheet export as a stream, through the pooled session,
+    asking for a gzip response which is decompressed while being read.
+
+    Args:
+        - google_sheet_url: The export URL of the sheet
+        - params: Extra query parameters of the URL
+
+    Raises:
+        - requests.HTTPError: If Google returns an error
+
+    Return: The stream of the response body
+    """
+    response = get_public_http_session().get(
+        google_sheet_url,
+        params=params,
+        headers={"Accept-Encoding": "gzip"},
+        stream=True,
+        timeout=_public_sheet_timeout,
+    )
+    try:
+        response.raise_for_status()
+        response.raw.decode_content = True
+        yield response.raw
+    finally:
+        response.close()
+
+
+def get_spreadsheet_revision(
+    gspread_client: gspread.Client, google_sheet_key: str
+) -> str:
+    """
+    Get the current revision of a spreadsheet with a single Drive files.get
+    call, only asking for the version and modifiedTime fields.
+
+    Args:
+        - gspread_client: The authorized gspread client
+        - google_sheet_key: The key of the spreadsheet
+
+    Return: The Drive version of the spreadsheet, or its modifiedTime
+        if Drive does not send a version
+    """
+    response = gspread_client.request(
+        "get",
+        f"{DRIVE_FILES_API_V3_URL}/{google_sheet_key}",
+        params={"fields": "version,modifiedTime", "supportsAllDrives": "true"},
+    )
+    metadata = response.json()
+    return str(metadata.get("version") or metadata["modifiedTime"])
+
+
+def query_google_sheet(
+    google_sheet_key: str,
+    params: Dict,
+    gspread_client: Optional[gspread.Client] = None,
+) -> bytes:
+    """
+    Run a query on a spreadsheet through the Visualization API (gviz tq)
+    endpoint, letting Google filter and project the rows.
+
+    Args:
+        - google_sheet_key: The key of the spreadsheet
+        - params: The query parameters, e.g. tq, sheet and tqx
+        - gspread_client: The authorized gspread client,
+            None if the spreadsheet is public
+
+    Return: The body of the response
+    """
+    if gspread_client is None:
+        with open_public_sheet(GVIZ_QUERY_URL % google_sheet_key, params) as stream:
+            return stream.read()
+    return gspread_client.request(
+        "get", GVIZ_QUERY_URL % google_sheet_key, params=params
+    ).content
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """
+    Get the pooled async HTTP client of the running event loop,
+    creating it the first time it is needed.
+
+    Return: The async HTTP client
+    """
+    loop = asyncio.get_running_loop()
+    async_http_client = _async_http_clients.get(loop)
+    if async_http_client is None or async_http_client.is_closed:
+        async_http_client = httpx.AsyncClient(
+            limits=ASYNC_HTTP_CLIENT_LIMITS,
+            timeout=ASYNC_HTTP_CLIENT_TIMEOUT,
+            follow_redirects=True,
+        )
+        _async_http_clients[loop] = async_http_client
+    return async_http_client
+
+
+async def _aget_authorization_headers(gspread_client: gspread.Client) -> Dict:
+    """
+    Get the authorization headers of the gspread client credentials,
+    refreshing the token in a worker thread if it is not valid anymore.
+    """
+    credentials = gspread_client.auth
+    if not credentials.valid:
+        await asyncio.get_running_loop().run_in_executor(
+            None, credentials.refresh, Request()
+        )
+    headers = {}
+    credentials.apply(headers)
+    return headers
+
+
+async def _asend_sheets_api_request(
+    gspread_client: gspread.Client, method: str, url: str, **kwargs
+) -> httpx.Response:
+    """
+    Send a Sheets API request through the pooled async HTTP client,
+    with the same rate limit and retry policy of the gspread client.
+    """
+    retry_policy = getattr(gspread_client, "retry_policy", DEFAULT_RETRY_POLICY)
+    started_at = time.monotonic()
+    attempt = 0
+    while True:
+        rate_limiter = get_rate_limiter(getattr(gspread_client, "rate_limit_key", None))
+        if rate_limiter is not None:
+            await rate_limiter.aacquire()
+        try:
+            response = await get_async_http_client().request(
+                method,
+                url,
+                headers=await _aget_authorization_headers(gspread_client),
+                **kwargs,
+            )
+            response.raise_for_status()
+            return response
+        except httpx.HTTPStatusError as exc:
+            status_code = exc.response.status_code
+            retry_after = exc.response.headers.get("Retry-After")
+            error = exc
+        except httpx.TransportError as exc:
+            status_code, retry_after, error = None, None, exc
+
+        delay = retry_policy.get_delay(attempt, status_code, retry_after, started_at)
+        if delay is None:
+            raise error
+        record_retry(status_code)
+        await asyncio.sleep(delay)
+        attempt += 1
+
+
+async def abatch_get_values(
+    gspread_client: gspread.Client,
+    google_sheet_key: str,
+    ranges: List[str],
+    params: Optional[Dict] = None,
+) -> List[List[List]]:
+    """
+    Async version of batch_get_values, sent through the pooled
+    async HTTP client of the running event loop.
+
+    Args:
+        - gspread_client: The authorized gspread client
+        - google_sheet_key: The key of the spreadsheet
+        - ranges: The A1 notation of the ranges to read
+        - params: Extra query parameters, e.g. the render options
+
+    Raises:
+        - httpx.HTTPStatusError: If the Sheets API returns an error
+
+    Return: The values of each range, in the same order as ranges
+    """
+    response = await _asend_sheets_api_request(
+        gspread_client,
+        "GET",
+        SPREADSHEET_VALUES_BATCH_URL % google_sheet_key,
+        params={**(params or {}), "ranges": ranges},
+    )
+    return [
+        value_range.get("values", [])
+        for value_range in response.json().get("valueRanges", [])
+    ]
+
+
+async def aget_public_sheet_content(google_sheet_url: str) -> bytes:
+    """
+    Download a public Google Sheet export through the pooled
+    async HTTP client of the running event loop.
+
+    Args:
+        - google_sheet_url: The export URL of the sheet
+
+    Raises:
+        - httpx.HTTPStatusError: If Google returns an error
+
+    Return: The body of the export
+    """
+    response = await get_async_http_client().get(google_sheet_url)
+    response.raise_for_status()
+    return response.content
+
+
+async def aquery_google_sheet(
+    google_sheet_key: str,
+    params: Dict,
+    gspread_client: Optional[gspread.Client] = None,
+) -> bytes:
+    """
+    Async version of query_google_sheet, sent through the pooled
+    async HTTP client of the running event loop.
+
+    Args:
+        - google_sheet_key: The key of the spreadsheet
+        - params: The query parameters, e.g. tq, sheet and tqx
+        - gspread_client: The authorized gspread client,
+            None if the spreadsheet is public
+
+    Raises:
+        - httpx.HTTPStatusError: If Google returns an error
+
+    Return: The body of the response
+    """
+    if gspread_client is None:
+        response = await get_async_http_client().get(
+            GVIZ_QUERY_URL % google_sheet_key, params=params
+        )
+        response.raise_for_status()
+    else:
+        response = await _asend_sheets_api_request(
+            gspread_client, "GET", GVIZ_QUERY_URL % google_sheet_key, params=params
+        )
+    return response.content
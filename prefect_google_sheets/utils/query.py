@@ -0,0 +1,206 @@
+"""
+utils function focus on the Visualization API (gviz) queries
+"""
+
+import json
+import re
+from datetime import datetime, time
+from typing import Dict, List, Optional
+
+from gspread import Client
+from pandas import DataFrame, Series, to_datetime
+
+from prefect_google_sheets.exceptions import GoogleSheetValueError
+from prefect_google_sheets.utils.dataframe import _clean_dataframe
+from prefect_google_sheets.utils.google import aquery_google_sheet, query_google_sheet
+from prefect_google_sheets.utils.values import _get_column_names
+
+_GVIZ_DATE_PATTERN = re.compile(r"Date\(([\d,]+)\)")
+
+
+def get_query_params(
+    google_sheet_name: str,
+    query: str,
+    header: bool,
+    sheet_range: Optional[str] = None,
+) -> Dict:
+    """
+    Get the parameters of a Visualization API query on a sheet.
+
+    Args:
+        - google_sheet_name: The name of the sheet to query
+        - query: The query, in the Google Visualization API Query Language,
+            e.g. "select A, C where D > 100"
+        - header: Whether the first row is the header
+        - sheet_range: The A1 notation of the range to query, if only
+            part of the sheet is needed
+
+    Return: The query parameters of the gviz tq endpoint
+    """
+    params = {
+        "tqx": "out:json",
+        "sheet": google_sheet_name,
+        "headers": 1 if header else 0,
+        "tq": query,
+    }
+    if sheet_range:
+        params["range"] = sheet_range
+    return params
+
+
+def _parse_gviz_date(value: str) -> datetime:
+    """
+    Parse a gviz date, e.g. "Date(2022,0,31,10,30,0)", whose month is 0-based.
+    """
+    parts = [int(part) for part in _GVIZ_DATE_PATTERN.fullmatch(value)[1].split(",")]
+    parts[1] += 1
+    if len(parts) == 7:
+        parts[6] *= 1000
+    return datetime(*parts)
+
+
+def _parse_query_column(values: List, column_type: str) -> Series:
+    """
+    Build the Series of a gviz column, typed the way pandas would
+    have parsed the same values out of a CSV export.
+    """
+    if column_type == "number":
+        column = Series(values, dtype="float64")
+        if not column.hasnans and (column % 1 == 0).all():
+            column = column.astype("int64")
+        return column
+    if column_type in ("date", "datetime"):
+        return to_datetime(
+            Series([None if v is None else _parse_gviz_date(v) for v in values])
+        )
+    if column_type == "timeofday":
+        return Series(
+            [None if v is None else time(v[0], v[1], v[2], v[3] * 1000) for v in values]
+        )
+    return Series(values, dtype="object")
+
+
+def parse_query_response(content: bytes, header: bool) -> DataFrame:
+    """
+    Parse the JSON response of a gviz tq query into a pandas DataFrame.
+
+    Args:
+        - content: The body of the response
+        - header: Whether the columns are named after their labels
+
+    Raises:
+        - ValueError: If Google returns an error, e.g. an invalid query
+
+    Return: The rows returned by the query
+    """
+    text = content.decode("utf-8")
+    response = json.loads(text[text.index("(") + 1 : text.rindex(")")])
+    if response["status"] == "error":
+        errors = [
+            error.get("detailed_message") or error.get("message")
+            for error in response.get("errors", [])
+        ]
+        raise ValueError(f"The query failed: {'; '.join(errors)}")
+
+    table = response["table"]
+    rows = [
+        [cell.get("v") if cell else None for cell in row["c"]]
+        for row in table.get("rows", [])
+    ]
+    if header:
+        names = _get_column_names([column["label"] for column in table["cols"]])
+    else:
+        names = list(range(len(table["cols"])))
+    return DataFrame(
+        {
+            name: _parse_query_column([row[position] for row in rows], column["type"])
+            for position, (name, column) in enumerate(zip(names, table["cols"]))
+        }
+    )
+
+
+def get_query_dataframe(
+    gspread_client: Optional[Client],
+    google_sheet_key: str,
+    google_sheet_name: str,
+    query: str,
+    header: Optional[int],
+    clean: bool,
+    sheet_range: Optional[str] = None,
+) -> DataFrame:
+    """
+    Read the rows of a sheet matching a query, filtered and projected
+    by Google through the Visualization API.
+
+    Args:
+        - gspread_client: The authorized gspread client,
+            None if the Google Sheet is public
+        - google_sheet_key: The key of the Google Sheet
+        - google_sheet_name: The name of the sheet to query
+        - query: The query, e.g. "select A, C where D > 100"
+        - header: The row representing the header of the sheet
+        - clean: Whether to remove blank columns/rows if any
+        - sheet_range: The A1 notation of the range to query, if only
+            part of the sheet is needed
+
+    Raises:
+        - GoogleSheetValueError: If an exception is thrown
+            while querying the Google Sheet
+
+    Return: The rows matching the query as a pandas DataFrame
+    """
+    params = get_query_params(google_sheet_name, query, header is not None, sheet_range)
+    try:
+        sheet_df = parse_query_response(
+            query_google_sheet(google_sheet_key, params, gspread_client),
+            header is not None,
+        )
+    except Exception as exc:
+        exc_message = f"Error while reading the Sheet - {exc}"
+        raise GoogleSheetValueError(exc_message)
+    if clean:
+        _clean_dataframe(sheet_df)
+    return sheet_df
+
+
+async def aget_query_dataframe(
+    gspread_client: Optional[Client],
+    google_sheet_key: str,
+    google_sheet_name: str,
+    query: str,
+    header: Optional[int],
+    clean: bool,
+    sheet_range: Optional[str] = None,
+) -> DataFrame:
+    """
+    Async version of get_query_dataframe.
+
+    Args:
+        - gspread_client: The authorized gspread client,
+            None if the Google Sheet is public
+        - google_sheet_key: The key of the Google Sheet
+        - google_sheet_name: The name of the sheet to query
+        - query: The query, e.g. "select A, C where D > 100"
+        - header: The row representing the header of the sheet
+        - clean: Whether to remove blank columns/rows if any
+        - sheet_range: The A1 notation of the range to query, if only
+            part of the sheet is needed
+
+    Raises:
+        - GoogleSheetValueError: If an exception is thrown
+            while querying the Google Sheet
+
+    Return: The rows matching the query as a pandas DataFrame
+    """
+    params = get_query_params(google_sheet_name, query, header is not None, sheet_range)
+    try:
+        sheet_df = parse_query_response(
+            await aquery_google_sheet(google_sheet_key, params, gspread_client),
+            header is not None,
+        )
+    except Exception as exc:
+        exc_message = f"Error while reading the Sheet - {exc}"
+        raise GoogleSheetValueError(exc_message)
+    if clean:
+        _clean_dataframe(sheet_df)
+    return sheet_df
@@ -0,0 +1,190 @@
+"""
+utils function focus on the Google Sheets API quota
+"""
+
+import asyncio
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+
+
+class TokenBucket:
+    """
+    A thread-safe token bucket, refilled at a constant rate up to its capacity.
+    Callers reserve a token and wait for the returned delay, so that
+    concurrent callers are served in order instead of polling.
+
+    Attributes:
+        rate (float): The number of tokens added per second.
+        capacity (float): The maximum number of tokens, i.e. the burst size.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        if rate <= 0 or capacity < 1:
+            raise ValueError("The rate must be positive and the capacity at least 1.")
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, tokens: float, updated_at: float, now: float) -> float:
+        """
+        Get the tokens available at now, given the ones available at updated_at.
+        """
+        return min(self.capacity, tokens + (now - updated_at) * self.rate)
+
+    def reserve(self, tokens: float = 1) -> float:
+        """
+        Take tokens from the bucket, even if not yet available.
+
+        Args:
+            - tokens: The number of tokens to take
+
+        Return: The number of seconds to wait before using the tokens
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = self._refill(self._tokens, self._updated_at, now) - tokens
+            self._updated_at = now
+            return max(0.0, -self._tokens / self.rate)
+
+    def acquire(self, tokens: float = 1) -> None:
+        """
+        Take tokens from the bucket, sleeping until they are available.
+
+        Args:
+            - tokens: The number of tokens to take
+        """
+        delay = self.reserve(tokens)
+        if delay:
+            time.sleep(delay)
+
+    async def aacquire(self, tokens: float = 1) -> None:
+        """
+        Async version of acquire, waiting without blocking the event loop.
+
+        Args:
+            - tokens: The number of tokens to take
+        """
+        delay = self.reserve(tokens)
+        if delay:
+            await asyncio.sleep(delay)
+
+
+class SQLiteTokenBucket(TokenBucket):
+    """
+    A token bucket whose state lives in a SQLite file, so that many
+    processes on the same host share one budget. Each reservation
+    runs in an immediate transaction, which locks the file.
+
+    Attributes:
+        rate (float): The number of tokens added per second.
+        capacity (float): The maximum number of tokens, i.e. the burst size.
+        path (str): The path of the SQLite file.
+        key (str): The name of the bucket inside the SQLite file.
+    """
+
+    def __init__(self, rate: float, capacity: float, path: str, key: str):
+        super().__init__(rate, capacity)
+        self.path = path
+        self.key = key
+        with self._connect() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS token_buckets "
+                "(key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated_at REAL NOT NULL)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Open a connection to the SQLite file, handling transactions manually.
+        """
+        return sqlite3.connect(self.path, timeout=60, isolation_level=None)
+
+    def reserve(self, tokens: float = 1) -> float:
+        """
+        Take tokens from the bucket shared through the SQLite file,
+        even if not yet available.
+
+        Args:
+            - tokens: The number of tokens to take
+
+        Return: The number of seconds to wait before using the tokens
+        """
+        with self._lock:
+            connection = self._connect()
+            try:
+                connection.execute("BEGIN IMMEDIATE")
+                now = time.time()
+                row = connection.execute(
+                    "SELECT tokens, updated_at FROM token_buckets WHERE key = ?",
+                    (self.key,),
+                ).fetchone()
+                available = self.capacity if row is None else self._refill(*row, now)
+                connection.execute(
+                    "INSERT OR REPLACE INTO token_buckets VALUES (?, ?, ?)",
+                    (self.key, available - tokens, now),
+                )
+                connection.execute("COMMIT")
+            finally:
+                connection.close()
+        return max(0.0, (tokens - available) / self.rate)
+
+    async def aacquire(self, tokens: float = 1) -> None:
+        """
+        Async version of acquire, reserving the tokens in a worker thread,
+        as the SQLite transaction blocks, and waiting without blocking
+        the event loop.
+
+        Args:
+            - tokens: The number of tokens to take
+        """
+        delay = await asyncio.get_running_loop().run_in_executor(
+            None, self.reserve, tokens
+        )
+        if delay:
+            await asyncio.sleep(delay)
+
+
+_rate_limiters: Dict[str, TokenBucket] = {}
+_rate_limiters_lock = threading.Lock()
+
+
+def register_rate_limiter(key: str, rate_limiter: Optional[TokenBucket]) -> None:
+    """
+    Register the rate limiter shared by every request made with a key,
+    or remove it if rate_limiter is None.
+
+    Args:
+        - key: The key identifying who the quota belongs to
+        - rate_limiter: The token bucket to use for the key
+    """
+    with _rate_limiters_lock:
+        if rate_limiter is None:
+            _rate_limiters.pop(key, None)
+        else:
+            _rate_limiters[key] = rate_limiter
+
+
+def get_rate_limiter(key: Optional[str]) -> Optional[TokenBucket]:
+    """
+    Get the rate limiter registered for a key, if any.
+
+    Args:
+        - key: The key identifying who the quota belongs to
+
+    Return: The token bucket of the key, None if no limit is set
+    """
+    if key is None:
+        return None
+    with _rate_limiters_lock:
+        return _rate_limiters.get(key)
+
+
+def clear_rate_limiters() -> None:
+    """
+    Remove every registered rate limiter.
+    """
+    with _rate_limiters_lock:
+        _rate_limiters.clear()
@@ -0,0 +1,157 @@
+"""
+utils function focus on retrying transient Google API errors
+"""
+
+import random
+import threading
+import time
+from collections import Counter
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+RETRYABLE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+
+# The only status code leaving a request surely not applied by Google,
+# so that a non idempotent request can be sent again
+NON_IDEMPOTENT_RETRYABLE_STATUS_CODES = frozenset({429})
+
+_retry_counts: Counter = Counter()
+_retry_counts_lock = threading.Lock()
+
+
+def parse_retry_after(retry_after: Optional[str]) -> Optional[float]:
+    """
+    Parse the value of a Retry-After header.
+
+    Args:
+        - retry_after: The header value, either seconds or an HTTP date
+
+    Return: The number of seconds to wait, None if missing or not valid
+    """
+    if not retry_after:
+        return None
+    try:
+        return max(0.0, float(retry_after))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def is_idempotent_request(method: str, url: str) -> bool:
+    """
+    Whether sending a request twice has the same effect as sending it once.
+    A values:append request adds its rows again, e.g. when retried after a
+    dropped connection or a 5xx error once Google already applied it.
+
+    Args:
+        - method: The HTTP method of the request
+        - url: The URL of the request
+
+    Return: False for the values:append requests, True otherwise
+    """
+    return not (method.lower() == "post" and urlparse(url).path.endswith(":append"))
+
+
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter, honouring Retry-After,
+    bounded by a number of retries and a total time budget.
+
+    Attributes:
+        max_retries (int): The maximum number of retries of a request.
+        base_delay (float): The upper bound in seconds of the first backoff.
+        max_delay (float): The upper bound in seconds of any backoff.
+        total_timeout (float): The seconds after which a request
+            is not retried anymore, counted from its first attempt.
+        status_codes (frozenset): The HTTP status codes worth a retry.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 6,
+        base_delay: float = 1.0,
+        max_delay: float = 64.0,
+        total_timeout: float = 300.0,
+        status_codes: frozenset = RETRYABLE_STATUS_CODES,
+    ):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.total_timeout = total_timeout
+        self.status_codes = status_codes
+
+    def get_delay(
+        self,
+        attempt: int,
+        status_code: Optional[int],
+        retry_after: Optional[str],
+        started_at: float,
+        idempotent: bool = True,
+    ) -> Optional[float]:
+        """
+        Get how long to wait before retrying a failed request.
+
+        Args:
+            - attempt: The number of retries already done
+            - status_code: The HTTP status code of the response,
+                None if the request failed before getting one
+            - retry_after: The Retry-After header of the response, if any
+            - started_at: The time.monotonic() of the first attempt
+            - idempotent: Whether the request can be applied twice safely,
+                otherwise it is retried on 429 only
+
+        Return: The number of seconds to wait, None if the request
+            must not be retried
+        """
+        if attempt >= self.max_retries:
+            return None
+        if status_code is not None and status_code not in self.status_codes:
+            return None
+        if not idempotent and status_code not in NON_IDEMPOTENT_RETRYABLE_STATUS_CODES:
+            return None
+
+        delay = random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+        retry_after_delay = parse_retry_after(retry_after)
+        if retry_after_delay is not None:
+            delay = max(delay, retry_after_delay)
+
+        if time.monotonic() - started_at + delay > self.total_timeout:
+            return None
+        return delay
+
+
+DEFAULT_RETRY_POLICY = RetryPolicy()
+
+
+def record_retry(status_code: Optional[int]) -> None:
+    """
+    Count a retry of a request.
+
+    Args:
+        - status_code: The HTTP status code that caused the retry,
+            None if the request failed before getting one
+    """
+    with _retry_counts_lock:
+        _retry_counts[status_code] += 1
+
+
+def get_retry_counts() -> Dict[Optional[int], int]:
+    """
+    Get the number of retries done in the process, by HTTP status code.
+
+    Return: The retry counts, None being the key of connection errors
+    """
+    with _retry_counts_lock:
+        return dict(_retry_counts)
+
+
+def reset_retry_counts() -> None:
+    """
+    Reset the number of retries done in the process.
+    """
+    with _retry_counts_lock:
+        _retry_counts.clear()
@@ -0,0 +1,126 @@
+"""
+utils function focus on the local state kept between reads
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from pandas import DataFrame, read_pickle
+from prefect.settings import PREFECT_HOME
+
+
+def get_default_state_directory() -> Path:
+    """
+    Get the directory holding the local state when none is provided.
+
+    Return: The google_sheets directory inside the Prefect home
+    """
+    return Path(PREFECT_HOME.value()) / "google_sheets"
+
+
+def make_state_key(*parts: Any) -> str:
+    """
+    Build the key of a state entry out of the parts identifying it,
+    e.g. the Google Sheet key and the Sheet name.
+
+    Return: A hex digest identifying the entry
+    """
+    return hashlib.sha256(json.dumps(parts, default=str).encode()).hexdigest()
+
+
+class SheetStateStore:
+    """
+    A local store of JSON states and DataFrame snapshots, shared by the
+    processes of the same host. States live in a SQLite file, snapshots
+    are pickled next to it, since sheets often hold mixed-type columns.
+
+    Attributes:
+        directory (Path): The directory holding the SQLite file and snapshots.
+    """
+
+    def __init__(self, directory: Optional[Union[str, Path]] = None):
+        self.directory = Path(directory or get_default_state_directory())
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as connection, connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS sheet_state "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, updated_at REAL NOT NULL)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Open a connection to the SQLite file of the store.
+        """
+        return sqlite3.connect(self.directory / "state.db", timeout=60)
+
+    def _snapshot_path(self, key: str) -> Path:
+        """
+        Get the path of the snapshot of an entry.
+        """
+        return self.directory / f"{key}.pkl"
+
+    def get_state(self, key: str) -> Optional[Dict]:
+        """
+        Get the state of an entry.
+
+        Args:
+            - key: The key of the entry
+
+        Return: The state of the entry, None if never set
+        """
+        with closing(self._connect()) as connection, connection:
+            row = connection.execute(
+                "SELECT value FROM sheet_state WHERE key = ?", (key,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def set_state(self, key: str, state: Dict) -> None:
+        """
+        Set the state of an entry.
+
+        Args:
+            - key: The key of the entry
+            - state: The JSON serializable state
+        """
+        with closing(self._connect()) as connection, connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO sheet_state VALUES (?, ?, ?)",
+                (key, json.dumps(state), time.time()),
+            )
+
+    def load_snapshot(self, key: str) -> Optional[DataFrame]:
+        """
+        Load the DataFrame snapshot of an entry.
+
+        Args:
+            - key: The key of the entry
+
+        Return: The snapshot, None if never saved
+        """
+        snapshot_path = self._snapshot_path(key)
+        if not snapshot_path.exists():
+            return None
+        return read_pickle(snapshot_path)
+
+    def save_snapshot(self, key: str, snapshot: DataFrame) -> None:
+        """
+        Save the DataFrame snapshot of an entry, replacing
+        the previous one atomically.
+
+        Args:
+            - key: The key of the entry
+            - snapshot: The DataFrame to save
+        """
+        snapshot_path = self._snapshot_path(key)
+        temporary_path = snapshot_path.with_suffix(
+            f".{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        snapshot.to_pickle(temporary_path)
+        os.replace(temporary_path, snapshot_path)
@@ -0,0 +1,331 @@
+"""
+utils function focus on raw sheet values
+"""
+
+import csv
+import io
+from collections import Counter
+from typing import Dict, List, Optional, Union
+from urllib.parse import quote
+
+import numpy as np
+from gspread.utils import column_letter_to_index, fill_gaps
+from gspread.worksheet import Worksheet
+from pandas import DataFrame, Series, to_numeric
+
+from prefect_google_sheets.exceptions import (
+    GoogleSheetsConfigurationException,
+    GoogleSheetValueError,
+)
+from prefect_google_sheets.utils.dataframe import (
+    UNFORMATTED_VALUES_RENDER_PARAMS,
+    _clean_dataframe,
+    _is_blank,
+    get_worksheet_columns_values,
+    get_worksheet_values,
+)
+from prefect_google_sheets.utils.google import open_public_sheet
+
+# The day 0 of the Google Sheets serial numbers
+SERIAL_NUMBER_EPOCH = np.datetime64("1899-12-30", "ns")
+NANOSECONDS_PER_DAY = 86_400_000_000_000
+
+
+def trim_values(values: List[List], clean: bool) -> List[List]:
+    """
+    Pad ragged rows to the same width and, if clean,
+    remove the blank rows and columns.
+
+    Args:
+        - values: The rows of values, as returned by the Sheets API
+        - clean: Whether to remove blank columns/rows if any
+
+    Return: The rectangular rows of values
+    """
+    if not clean:
+        return fill_gaps(values)
+
+    rows = [row for row in values if not all(_is_blank(value) for value in row)]
+    filled_columns = sorted(
+        {
+            index
+            for row in rows
+            for index, value in enumerate(row)
+            if not _is_blank(value)
+        }
+    )
+    return [
+        [row[index] if index < len(row) else "" for index in filled_columns]
+        for row in rows
+    ]
+
+
+def _project_columns(
+    values: List[List], columns: List[str], header: bool
+) -> List[List]:
+    """
+    Keep only the wanted columns of rectangular values, in the wanted order.
+    The columns are header names, or A1 letters if there is no header.
+    """
+    if header:
+        header_values = values[0] if values else []
+        missing_columns = [c for c in columns if c not in header_values]
+        if missing_columns:
+            raise ValueError(f"Columns not found in the header: {missing_columns}")
+        positions = [header_values.index(column) for column in columns]
+    else:
+        positions = [column_letter_to_index(column) - 1 for column in columns]
+    return [[row[position] for position in positions] for row in values]
+
+
+def _read_sheet_values(
+    google_sheet: Union[Worksheet, str],
+    header: bool,
+    sheet_range: Optional[str],
+    columns: Optional[List[str]],
+) -> List[List]:
+    """
+    Read the values of a Google Sheet, header row included,
+    as sent by Google.
+    """
+    if sheet_range and columns:
+        exc_message = "A range and a list of columns can't be read together."
+        raise GoogleSheetsConfigurationException(exc_message)
+
+    try:
+        if isinstance(google_sheet, Worksheet) and columns:
+            values, labels = get_worksheet_columns_values(
+                google_sheet, columns, 0 if header else None
+            )
+            if header:
+                labels = [values[0].index(label) for label in labels]
+            values = [[row[label] for label in labels] for row in values]
+        elif isinstance(google_sheet, Worksheet):
+            values = get_worksheet_values(google_sheet, sheet_range)
+        else:
+            if sheet_range:
+                google_sheet = f"{google_sheet}&range={quote(sheet_range)}"
+            with open_public_sheet(google_sheet) as stream:
+                values = list(csv.reader(io.TextIOWrapper(stream, encoding="utf-8")))
+            if columns:
+                values = _project_columns(fill_gaps(values), columns, header)
+    except Exception as exc:
+        exc_message = f"Error while reading the Sheet - {exc}"
+        raise GoogleSheetValueError(exc_message)
+    return values
+
+
+def get_sheet_values(
+    google_sheet: Union[Worksheet, str],
+    header: bool,
+    clean: bool,
+    sheet_range: Optional[str] = None,
+    columns: Optional[List[str]] = None,
+) -> List[List]:
+    """
+    Read the content of a Google Sheet as the values sent by Google,
+    without building a pandas DataFrame.
+
+    Args:
+        - google_sheet: The google sheet reference
+        - header: Whether the first row is the header, in order to skip it
+        - clean: Whether to remove blank columns/rows if any
+        - sheet_range: The A1 notation of the range to read, if only
+            part of the sheet is needed
+        - columns: The header names of the columns to read, if only
+            some of them are needed
+
+    Raises:
+        - GoogleSheetsConfigurationException: If both sheet_range
+            and columns are provided
+        - GoogleSheetValueError: If an exception is thrown
+            while reading the Google Sheet
+
+    Return: The Google Sheet content as a list of lists
+    """
+    values = _read_sheet_values(google_sheet, header, sheet_range, columns)
+    if header:
+        values = values[1:]
+    return trim_values(values, clean)
+
+
+def _get_column_names(header_values: List) -> List:
+    """
+    Name the columns the way pandas does: blank names become
+    "Unnamed: <position>" and duplicated names get a ".<count>" suffix.
+    """
+    names = []
+    seen = Counter()
+    for position, name in enumerate(header_values):
+        name = f"Unnamed: {position}" if _is_blank(name) else name
+        if seen[name]:
+            seen[name] += 1
+            name = f"{name}.{seen[name] - 1}"
+        else:
+            seen[name] += 1
+        names.append(name)
+    return names
+
+
+def values_to_columns(values: List[List], header: bool, clean: bool) -> Dict:
+    """
+    Transpose row-major values into a dict of columns in a single pass,
+    padding the rows Google sent without their trailing empty cells.
+
+    Args:
+        - values: The rows of values, as returned by the Sheets API
+        - header: Whether the first row is the header
+        - clean: Whether to remove blank columns/rows if any
+
+    Return: The columns, keyed by header name, or by position
+        if there is no header
+    """
+    header_values = values[0] if header and values else []
+    rows = values[1:] if header else values
+
+    columns = [[] for _ in header_values]
+    filled = [False] * len(columns)
+    row_count = 0
+    for row in rows:
+        if clean and all(_is_blank(value) for value in row):
+            continue
+        for position, value in enumerate(row):
+            if position == len(columns):
+                columns.append([""] * row_count)
+                filled.append(False)
+            columns[position].append(value)
+            filled[position] = filled[position] or not _is_blank(value)
+        for position in range(len(row), len(columns)):
+            columns[position].append("")
+        row_count += 1
+
+    if header:
+        # The columns wider than the header are unnamed, as in pandas
+        names = _get_column_names(
+            header_values + [""] * (len(columns) - len(header_values))
+        )
+    else:
+        names = list(range(len(columns)))
+    return {
+        name: column
+        for name, column, is_filled in zip(names, columns, filled)
+        if is_filled or not clean
+    }
+
+
+def get_sheet_columns(
+    google_sheet: Union[Worksheet, str],
+    header: bool,
+    clean: bool,
+    sheet_range: Optional[str] = None,
+    columns: Optional[List[str]] = None,
+) -> Dict:
+    """
+    Read the content of a Google Sheet as a dict of columns built
+    straight from the values sent by Google, without building
+    a pandas DataFrame.
+
+    Args:
+        - google_sheet: The google sheet reference
+        - header: Whether the first row is the header
+        - clean: Whether to remove blank columns/rows if any
+        - sheet_range: The A1 notation of the range to read, if only
+            part of the sheet is needed
+        - columns: The header names of the columns to read, if only
+            some of them are needed
+
+    Raises:
+        - GoogleSheetsConfigurationException: If both sheet_range
+            and columns are provided
+        - GoogleSheetValueError: If an exception is thrown
+            while reading the Google Sheet
+
+    Return: The Google Sheet content as a dict of lists
+    """
+    values = _read_sheet_values(google_sheet, header, sheet_range, columns)
+    return values_to_columns(values, header, clean)
+
+
+def serial_numbers_to_datetimes(serial_numbers: Series) -> Series:
+    """
+    Convert the serial numbers of a date column, i.e. the days since
+    1899-12-30 with the time as fraction, into datetimes with a single
+    vectorized operation. Cells that are not numbers become NaT.
+
+    Args:
+        - serial_numbers: The column of serial numbers
+
+    Return: The column of datetimes
+    """
+    days = to_numeric(serial_numbers, errors="coerce").to_numpy(dtype="float64")
+    is_date = ~np.isnan(days)
+    datetimes = np.full(len(days), np.datetime64("NaT"), dtype="datetime64[ns]")
+    datetimes[is_date] = SERIAL_NUMBER_EPOCH + np.round(
+        days[is_date] * NANOSECONDS_PER_DAY
+    ).astype("timedelta64[ns]")
+    return Series(datetimes, index=serial_numbers.index, name=serial_numbers.name)
+
+
+def get_unformatted_sheet_dataframe(
+    google_sheet: Worksheet,
+    header: Optional[int],
+    clean: bool,
+    sheet_range: Optional[str] = None,
+    columns: Optional[List[str]] = None,
+    serial_date_columns: Optional[List[str]] = None,
+) -> DataFrame:
+    """
+    Read the content of a Worksheet as unformatted values: numbers are
+    sent as JSON numbers and dates as serial numbers, so the DataFrame is
+    built without parsing any string.
+
+    Args:
+        - google_sheet: The worksheet reference
+        - header: The row representing the header of the sheet
+        - clean: Whether to remove blank columns/rows if any
+        - sheet_range: The A1 notation of the range to read, if only
+            part of the sheet is needed
+        - columns: The header names of the columns to read, if only
+            some of them are needed
+        - serial_date_columns: The columns holding dates,
+            converted from their serial numbers
+
+    Raises:
+        - GoogleSheetsConfigurationException: If both sheet_range
+            and columns are provided
+        - GoogleSheetValueError: If an exception is thrown
+            while reading the Google Sheet
+
+    Return: The Google Sheet content as a pandas DataFrame
+    """
+    if sheet_range and columns:
+        exc_message = "A range and a list of columns can't be read together."
+        raise GoogleSheetsConfigurationException(exc_message)
+
+    try:
+        if columns:
+            values, labels = get_worksheet_columns_values(
+                google_sheet, columns, header, UNFORMATTED_VALUES_RENDER_PARAMS
+            )
+        else:
+            values = get_worksheet_values(
+                google_sheet, sheet_range, UNFORMATTED_VALUES_RENDER_PARAMS
+            )
+        if header is None:
+            sheet_df = DataFrame(values)
+        else:
+            names = _get_column_names(values[header] if len(values) > header else [])
+            sheet_df = DataFrame(values[header + 1 :], columns=names or None)
+        # Blank cells are sent as empty strings, which would keep the columns object
+        sheet_df = sheet_df.replace("", np.nan).infer_objects()
+        if columns:
+            sheet_df = sheet_df.reindex(columns=labels)
+        for column in serial_date_columns or []:
+            sheet_df[column] = serial_numbers_to_datetimes(sheet_df[column])
+    except Exception as exc:
+        exc_message = f"Error while reading the Sheet - {exc}"
+        raise GoogleSheetValueError(exc_message)
+
+    if clean:
+        _clean_dataframe(sheet_df)
+    return sheet_df
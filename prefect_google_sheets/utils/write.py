@@ -0,0 +1,684 @@
+"""
+utils function focus on writing values to the sheets
+"""
+
+import json
+import threading
+import time as clock
+from datetime import date, datetime, time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+from gspread.utils import a1_to_rowcol, absolute_range_name, fill_gaps, rowcol_to_a1
+from gspread.worksheet import Worksheet
+from pandas import DataFrame, Series, isna
+from pandas.api.types import is_datetime64_any_dtype, is_object_dtype
+
+from prefect_google_sheets.exceptions import GoogleSheetValueError
+from prefect_google_sheets.utils.dataframe import (
+    _coalesce_column_indexes,
+    _get_columns_ranges,
+    _merge_columns_values,
+    get_worksheet_values,
+)
+from prefect_google_sheets.utils.state import SheetStateStore, make_state_key
+from prefect_google_sheets.utils.values import serial_numbers_to_datetimes
+
+# The bounds of a values:batchUpdate request, well below the payload
+# size and processing time the Sheets API accepts
+MAX_BATCH_UPDATE_CELLS = 50_000
+MAX_BATCH_UPDATE_BYTES = 2_000_000
+
+VALUE_INPUT_OPTIONS = ("RAW", "USER_ENTERED")
+
+# The format of the datetimes written to the sheets
+WRITTEN_DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Render the current cells comparably to the written values: formulas,
+# unformatted numbers, and dates as serial numbers, whatever their format
+WRITTEN_VALUES_RENDER_PARAMS = {
+    "valueRenderOption": "FORMULA",
+    "dateTimeRenderOption": "SERIAL_NUMBER",
+}
+
+# The default flush thresholds of a BufferedSheetAppender
+APPENDER_MAX_ROWS = 1000
+APPENDER_MAX_WAIT = 10.0
+
+# A rectangle of values, starting at a 1-based row and column
+ValuesBlock = Tuple[int, int, List[List]]
+
+
+def _to_json_value(value: Any) -> Any:
+    """
+    Convert a cell value of an object column into a JSON value.
+    """
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, (str, bool, int, float)):
+        return value
+    if isinstance(value, datetime):
+        return value.isoformat(sep=" ")
+    if isinstance(value, (date, time)):
+        return value.isoformat()
+    return str(value)
+
+
+def dataframe_to_values(data_frame: DataFrame, include_header: bool) -> List[List]:
+    """
+    Serialize a DataFrame into the rows of values sent to the Sheets API,
+    with blanks in place of the missing values and dates as strings.
+
+    Args:
+        - data_frame: The DataFrame to serialize
+        - include_header: Whether the first row holds the column names
+
+    Return: The rows of values
+    """
+    columns = {}
+    for name, column in data_frame.items():
+        if is_datetime64_any_dtype(column):
+            column = column.dt.strftime(WRITTEN_DATETIME_FORMAT)
+        column = column.astype(object).where(column.notna(), "")
+        if is_object_dtype(data_frame[name]):
+            column = column.map(_to_json_value)
+        columns[len(columns)] = column
+    values = DataFrame(columns, index=data_frame.index).values.tolist()
+    if include_header:
+        values.insert(0, [str(name) for name in data_frame.columns])
+    return values
+
+
+def _get_datetime_positions(data_frame: DataFrame) -> List[int]:
+    """
+    Get the positions of the datetime columns of a DataFrame.
+    """
+    return [
+        position
+        for position, (_, column) in enumerate(data_frame.items())
+        if is_datetime64_any_dtype(column)
+    ]
+
+
+def serial_numbers_to_written_datetimes(rows: List[List], positions: List[int]) -> None:
+    """
+    Convert, in place, the serial numbers of some columns of the current
+    values into the strings dataframe_to_values writes for datetimes,
+    so that both sides compare equal, whatever the sheet date format.
+    The cells that are not numbers are kept as they are.
+
+    Args:
+        - rows: The rows of current values, each one covering the positions
+        - positions: The positions of the datetime columns
+    """
+    for position in positions:
+        column = Series([row[position] for row in rows], dtype=object)
+        datetimes = serial_numbers_to_datetimes(column).dt.round("s")
+        column = datetimes.dt.strftime(WRITTEN_DATETIME_FORMAT).where(
+            datetimes.notna(), column
+        )
+        for row, value in zip(rows, column):
+            row[position] = value
+
+
+def _get_value_range(google_sheet_name: str, block: ValuesBlock) -> Dict:
+    """
+    Get the value range of the values:batchUpdate body writing a block.
+    """
+    start_row, start_col, rows = block
+    end_cell = rowcol_to_a1(start_row + len(rows) - 1, start_col + len(rows[0]) - 1)
+    return {
+        "range": absolute_range_name(
+            google_sheet_name, f"{rowcol_to_a1(start_row, start_col)}:{end_cell}"
+        ),
+        "values": rows,
+    }
+
+
+def iter_batch_update_data(
+    google_sheet_name: str,
+    blocks: List[ValuesBlock],
+    max_cells: int = MAX_BATCH_UPDATE_CELLS,
+    max_bytes: int = MAX_BATCH_UPDATE_BYTES,
+) -> Iterator[List[Dict]]:
+    """
+    Split blocks of values into the data of consecutive values:batchUpdate
+    requests, each holding at most max_cells cells and about max_bytes
+    of JSON. The blocks too large for a single request are split by rows.
+
+    Args:
+        - google_sheet_name: The name of the sheet to write
+        - blocks: The rectangles of values, as (start row, start column, rows)
+        - max_cells: The maximum number of cells of a request
+        - max_bytes: The maximum size of the values of a request
+
+    Return: An iterator of the value ranges of each request
+    """
+    data, cells, size = [], 0, 0
+    for start_row, start_col, rows in blocks:
+        if not rows or not rows[0]:
+            continue
+        width = len(rows[0])
+        first = 0
+        for position, row in enumerate(rows):
+            row_size = len(json.dumps(row)) + 1
+            if cells and (cells + width > max_cells or size + row_size > max_bytes):
+                if position > first:
+                    data.append(
+                        _get_value_range(
+                            google_sheet_name,
+                            (start_row + first, start_col, rows[first:position]),
+                        )
+                    )
+                    first = position
+                yield data
+                data, cells, size = [], 0, 0
+            cells += width
+            size += row_size
+        data.append(
+            _get_value_range(
+                google_sheet_name, (start_row + first, start_col, rows[first:])
+            )
+        )
+    if data:
+        yield data
+
+
+def get_changed_blocks(
+    current_values: List[List], values: List[List], start_row: int, start_col: int
+) -> List[ValuesBlock]:
+    """
+    Compare the values to write with the current ones, cell by cell,
+    and coalesce the changed cells into rectangular blocks: the runs of
+    changed cells of each row, merged with the same runs of the rows below.
+
+    Args:
+        - current_values: The rows of values currently in the sheet
+        - values: The rows of values to write
+        - start_row: The 1-based row of the first value
+        - start_col: The 1-based column of the first value
+
+    Return: The rectangles of changed values, as (start row, start column, rows)
+    """
+    if not values or not values[0]:
+        return []
+    height, width = len(values), len(values[0])
+    current = fill_gaps(
+        [row[:width] for row in current_values[:height]], rows=height, cols=width
+    )
+    new_array = np.empty((height, width), dtype=object)
+    new_array[:] = values
+    current_array = np.empty((height, width), dtype=object)
+    current_array[:] = current
+    changed = np.pad(new_array != current_array, ((0, 0), (1, 1)))
+
+    edges = np.diff(changed.astype(np.int8), axis=1)
+    run_rows, run_starts = np.nonzero(edges == 1)
+    _, run_ends = np.nonzero(edges == -1)
+    rectangles, last_rectangle = [], {}
+    for row, start, end in zip(run_rows, run_starts, run_ends):
+        position = last_rectangle.get((start, end))
+        if position is not None and rectangles[position][2] == row - 1:
+            rectangles[position][2] = row
+        else:
+            last_rectangle[(start, end)] = len(rectangles)
+            rectangles.append([row, start, row, end])
+    return [
+        (
+            start_row + int(top),
+            start_col + int(left),
+            new_array[top : bottom + 1, left:right].tolist(),
+        )
+        for top, left, bottom, right in rectangles
+    ]
+
+
+def send_batch_update(
+    google_sheet: Worksheet,
+    blocks: List[ValuesBlock],
+    value_input_option: str,
+    max_cells: int = MAX_BATCH_UPDATE_CELLS,
+    max_bytes: int = MAX_BATCH_UPDATE_BYTES,
+) -> Dict[str, int]:
+    """
+    Write blocks of values to a Worksheet with as few values:batchUpdate
+    requests as the size bounds allow.
+
+    Args:
+        - google_sheet: The worksheet reference
+        - blocks: The rectangles of values, as (start row, start column, rows)
+        - value_input_option: How the values are interpreted,
+            one of VALUE_INPUT_OPTIONS
+        - max_cells: The maximum number of cells of a request
+        - max_bytes: The maximum size of the values of a request
+
+    Raises:
+        - GoogleSheetValueError: If an exception is thrown
+            while writing the Google Sheet
+
+    Return: The number of requests sent and of cells updated
+    """
+    result = {"requests": 0, "updated_cells": 0}
+    try:
+        for data in iter_batch_update_data(
+            google_sheet.title, blocks, max_cells, max_bytes
+        ):
+            response = google_sheet.spreadsheet.values_batch_update(
+                body={"valueInputOption": value_input_option, "data": data}
+            )
+            result["requests"] += 1
+            result["updated_cells"] += response.get("totalUpdatedCells", 0)
+    except Exception as exc:
+        exc_message = f"Error while writing the Sheet - {exc}"
+        raise GoogleSheetValueError(exc_message)
+    return result
+
+
+def write_dataframe(
+    google_sheet: Worksheet,
+    data_frame: DataFrame,
+    include_header: bool,
+    start_cell: str = "A1",
+    resize: bool = False,
+    value_input_option: str = "USER_ENTERED",
+    max_cells: int = MAX_BATCH_UPDATE_CELLS,
+    max_bytes: int = MAX_BATCH_UPDATE_BYTES,
+    only_changed_cells: bool = False,
+    state_store: Optional[SheetStateStore] = None,
+) -> Dict[str, int]:
+    """
+    Write a DataFrame to a Worksheet in size-bounded values:batchUpdate
+    requests, optionally resizing the Worksheet to fit it first.
+    If only_changed_cells, the values are compared with the current ones,
+    read from the sheet or from the copy kept by the previous write,
+    and only the changed cells are sent.
+
+    Args:
+        - google_sheet: The worksheet reference
+        - data_frame: The DataFrame to write
+        - include_header: Whether to write the column names as first row
+        - start_cell: The A1 notation of the top left cell to write
+        - resize: Whether to resize the Worksheet to end with the DataFrame
+        - value_input_option: How the values are interpreted,
+            one of VALUE_INPUT_OPTIONS
+        - max_cells: The maximum number of cells of a request
+        - max_bytes: The maximum size of the values of a request
+        - only_changed_cells: Whether to send the changed cells only
+        - state_store: The store keeping a copy of the written values,
+            None in order to read the current values from the sheet
+
+    Raises:
+        - GoogleSheetValueError: If an exception is thrown
+            while writing the Google Sheet
+
+    Return: The number of requests sent and of cells updated
+    """
+    values = dataframe_to_values(data_frame, include_header)
+    start_row, start_col = a1_to_rowcol(start_cell)
+    blocks = [(start_row, start_col, values)]
+    if state_store is not None:
+        state_key = make_state_key(
+            "written", google_sheet.spreadsheet.id, google_sheet.title, start_cell
+        )
+    if only_changed_cells and values and values[0]:
+        current_df = state_store.load_snapshot(state_key) if state_store else None
+        if current_df is not None:
+            current_values = current_df.values.tolist()
+        else:
+            end_cell = rowcol_to_a1(
+                start_row + len(values) - 1, start_col + len(values[0]) - 1
+            )
+            try:
+                current_values = fill_gaps(
+                    get_worksheet_values(
+                        google_sheet,
+                        f"{start_cell}:{end_cell}",
+                        WRITTEN_VALUES_RENDER_PARAMS,
+                    ),
+                    cols=len(values[0]),
+                )
+            except Exception as exc:
+                exc_message = f"Error while reading the Sheet - {exc}"
+                raise GoogleSheetValueError(exc_message)
+            serial_numbers_to_written_datetimes(
+                current_values[1 if include_header else 0 :],
+                _get_datetime_positions(data_frame),
+            )
+        blocks = get_changed_blocks(current_values, values, start_row, start_col)
+
+    if resize:
+        try:
+            google_sheet.resize(
+                rows=max(start_row + len(values) - 1, 1),
+                cols=max(start_col + len(data_frame.columns) - 1, 1),
+            )
+        except Exception as exc:
+            exc_message = f"Error while resizing the Sheet - {exc}"
+            raise GoogleSheetValueError(exc_message)
+    result = send_batch_update(
+        google_sheet, blocks, value_input_option, max_cells, max_bytes
+    )
+    if state_store is not None:
+        state_store.save_snapshot(state_key, DataFrame(values))
+    return result
+
+
+def append_rows(
+    google_sheet: Worksheet,
+    rows: List[List],
+    value_input_option: str,
+    max_cells: int = MAX_BATCH_UPDATE_CELLS,
+    max_bytes: int = MAX_BATCH_UPDATE_BYTES,
+    on_appended: Optional[Callable[[int], None]] = None,
+) -> Dict[str, int]:
+    """
+    Append rows after the table of a Worksheet with as few values:append
+    requests as the size bounds allow, inserting the rows needed.
+
+    Args:
+        - google_sheet: The worksheet reference
+        - rows: The rows of values to append
+        - value_input_option: How the values are interpreted,
+            one of VALUE_INPUT_OPTIONS
+        - max_cells: The maximum number of cells of a request
+        - max_bytes: The maximum size of the values of a request
+        - on_appended: Called with the number of rows of each request
+            as soon as it succeeds, the first rows being sent first
+
+    Raises:
+        - GoogleSheetValueError: If an exception is thrown
+            while writing the Google Sheet
+
+    Return: The number of requests sent and of rows appended
+    """
+    result = {"requests": 0, "appended_rows": 0}
+    params = {"valueInputOption": value_input_option, "insertDataOption": "INSERT_ROWS"}
+    try:
+        for data in iter_batch_update_data(
+            google_sheet.title, [(1, 1, fill_gaps(rows))], max_cells, max_bytes
+        ):
+            for value_range in data:
+                google_sheet.spreadsheet.values_append(
+                    absolute_range_name(google_sheet.title),
+                    params=params,
+                    body={"values": value_range["values"]},
+                )
+                result["requests"] += 1
+                result["appended_rows"] += len(value_range["values"])
+                if on_appended is not None:
+                    on_appended(len(value_range["values"]))
+    except Exception as exc:
+        exc_message = f"Error while writing the Sheet - {exc}"
+        raise GoogleSheetValueError(exc_message)
+    return result
+
+
+def _get_key_value(value: Any) -> str:
+    """
+    Normalize a key cell value, so that e.g. 7, 7.0 and "7" match.
+    """
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value)
+
+
+def _get_key_index(
+    google_sheet: Worksheet,
+    header_values: List,
+    key_columns: List[str],
+    datetime_key_columns: List[str],
+) -> Dict[Tuple[str, ...], int]:
+    """
+    Fetch only the key columns of a Worksheet, with a single
+    values:batchGet call, and index their rows by key. The datetime
+    keys are normalized the way dataframe_to_values writes them.
+    """
+    key_indexes = [header_values.index(column) + 1 for column in key_columns]
+    spans = _coalesce_column_indexes(key_indexes)
+    response = google_sheet.spreadsheet.values_batch_get(
+        _get_columns_ranges(google_sheet.title, spans),
+        params=WRITTEN_VALUES_RENDER_PARAMS,
+    )
+    key_rows = _merge_columns_values(
+        [value_range.get("values", []) for value_range in response["valueRanges"]],
+        spans,
+    )
+    fetched_indexes = [i for first, last in spans for i in range(first, last + 1)]
+    key_positions = [fetched_indexes.index(i) for i in key_indexes]
+    serial_numbers_to_written_datetimes(
+        key_rows[1:],
+        [
+            position
+            for column, position in zip(key_columns, key_positions)
+            if column in datetime_key_columns
+        ],
+    )
+
+    key_index = {}
+    for row_number, row in enumerate(key_rows[1:], start=2):
+        key = tuple(_get_key_value(row[position]) for position in key_positions)
+        if any(key):
+            key_index.setdefault(key, row_number)
+    return key_index
+
+
+def upsert_dataframe(
+    google_sheet: Worksheet,
+    data_frame: DataFrame,
+    key_columns: List[str],
+    value_input_option: str = "USER_ENTERED",
+    max_cells: int = MAX_BATCH_UPDATE_CELLS,
+    max_bytes: int = MAX_BATCH_UPDATE_BYTES,
+) -> Dict[str, int]:
+    """
+    Update in place the rows of a Worksheet matching the keys of a DataFrame,
+    and append the rows of the new keys. The existing keys are indexed out
+    of the key columns only, the updated rows are grouped into ranges of
+    contiguous rows and sent with size-bounded values:batchUpdate requests.
+    The first row of the Worksheet is the header, holding all the columns
+    of the DataFrame; the other columns are left untouched.
+
+    Args:
+        - google_sheet: The worksheet reference
+        - data_frame: The DataFrame to upsert
+        - key_columns: The names of the columns identifying a row
+        - value_input_option: How the values are interpreted,
+            one of VALUE_INPUT_OPTIONS
+        - max_cells: The maximum number of cells of a request
+        - max_bytes: The maximum size of the values of a request
+
+    Raises:
+        - GoogleSheetValueError: If an exception is thrown
+            while reading or writing the Google Sheet
+
+    Return: The number of requests sent, of rows updated and of rows appended
+    """
+    data_frame = data_frame.drop_duplicates(subset=key_columns, keep="last")
+    try:
+        header_values = get_worksheet_values(google_sheet, "1:1")
+        header_values = header_values[0] if header_values else []
+        missing_columns = [c for c in data_frame.columns if c not in header_values]
+        if missing_columns:
+            raise ValueError(f"Columns not found in the header: {missing_columns}")
+        key_index = _get_key_index(
+            google_sheet,
+            header_values,
+            key_columns,
+            [data_frame.columns[p] for p in _get_datetime_positions(data_frame)],
+        )
+    except Exception as exc:
+        exc_message = f"Error while reading the Sheet - {exc}"
+        raise GoogleSheetValueError(exc_message)
+
+    values = dataframe_to_values(data_frame, include_header=False)
+    columns = list(data_frame.columns)
+    df_key_positions = [columns.index(column) for column in key_columns]
+    sheet_indexes = [header_values.index(column) + 1 for column in columns]
+    positions_by_index = {index: p for p, index in enumerate(sheet_indexes)}
+
+    updated_rows, appended_rows = [], []
+    for row in values:
+        key = tuple(_get_key_value(row[p]) for p in df_key_positions)
+        if key in key_index:
+            updated_rows.append((key_index[key], row))
+        else:
+            appended_row = [""] * len(header_values)
+            for index, value in zip(sheet_indexes, row):
+                appended_row[index - 1] = value
+            appended_rows.append(appended_row)
+
+    # Contiguous sheet rows, times contiguous sheet columns, make a block
+    row_runs = []
+    for row_number, row in sorted(updated_rows, key=lambda item: item[0]):
+        if row_runs and row_runs[-1][0] + len(row_runs[-1][1]) == row_number:
+            row_runs[-1][1].append(row)
+        else:
+            row_runs.append((row_number, [row]))
+    blocks = []
+    for first, last in _coalesce_column_indexes(sheet_indexes):
+        span_positions = [positions_by_index[i] for i in range(first, last + 1)]
+        blocks.extend(
+            (start_row, first, [[row[p] for p in span_positions] for row in rows])
+            for start_row, rows in row_runs
+        )
+
+    update_result = send_batch_update(
+        google_sheet, blocks, value_input_option, max_cells, max_bytes
+    )
+    append_result = append_rows(
+        google_sheet, appended_rows, value_input_option, max_cells, max_bytes
+    )
+    return {
+        "requests": update_result["requests"] + append_result["requests"],
+        "updated_rows": len(updated_rows),
+        "appended_rows": append_result["appended_rows"],
+    }
+
+
+class BufferedSheetAppender:
+    """
+    A thread-safe buffer of rows appended to a Worksheet, flushed with
+    values:append requests once max_rows rows or max_bytes bytes are
+    buffered, or the oldest buffered row waited max_wait seconds.
+    The thresholds are checked on append, and the rows left are
+    flushed on exit when used as a context manager, unless the body of
+    the context raised: they are then kept buffered, not sent, and the
+    error raised as is.
+
+    Attributes:
+        google_sheet (Worksheet): The worksheet the rows are appended to.
+        requests (int): The number of values:append requests sent.
+        appended_rows (int): The number of rows appended.
+    """
+
+    def __init__(
+        self,
+        google_sheet: Worksheet,
+        value_input_option: str = "USER_ENTERED",
+        max_rows: int = APPENDER_MAX_ROWS,
+        max_bytes: int = MAX_BATCH_UPDATE_BYTES,
+        max_wait: float = APPENDER_MAX_WAIT,
+    ):
+        if max_rows < 1 or max_bytes < 1 or max_wait < 0:
+            raise ValueError(
+                "The rows and bytes thresholds must be at least 1, "
+                "and the wait threshold not negative."
+            )
+        self.google_sheet = google_sheet
+        self.value_input_option = value_input_option
+        self.max_rows = max_rows
+        self.max_bytes = max_bytes
+        self.max_wait = max_wait
+        self.requests = 0
+        self.appended_rows = 0
+        self._rows = []
+        self._buffered_bytes = 0
+        self._buffered_at = None
+        self._lock = threading.Lock()
+
+    @property
+    def rows_per_request(self) -> float:
+        """
+        The average number of rows appended by a request.
+        """
+        return self.appended_rows / self.requests if self.requests else 0.0
+
+    def append(self, row: Iterable) -> None:
+        """
+        Buffer a row, flushing the buffer if a threshold is reached.
+
+        Args:
+            - row: The values of the row
+        """
+        self.extend([row])
+
+    def extend(self, rows: Iterable[Iterable]) -> None:
+        """
+        Buffer many rows, flushing the buffer whenever a threshold is reached.
+
+        Args:
+            - rows: The rows of values
+        """
+        with self._lock:
+            for row in rows:
+                values = ["" if isna(value) else _to_json_value(value) for value in row]
+                if self._buffered_at is None:
+                    self._buffered_at = clock.monotonic()
+                self._rows.append(values)
+                self._buffered_bytes += len(json.dumps(values)) + 1
+                if (
+                    len(self._rows) >= self.max_rows
+                    or self._buffered_bytes >= self.max_bytes
+                    or clock.monotonic() - self._buffered_at >= self.max_wait
+                ):
+                    self._flush()
+
+    def append_data_frame(self, data_frame: DataFrame) -> None:
+        """
+        Buffer the rows of a DataFrame, without its header.
+
+        Args:
+            - data_frame: The DataFrame whose rows are appended
+        """
+        self.extend(dataframe_to_values(data_frame, include_header=False))
+
+    def _flush(self) -> None:
+        """
+        Send the buffered rows, holding the lock.
+        """
+        if not self._rows:
+            return
+
+        def _on_appended(row_count: int) -> None:
+            # Only the rows of the failed and following requests stay buffered
+            del self._rows[:row_count]
+            self.requests += 1
+            self.appended_rows += row_count
+
+        try:
+            append_rows(
+                self.google_sheet,
+                self._rows,
+                self.value_input_option,
+                on_appended=_on_appended,
+            )
+        finally:
+            self._buffered_bytes = sum(len(json.dumps(row)) + 1 for row in self._rows)
+            if not self._rows:
+                self._buffered_at = None
+
+    def flush(self) -> None:
+        """
+        Send the buffered rows, whatever the thresholds.
+        """
+        with self._lock:
+            self._flush()
+
+    def __enter__(self) -> "BufferedSheetAppender":
+        return self
+
+    def __exit__(self, exc_type, *exc_info) -> None:
+        # The rows of a failed body may be partial, and a failing flush
+        # would hide its error
+        if exc_type is None:
+            self.flush()
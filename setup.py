@@ -26,7 +26,7 @@ setup(
     packages=find_packages(exclude=("tests", "docs")),
     python_requires=">=3.7",
     install_requires=install_requires,
-    extras_require={"dev": dev_requires},
+    extras_require={"dev": dev_requires, "pyarrow": ["pyarrow>=8.0.0"]},
     entry_points={
         "prefect.collections": [
             "prefect_google_sheets = prefect_google_sheets",
@@ -20,3 +20,46 @@ def reset_object_registry():
 
     with PrefectObjectRegistry():
         yield
+
+
+@pytest.fixture(autouse=True)
+def reset_gspread_client_cache():
+    """
+    Ensures each test starts without cached gspread clients nor rate limits.
+    """
+    from prefect_google_sheets.utils.google import clear_gspread_client_cache
+    from prefect_google_sheets.utils.rate_limit import clear_rate_limiters
+
+    clear_gspread_client_cache()
+    clear_rate_limiters()
+    yield
+    clear_gspread_client_cache()
+    clear_rate_limiters()
+
+
+@pytest.fixture
+def mock_worksheet():
+    """
+    Builds mocked worksheets, named "bar" in the spreadsheet "foo",
+    whose values:get calls return the given values and values:batchUpdate
+    calls report the cells they were sent.
+    """
+    from unittest.mock import Mock
+
+    from gspread.worksheet import Worksheet
+
+    def _mock_worksheet(values=()):
+        worksheet = Mock(spec=Worksheet)
+        worksheet.title = "bar"
+        worksheet.spreadsheet = Mock()
+        worksheet.spreadsheet.id = "foo"
+        worksheet.spreadsheet.values_get.return_value = {"values": list(values)}
+        worksheet.spreadsheet.values_batch_update.side_effect = lambda body: {
+            "totalUpdatedCells": sum(
+                len(value_range["values"]) * len(value_range["values"][0])
+                for value_range in body["data"]
+            )
+        }
+        return worksheet
+
+    return _mock_worksheet
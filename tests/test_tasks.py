@@ -1,5 +1,6 @@
 from unittest.mock import Mock
 
+import httpx
 import pandas as pd
 import pytest
 from prefect import flow
@@ -9,9 +10,20 @@ from prefect_google_sheets.exceptions import (
     GoogleSheetServiceAccountError,
 )
 from prefect_google_sheets.tasks import (
+    GOOGLE_SHEET_REVISION_CACHE_OPTIONS,
+    append_rows_to_google_sheet,
+    aread_google_sheet_as_data_frame,
+    aread_google_sheet_as_dict_of_lists,
+    google_sheet_revision_cache_key,
+    iter_google_sheet_as_data_frames,
+    read_google_sheet_as_arrow_table,
     read_google_sheet_as_data_frame,
     read_google_sheet_as_dict_of_lists,
     read_google_sheet_as_list_of_lists,
+    read_google_sheets_batch,
+    read_google_sheets_concurrently,
+    upsert_data_frame_to_google_sheet,
+    write_data_frame_to_google_sheet,
 )
 
 # read_google_sheet_as_data_frame task tests
@@ -105,15 +117,10 @@ def test_read_google_sheet_as_data_frame_private_malformed_credentials(mocker):
 
 
 def test_read_google_sheet_as_data_frame_private(mocker):
-    mocker_google_credentials_call = mocker.patch(
-        "prefect_google_sheets.tasks.generate_google_credentials"
+    mocker_gspread_client_call = mocker.patch(
+        "prefect_google_sheets.tasks.get_gspread_client"
     )
-    mocker_google_credentials_call.return_value = ""
-
-    mocker_gspread_authorize_call = mocker.patch(
-        "prefect_google_sheets.tasks.gspread.authorize"
-    )
-    mocker_gspread_authorize_call.return_value = Mock()
+    mocker_gspread_client_call.return_value = Mock()
 
     mocker_sheet_call = mocker.patch("prefect_google_sheets.tasks.get_sheet_dataframe")
     mocker_sheet_call.return_value = "test_call"
@@ -224,15 +231,10 @@ def test_read_google_sheet_as_list_of_lists_private_malformed_credentials(mocker
 
 
 def test_read_google_sheet_as_list_of_lists_private(mocker):
-    mocker_google_credentials_call = mocker.patch(
-        "prefect_google_sheets.tasks.generate_google_credentials"
-    )
-    mocker_google_credentials_call.return_value = ""
-
-    mocker_gspread_authorize_call = mocker.patch(
-        "prefect_google_sheets.tasks.gspread.authorize"
+    mocker_gspread_client_call = mocker.patch(
+        "prefect_google_sheets.tasks.get_gspread_client"
     )
-    mocker_gspread_authorize_call.return_value = Mock()
+    mocker_gspread_client_call.return_value = Mock()
 
     mocker_sheet_call = mocker.patch("prefect_google_sheets.tasks.get_sheet_dataframe")
     mocker_sheet_call.return_value = pd.DataFrame(data=["foo", "bar"])
@@ -252,6 +254,33 @@ def test_read_google_sheet_as_list_of_lists_private(mocker):
     assert result == [["foo"], ["bar"]]
 
 
+def test_read_google_sheet_as_list_of_lists_raw(mocker):
+    mocker_gspread_client_call = mocker.patch(
+        "prefect_google_sheets.tasks.get_gspread_client"
+    )
+    mocker_gspread_client_call.return_value = Mock()
+
+    mocker_values_call = mocker.patch("prefect_google_sheets.tasks.get_sheet_values")
+    mocker_values_call.return_value = [["foo"], ["bar"]]
+    mocker_sheet_call = mocker.patch("prefect_google_sheets.tasks.get_sheet_dataframe")
+
+    @flow
+    def test_flow():
+        return read_google_sheet_as_list_of_lists(
+            is_public_sheet=False,
+            google_service_account={"correct": "credentials"},
+            google_sheet_key="foo",
+            google_sheet_name="bar",
+            raw=True,
+        )
+
+    result = test_flow()
+
+    assert mocker_sheet_call.called is False
+    assert mocker_values_call.call_args.kwargs["header"] is True
+    assert result == [["foo"], ["bar"]]
+
+
 # read_google_sheet_as_dict_of_lists task tests
 
 
@@ -345,15 +374,10 @@ def test_read_google_sheet_as_dict_of_lists_private_malformed_credentials(mocker
 
 
 def test_read_google_sheet_as_dict_of_lists_private(mocker):
-    mocker_google_credentials_call = mocker.patch(
-        "prefect_google_sheets.tasks.generate_google_credentials"
+    mocker_gspread_client_call = mocker.patch(
+        "prefect_google_sheets.tasks.get_gspread_client"
     )
-    mocker_google_credentials_call.return_value = ""
-
-    mocker_gspread_authorize_call = mocker.patch(
-        "prefect_google_sheets.tasks.gspread.authorize"
-    )
-    mocker_gspread_authorize_call.return_value = Mock()
+    mocker_gspread_client_call.return_value = Mock()
 
     mocker_sheet_call = mocker.patch("prefect_google_sheets.tasks.get_sheet_dataframe")
     mocker_sheet_call.return_value = pd.DataFrame(
@@ -373,3 +397,664 @@ def test_read_google_sheet_as_dict_of_lists_private(mocker):
 
     assert mocker_sheet_call.called is True
     assert result == {"col_1": ["foo"], "col_2": ["bar"]}
+
+
+def test_read_google_sheet_as_data_frame_range(mocker):
+    mocker_gspread_client_call = mocker.patch(
+        "prefect_google_sheets.tasks.get_gspread_client"
+    )
+    mocker_gspread_client_call.return_value = Mock()
+
+    mocker_sheet_call = mocker.patch("prefect_google_sheets.tasks.get_sheet_dataframe")
+    mocker_sheet_call.return_value = "test_call"
+
+    @flow
+    def test_flow():
+        return read_google_sheet_as_data_frame(
+            is_public_sheet=False,
+            google_service_account={"correct": "credentials"},
+            google_sheet_key="foo",
+            google_sheet_name="bar",
+            google_sheet_range="A1:F5000",
+        )
+
+    result = test_flow()
+
+    assert mocker_sheet_call.call_args.kwargs["sheet_range"] == "A1:F5000"
+    assert result == "test_call"
+
+
+def test_read_google_sheet_as_data_frame_cached(mocker, tmp_path):
+    gspread_client = Mock()
+    gspread_client.request.return_value.json.return_value = {"version": "42"}
+    mocker_gspread_client_call = mocker.patch(
+        "prefect_google_sheets.tasks.get_gspread_client"
+    )
+    mocker_gspread_client_call.return_value = gspread_client
+
+    mocker_sheet_call = mocker.patch("prefect_google_sheets.tasks.get_sheet_dataframe")
+    mocker_sheet_call.return_value = pd.DataFrame({"col_1": ["foo"]})
+
+    @flow
+    def test_flow():
+        return read_google_sheet_as_data_frame(
+            is_public_sheet=False,
+            google_service_account={"correct": "credentials"},
+            google_sheet_key="foo",
+            google_sheet_name="bar",
+            use_cache=True,
+            cache_directory=str(tmp_path),
+        )
+
+    first = test_flow()
+    second = test_flow()
+
+    assert mocker_sheet_call.call_count == 1
+    assert gspread_client.open_by_key.call_count == 1
+    assert second.equals(first)
+
+
+def test_read_google_sheet_as_data_frame_query(mocker):
+    mocker_gspread_client_call = mocker.patch(
+        "prefect_google_sheets.tasks.get_gspread_client"
+    )
+    mocker_gspread_client_call.return_value = Mock()
+
+    mocker_query_call = mocker.patch("prefect_google_sheets.tasks.get_query_dataframe")
+    mocker_query_call.return_value = "test_call"
+
+    @flow
+    def test_flow():
+        return read_google_sheet_as_data_frame(
+            is_public_sheet=False,
+            google_service_account={"correct": "credentials"},
+            google_sheet_key="foo",
+            google_sheet_name="bar",
+            query="select A, C where D > 100",
+        )
+
+    result = test_flow()
+
+    assert mocker_gspread_client_call.return_value.open_by_key.call_count == 0
+    assert mocker_query_call.call_args[0][1:] == (
+        "foo",
+        "bar",
+        "select A, C where D > 100",
+    )
+    assert result == "test_call"
+
+
+def test_read_google_sheet_as_list_of_lists_query_raw():
+    @flow
+    def test_flow():
+        return read_google_sheet_as_list_of_lists(
+            is_public_sheet=True,
+            google_sheet_key="foo",
+            google_sheet_name="bar",
+            query="select A",
+            raw=True,
+        )
+
+    exc_message = "A query can't be read as raw values."
+    with pytest.raises(GoogleSheetsConfigurationException, match=exc_message):
+        test_flow()
+
+
+def test_read_google_sheet_as_dict_of_lists_schema_raw():
+    @flow
+    def test_flow():
+        return read_google_sheet_as_dict_of_lists(
+            is_public_sheet=True,
+            google_sheet_key="foo",
+            google_sheet_name="bar",
+            date_formats={"col_1": "%d/%m/%Y"},
+            raw=True,
+        )
+
+    exc_message = "A dtype and date formats can't be applied to a query, to raw values"
+    with pytest.raises(GoogleSheetsConfigurationException, match=exc_message):
+        test_flow()
+
+
+def test_read_google_sheet_as_data_frame_pyarrow(mocker):
+    mocker_table_call = mocker.patch(
+        "prefect_google_sheets.tasks.get_sheet_arrow_table"
+    )
+    mocker_dataframe_call = mocker.patch(
+        "prefect_google_sheets.tasks.arrow_table_to_dataframe"
+    )
+    mocker_dataframe_call.return_value = "test_call"
+
+    @flow
+    def test_flow():
+        return read_google_sheet_as_data_frame(
+            is_public_sheet=True,
+            google_sheet_key="foo",
+            google_sheet_name="bar",
+            engine="pyarrow",
+        )
+
+    result = test_flow()
+
+    assert mocker_table_call.call_args.kwargs["header"] is True
+    assert mocker_dataframe_call.call_args[0][0] == mocker_table_call.return_value
+    assert result == "test_call"
+
+
+def test_read_google_sheet_as_data_frame_wrong_engine():
+    @flow
+    def test_flow():
+        return read_google_sheet_as_data_frame(
+            is_public_sheet=True,
+            google_sheet_key="foo",
+            google_sheet_name="bar",
+            engine="polars",
+        )
+
+    exc_message = "Wrong engine. Valid ones: pyarrow"
+    with pytest.raises(GoogleSheetsConfigurationException, match=exc_message):
+        test_flow()
+
+
+def test_read_google_sheet_as_arrow_table(mocker):
+    mocker_gspread_client_call = mocker.patch(
+        "prefect_google_sheets.tasks.get_gspread_client"
+    )
+    mocker_gspread_client_call.return_value = Mock()
+
+    mocker_table_call = mocker.patch(
+        "prefect_google_sheets.tasks.get_sheet_arrow_table"
+    )
+    mocker_table_call.return_value = "test_call"
+
+    @flow
+    def test_flow():
+        return read_google_sheet_as_arrow_table(
+            google_service_account={"correct": "credentials"},
+            google_sheet_key="foo",
+            google_sheet_name="bar",
+            columns=["col_1"],
+        )
+
+    result = test_flow()
+
+    assert mocker_table_call.call_args.kwargs["columns"] == ["col_1"]
+    assert result == "test_call"
+
+
+def test_read_google_sheet_as_data_frame_schema_with_query():
+    @flow
+    def test_flow():
+        return read_google_sheet_as_data_frame(
+            is_public_sheet=True,
+            google_sheet_key="foo",
+            google_sheet_name="bar",
+            query="select A",
+            dtype={"col_1": "str"},
+        )
+
+    exc_message = "A dtype and date formats can't be applied to a query"
+    with pytest.raises(GoogleSheetsConfigurationException, match=exc_message):
+        test_flow()
+
+
+def test_read_google_sheet_as_data_frame_unformatted(mocker):
+    mocker_gspread_client_call = mocker.patch(
+        "prefect_google_sheets.tasks.get_gspread_client"
+    )
+    mocker_gspread_client_call.return_value = Mock()
+
+    mocker_sheet_call = mocker.patch(
+        "prefect_google_sheets.tasks.get_unformatted_sheet_dataframe"
+    )
+    mocker_sheet_call.return_value = "test_call"
+
+    @flow
+    def test_flow():
+        return read_google_sheet_as_data_frame(
+            google_service_account={"correct": "credentials"},
+            google_sheet_key="foo",
+            google_sheet_name="bar",
+            unformatted_values=True,
+            serial_date_columns=["day"],
+        )
+
+    result = test_flow()
+
+    assert mocker_sheet_call.call_args.kwargs["serial_date_columns"] == ["day"]
+    assert result == "test_call"
+
+
+def test_read_google_sheet_as_data_frame_unformatted_public():
+    @flow
+    def test_flow():
+        return read_google_sheet_as_data_frame(
+            is_public_sheet=True,
+            google_sheet_key="foo",
+            google_sheet_name="bar",
+            unformatted_values=True,
+        )
+
+    exc_message = "Unformatted values can only be read from private Google Sheets"
+    with pytest.raises(GoogleSheetsConfigurationException, match=exc_message):
+        test_flow()
+
+
+# read_google_sheets_batch task tests
+
+
+def test_read_google_sheets_batch_no_sheet_names():
+    @flow
+    def test_flow():
+        return read_google_sheets_batch(
+            google_service_account="foo", google_sheet_key="bar"
+        )
+
+    exc_message = "Missing the Google Sheet names identifiers."
+    with pytest.raises(GoogleSheetsConfigurationException, match=exc_message):
+        test_flow()
+
+
+def test_read_google_sheets_batch(mocker):
+    gspread_client = Mock()
+    gspread_client.request.return_value.json.return_value = {
+        "valueRanges": [
+            {"values": [["col_1"], ["foo"]]},
+            {"values": [["col_2", "col_3"], ["bar"]]},
+            {},
+        ]
+    }
+    mocker_gspread_client_call = mocker.patch(
+        "prefect_google_sheets.tasks.get_gspread_client"
+    )
+    mocker_gspread_client_call.return_value = gspread_client
+
+    @flow
+    def test_flow():
+        return read_google_sheets_batch(
+            google_service_account={"correct": "credentials"},
+            google_sheet_key="foo",
+            google_sheet_names=["first", "second!A1:B2", "empty"],
+        )
+
+    result = test_flow()
+
+    assert gspread_client.request.call_count == 1
+    params = gspread_client.request.call_args.kwargs["params"]
+    assert params["ranges"] == ["'first'", "second!A1:B2", "'empty'"]
+    assert result["first"]["col_1"].tolist() == ["foo"]
+    assert result["second!A1:B2"].columns.tolist() == ["col_2", "col_3"]
+    assert result["empty"].empty
+
+
+def test_read_google_sheets_batch_public(mocker):
+    mocker_sheets_call = mocker.patch(
+        "prefect_google_sheets.tasks.get_public_sheets_dataframes"
+    )
+    mocker_sheets_call.return_value = "test_call"
+
+    @flow
+    def test_flow():
+        return read_google_sheets_batch(
+            google_sheet_key="foo",
+            google_sheet_names=["first", "second"],
+            is_public_sheet=True,
+            export_format="ods",
+        )
+
+    result = test_flow()
+
+    assert mocker_sheets_call.call_args.kwargs["export_format"] == "ods"
+    assert result == "test_call"
+
+
+def test_read_google_sheets_batch_public_wrong_export_format():
+    @flow
+    def test_flow():
+        return read_google_sheets_batch(
+            google_sheet_key="foo",
+            google_sheet_names=["first"],
+            is_public_sheet=True,
+            export_format="pdf",
+        )
+
+    exc_message = "Wrong export format for the public Google Sheet."
+    with pytest.raises(GoogleSheetsConfigurationException, match=exc_message):
+        test_flow()
+
+
+# read_google_sheets_concurrently task tests
+
+
+def test_read_google_sheets_concurrently_wrong_concurrency():
+    @flow
+    def test_flow():
+        return read_google_sheets_concurrently(
+            google_service_account="foo",
+            google_sheets={"foo": ["bar"]},
+            max_concurrency=0,
+        )
+
+    exc_message = "The maximum concurrency must be at least 1."
+    with pytest.raises(GoogleSheetsConfigurationException, match=exc_message):
+        test_flow()
+
+
+def test_read_google_sheets_concurrently(mocker):
+    mocker_gspread_client_call = mocker.patch(
+        "prefect_google_sheets.tasks.get_gspread_client"
+    )
+    mocker_gspread_client_call.return_value = Mock()
+
+    mocker_sheets_call = mocker.patch(
+        "prefect_google_sheets.tasks.get_sheets_dataframes"
+    )
+    mocker_sheets_call.side_effect = lambda client, key, names, **kwargs: {
+        name: key for name in names
+    }
+
+    @flow
+    def test_flow():
+        return read_google_sheets_concurrently(
+            google_service_account={"correct": "credentials"},
+            google_sheets={"foo": ["first"], "bar": ["first", "second"]},
+            max_concurrency=2,
+        )
+
+    result = test_flow()
+
+    assert mocker_gspread_client_call.call_count == 1
+    assert result == {
+        "foo": {"first": "foo"},
+        "bar": {"first": "bar", "second": "bar"},
+    }
+
+
+# async read tasks tests
+
+
+async def test_aread_google_sheet_as_data_frame_no_sheet_name():
+    @flow
+    async def test_flow():
+        return await aread_google_sheet_as_data_frame(
+            google_service_account="foo", google_sheet_key="bar"
+        )
+
+    exc_message = "Missing the Google Sheet name identifier."
+    with pytest.raises(GoogleSheetsConfigurationException, match=exc_message):
+        await test_flow()
+
+
+async def test_aread_google_sheet_as_data_frame_public(mocker):
+    def handler(request):
+        assert "sheet=bar" in str(request.url)
+        return httpx.Response(200, content=b"col_1,col_2\nfoo,bar\n")
+
+    mocker.patch(
+        "prefect_google_sheets.utils.google.get_async_http_client",
+        return_value=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+    @flow
+    async def test_flow():
+        return await aread_google_sheet_as_data_frame(
+            is_public_sheet=True, google_sheet_key="foo", google_sheet_name="bar"
+        )
+
+    result = await test_flow()
+
+    assert result.to_dict("list") == {"col_1": ["foo"], "col_2": ["bar"]}
+
+
+async def test_aread_google_sheet_as_dict_of_lists_private(mocker):
+    def handler(request):
+        assert request.url.path == "/v4/spreadsheets/foo/values:batchGet"
+        assert request.url.params["ranges"] == "'bar'!A1:B2"
+        assert request.headers["authorization"] == "Bearer token"
+        return httpx.Response(
+            200, json={"valueRanges": [{"values": [["col_1", "col_2"], ["foo"]]}]}
+        )
+
+    mocker.patch(
+        "prefect_google_sheets.utils.google.get_async_http_client",
+        return_value=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+    credentials = Mock(valid=True)
+    credentials.apply.side_effect = lambda headers: headers.update(
+        authorization="Bearer token"
+    )
+    mocker_gspread_client_call = mocker.patch(
+        "prefect_google_sheets.utils.google.get_gspread_client"
+    )
+    mocker_gspread_client_call.return_value = Mock(auth=credentials)
+
+    @flow
+    async def test_flow():
+        return await aread_google_sheet_as_dict_of_lists(
+            google_service_account={"correct": "credentials"},
+            google_sheet_key="foo",
+            google_sheet_name="bar",
+            google_sheet_range="A1:B2",
+        )
+
+    result = await test_flow()
+
+    assert result["col_1"] == ["foo"]
+    assert pd.isna(result["col_2"][0])
+
+
+# iter_google_sheet_as_data_frames task tests
+
+
+def test_iter_google_sheet_as_data_frames_wrong_chunk_size(mocker):
+    mocker_gspread_client_call = mocker.patch(
+        "prefect_google_sheets.tasks.get_gspread_client"
+    )
+
+    @flow
+    def test_flow():
+        return iter_google_sheet_as_data_frames(
+            google_service_account={"correct": "credentials"},
+            google_sheet_key="foo",
+            google_sheet_name="bar",
+            chunk_size=0,
+        )
+
+    with pytest.raises(GoogleSheetsConfigurationException, match="chunk size"):
+        test_flow()
+    assert mocker_gspread_client_call.call_count == 0
+
+
+# google_sheet_revision_cache_key tests
+
+
+def test_google_sheet_revision_cache_key(mocker):
+    gspread_client = Mock()
+    gspread_client.request.return_value.json.return_value = {"version": "1"}
+    mocker_gspread_client_call = mocker.patch(
+        "prefect_google_sheets.tasks.get_gspread_client"
+    )
+    mocker_gspread_client_call.return_value = gspread_client
+
+    mocker_sheet_call = mocker.patch("prefect_google_sheets.tasks.get_sheet_dataframe")
+    mocker_sheet_call.return_value = pd.DataFrame({"col_1": ["foo"]})
+
+    cached_read = read_google_sheet_as_data_frame.with_options(
+        **GOOGLE_SHEET_REVISION_CACHE_OPTIONS
+    )
+
+    @flow
+    def test_flow():
+        return cached_read(
+            google_service_account={"correct": "credentials"},
+            google_sheet_key="foo",
+            google_sheet_name="bar",
+        )
+
+    test_flow()
+    result = test_flow()
+    assert mocker_sheet_call.call_count == 1
+    assert result["col_1"].tolist() == ["foo"]
+
+    gspread_client.request.return_value.json.return_value = {"version": "2"}
+    test_flow()
+    assert mocker_sheet_call.call_count == 2
+
+
+def test_google_sheet_revision_cache_key_public(mocker):
+    mocker_sheet_call = mocker.patch("prefect_google_sheets.tasks.get_sheet_dataframe")
+    mocker_sheet_call.return_value = pd.DataFrame({"col_1": ["foo"]})
+
+    cached_read = read_google_sheet_as_data_frame.with_options(
+        **GOOGLE_SHEET_REVISION_CACHE_OPTIONS
+    )
+
+    @flow
+    def test_flow():
+        return cached_read(
+            is_public_sheet=True, google_sheet_key="foo", google_sheet_name="bar"
+        )
+
+    test_flow()
+    test_flow()
+    assert mocker_sheet_call.call_count == 2
+
+
+def test_google_sheet_revision_cache_key_failed_lookup(mocker):
+    arguments = {"google_service_account": "{", "google_sheet_key": "foo"}
+
+    assert google_sheet_revision_cache_key(Mock(), arguments) is None
+
+    gspread_client = Mock()
+    gspread_client.request.return_value.json.return_value = {}
+    mocker.patch(
+        "prefect_google_sheets.tasks.get_gspread_client",
+        return_value=gspread_client,
+    )
+    arguments["google_service_account"] = {"correct": "credentials"}
+
+    assert google_sheet_revision_cache_key(Mock(), arguments) is None
+
+
+# write_data_frame_to_google_sheet task tests
+
+
+def test_write_data_frame_to_google_sheet_no_data_frame():
+    @flow
+    def test_flow():
+        return write_data_frame_to_google_sheet(
+            google_service_account="foo",
+            google_sheet_key="bar",
+            google_sheet_name="baz",
+        )
+
+    exc_message = "Missing the DataFrame to write."
+    with pytest.raises(GoogleSheetsConfigurationException, match=exc_message):
+        test_flow()
+
+
+def test_write_data_frame_to_google_sheet_wrong_value_input_option():
+    @flow
+    def test_flow():
+        return write_data_frame_to_google_sheet(
+            google_service_account="foo",
+            google_sheet_key="bar",
+            google_sheet_name="baz",
+            data_frame=pd.DataFrame({"col_1": [1]}),
+            value_input_option="FOO",
+        )
+
+    exc_message = "Wrong value input option."
+    with pytest.raises(GoogleSheetsConfigurationException, match=exc_message):
+        test_flow()
+
+
+def test_write_data_frame_to_google_sheet(mocker):
+    worksheet = Mock()
+    worksheet.title = "baz"
+    worksheet.spreadsheet.values_batch_update.return_value = {"totalUpdatedCells": 4}
+    gspread_client = Mock()
+    gspread_client.open_by_key.return_value.worksheet.return_value = worksheet
+    mocker_gspread_client_call = mocker.patch(
+        "prefect_google_sheets.tasks.get_gspread_client"
+    )
+    mocker_gspread_client_call.return_value = gspread_client
+
+    @flow
+    def test_flow():
+        return write_data_frame_to_google_sheet(
+            google_service_account={"correct": "credentials"},
+            google_sheet_key="bar",
+            google_sheet_name="baz",
+            data_frame=pd.DataFrame({"col_1": [1, 2, 3]}),
+            value_input_option="RAW",
+        )
+
+    result = test_flow()
+    body = worksheet.spreadsheet.values_batch_update.call_args[1]["body"]
+    assert body == {
+        "valueInputOption": "RAW",
+        "data": [{"range": "'baz'!A1:A4", "values": [["col_1"], [1], [2], [3]]}],
+    }
+    assert result == {"requests": 1, "updated_cells": 4}
+
+
+# upsert_data_frame_to_google_sheet task tests
+
+
+def test_upsert_data_frame_to_google_sheet_wrong_key_columns():
+    @flow
+    def test_flow():
+        return upsert_data_frame_to_google_sheet(
+            google_service_account="foo",
+            google_sheet_key="bar",
+            google_sheet_name="baz",
+            data_frame=pd.DataFrame({"col_1": [1]}),
+            key_columns=["id"],
+        )
+
+    exc_message = "Key columns not found in the DataFrame"
+    with pytest.raises(GoogleSheetsConfigurationException, match=exc_message):
+        test_flow()
+
+
+# append_rows_to_google_sheet task tests
+
+
+def test_append_rows_to_google_sheet_no_rows():
+    @flow
+    def test_flow():
+        return append_rows_to_google_sheet(
+            google_service_account="foo",
+            google_sheet_key="bar",
+            google_sheet_name="baz",
+        )
+
+    exc_message = "Missing the rows to append."
+    with pytest.raises(GoogleSheetsConfigurationException, match=exc_message):
+        test_flow()
+
+
+def test_append_rows_to_google_sheet(mocker):
+    worksheet = Mock()
+    worksheet.title = "baz"
+    gspread_client = Mock()
+    gspread_client.open_by_key.return_value.worksheet.return_value = worksheet
+    mocker_gspread_client_call = mocker.patch(
+        "prefect_google_sheets.tasks.get_gspread_client"
+    )
+    mocker_gspread_client_call.return_value = gspread_client
+
+    @flow
+    def test_flow():
+        return append_rows_to_google_sheet(
+            google_service_account={"correct": "credentials"},
+            google_sheet_key="bar",
+            google_sheet_name="baz",
+            rows=pd.DataFrame({"col_1": range(5)}),
+            max_rows_per_request=2,
+        )
+
+    result = test_flow()
+    assert worksheet.spreadsheet.values_append.call_count == 3
+    assert result == {"requests": 3, "appended_rows": 5, "rows_per_request": 5 / 3}
@@ -0,0 +1,61 @@
+import io
+from datetime import datetime
+
+import pytest
+
+from prefect_google_sheets.utils.arrow import (
+    arrow_table_to_dataframe,
+    get_sheet_arrow_table,
+    values_to_arrow_table,
+)
+
+pytest.importorskip("pyarrow")
+
+
+def test_values_to_arrow_table():
+    values = [
+        ["num", "text", "date", "local_date"],
+        [1, "foo", "2022-01-31 10:30:00", "13/01/2024"],
+        [2.5, "", "", "01/02/2024"],
+        [],
+    ]
+
+    table = values_to_arrow_table(values, header=True)
+
+    assert str(table.schema.field("num").type) == "double"
+    assert str(table.schema.field("date").type) == "timestamp[s]"
+    assert str(table.schema.field("local_date").type) == "string"
+    assert table.column("num").to_pylist() == [1.0, 2.5, None]
+    assert table.column("date").to_pylist()[0] == datetime(2022, 1, 31, 10, 30)
+
+
+def test_get_sheet_arrow_table_clean(mock_worksheet):
+    worksheet = mock_worksheet([["col_1", "", "col_3"], [1, "", 2], [], [3]])
+
+    table = get_sheet_arrow_table(worksheet, header=True, clean=True)
+
+    assert table.column_names == ["col_1", "col_3"]
+    assert table.to_pydict() == {"col_1": [1, 3], "col_3": [2, None]}
+
+
+def test_get_sheet_arrow_table_public_columns(mocker):
+    mocker_open_call = mocker.patch(
+        "prefect_google_sheets.utils.arrow.open_public_sheet"
+    )
+    mocker_open_call.return_value.__enter__.return_value = io.BytesIO(
+        b"col_1,col_2,col_3\nfoo,1,bar\n"
+    )
+
+    table = get_sheet_arrow_table(
+        "https://foo", header=True, clean=False, columns=["col_2", "col_1"]
+    )
+
+    assert table.to_pydict() == {"col_2": [1], "col_1": ["foo"]}
+
+
+def test_arrow_table_to_dataframe():
+    table = values_to_arrow_table([["col_1"], [1], [2]], header=True)
+
+    result = arrow_table_to_dataframe(table)
+
+    assert result["col_1"].tolist() == [1, 2]
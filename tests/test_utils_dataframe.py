@@ -0,0 +1,432 @@
+from io import BytesIO
+from unittest.mock import Mock
+
+import pytest
+from gspread.exceptions import APIError
+from pandas import DataFrame
+
+from prefect_google_sheets.exceptions import (
+    GoogleSheetsConfigurationException,
+    GoogleSheetValueError,
+)
+from prefect_google_sheets.utils.dataframe import (
+    get_new_rows_dataframe,
+    get_revision_cached_dataframe,
+    get_sheet_dataframe,
+    iter_sheet_dataframes,
+    trim_blank_tail,
+)
+from prefect_google_sheets.utils.state import SheetStateStore
+
+# trim_blank_tail tests
+
+
+def test_trim_blank_tail():
+    values = [["a", "", "c", ""], ["", ""], ["1", "", "3"], ["4"], ["", ""], []]
+
+    assert trim_blank_tail(values) == [
+        ["a", "", "c"],
+        ["", "", ""],
+        ["1", "", "3"],
+        ["4", "", ""],
+    ]
+    assert trim_blank_tail([[""], []]) == []
+
+
+# get_sheet_dataframe tests
+
+
+def test_get_sheet_dataframe_range(mock_worksheet):
+    worksheet = mock_worksheet([["col_1", "col_2"], ["foo"], ["bar", "baz"]])
+
+    result = get_sheet_dataframe(
+        worksheet,
+        header=0,
+        parse_dates=True,
+        on_bad_lines="error",
+        clean=False,
+        sheet_range="A1:B3",
+    )
+
+    worksheet.spreadsheet.values_get.assert_called_once()
+    assert worksheet.spreadsheet.values_get.call_args[0][0] == "'bar'!A1:B3"
+    assert result.columns.tolist() == ["col_1", "col_2"]
+    assert result["col_1"].tolist() == ["foo", "bar"]
+
+
+def test_get_sheet_dataframe_clean_data_extent(mock_worksheet):
+    worksheet = mock_worksheet(
+        [["col_1", "", "col_3"], ["foo", "", "1"], [], ["bar"], ["", "", ""]]
+    )
+    worksheet.row_count = 1000
+    worksheet.col_count = 26
+
+    result = get_sheet_dataframe(
+        worksheet, header=0, parse_dates=True, on_bad_lines="error", clean=True
+    )
+
+    worksheet.spreadsheet.values_get.assert_called_once()
+    assert worksheet.spreadsheet.values_get.call_args[0][0] == "'bar'"
+    assert result.columns.tolist() == ["col_1", "col_3"]
+    assert result["col_1"].tolist() == ["foo", "bar"]
+    assert result["col_3"].tolist()[0] == 1
+
+
+def test_get_sheet_dataframe_clean_header_only(mock_worksheet):
+    worksheet = mock_worksheet([["col_1", "", "col_3"], [], ["", ""]])
+
+    result = get_sheet_dataframe(
+        worksheet, header=0, parse_dates=True, on_bad_lines="error", clean=True
+    )
+
+    assert result.empty
+    assert result.columns.tolist() == ["col_1", "Unnamed: 1", "col_3"]
+
+    worksheet.spreadsheet.values_get.return_value = {}
+    result = get_sheet_dataframe(
+        worksheet, header=0, parse_dates=True, on_bad_lines="error", clean=True
+    )
+
+    assert result.empty
+
+
+def test_get_sheet_dataframe_clean_keeps_positions(mock_worksheet):
+    worksheet = mock_worksheet([["foo", "", "bar"], [], ["baz", "", "qux", ""]])
+
+    result = get_sheet_dataframe(
+        worksheet, header=None, parse_dates=True, on_bad_lines="error", clean=True
+    )
+
+    assert result.columns.tolist() == [0, 2]
+    assert result.index.tolist() == [0, 2]
+
+    worksheet.spreadsheet.values_get.return_value = {
+        "values": [["col_1", "", "", "col_4"], ["foo", "", "bar", "baz"]]
+    }
+    result = get_sheet_dataframe(
+        worksheet, header=0, parse_dates=True, on_bad_lines="error", clean=True
+    )
+
+    assert result.columns.tolist() == ["col_1", "Unnamed: 2", "col_4"]
+
+
+def test_get_sheet_dataframe_clean_columns_keep_positions(mock_worksheet):
+    worksheet = mock_worksheet([])
+    worksheet.spreadsheet.values_batch_get.return_value = {
+        "valueRanges": [{}, {"values": [["foo"], ["bar"]]}]
+    }
+
+    result = get_sheet_dataframe(
+        worksheet,
+        header=None,
+        parse_dates=True,
+        on_bad_lines="error",
+        clean=True,
+        columns=["A", "C"],
+    )
+
+    assert result.columns.tolist() == [1]
+    assert result[1].tolist() == ["foo", "bar"]
+
+
+def test_get_sheet_dataframe_empty_range(mock_worksheet):
+    worksheet = mock_worksheet([])
+
+    result = get_sheet_dataframe(
+        worksheet,
+        header=0,
+        parse_dates=True,
+        on_bad_lines="error",
+        clean=False,
+        sheet_range="A1:B3",
+    )
+
+    assert result.empty
+
+
+def test_get_sheet_dataframe_public_range(mocker):
+    mocker_open_call = mocker.patch(
+        "prefect_google_sheets.utils.dataframe.open_public_sheet"
+    )
+    mocker_open_call.return_value.__enter__.return_value = BytesIO(
+        b"col_1,col_2\nfoo,bar\n"
+    )
+
+    get_sheet_dataframe(
+        "https://foo/export?format=csv&sheet=bar",
+        header=0,
+        parse_dates=True,
+        on_bad_lines="error",
+        clean=False,
+        sheet_range="A1:B3",
+    )
+
+    assert mocker_open_call.call_args[0][0].endswith("&range=A1%3AB3")
+
+
+def test_get_sheet_dataframe_schema(mock_worksheet):
+    worksheet = mock_worksheet(
+        [["id", "amount", "day"], ["007", "1", "31/01/2022"], ["008", "2.5", ""]]
+    )
+
+    result = get_sheet_dataframe(
+        worksheet,
+        header=0,
+        parse_dates=True,
+        on_bad_lines="error",
+        clean=False,
+        sheet_range="A1:C3",
+        dtype={"id": "str", "amount": "float64"},
+        date_formats={"day": "%d/%m/%Y"},
+    )
+
+    assert result["id"].tolist() == ["007", "008"]
+    assert result["amount"].dtype == "float64"
+    assert result["day"].dtype == "datetime64[ns]"
+    assert result["day"].isna().tolist() == [False, True]
+
+
+def test_get_sheet_dataframe_public_schema(mocker):
+    mocker_open_call = mocker.patch(
+        "prefect_google_sheets.utils.dataframe.open_public_sheet"
+    )
+    mocker_open_call.return_value.__enter__.return_value = BytesIO(
+        b"id,day\n007,2022-31-01\n"
+    )
+
+    result = get_sheet_dataframe(
+        "https://foo/export?format=csv&sheet=bar",
+        header=0,
+        parse_dates=True,
+        on_bad_lines="error",
+        clean=False,
+        dtype={"id": "str"},
+        date_formats={"day": "%Y-%d-%m"},
+    )
+
+    assert result["id"].tolist() == ["007"]
+    assert result["day"].dt.month.tolist() == [1]
+
+
+def test_get_sheet_dataframe_error(mock_worksheet):
+    worksheet = mock_worksheet([])
+    worksheet.spreadsheet.values_get.side_effect = ValueError("foo")
+
+    with pytest.raises(GoogleSheetValueError, match="Error while reading the Sheet"):
+        get_sheet_dataframe(
+            worksheet,
+            header=0,
+            parse_dates=True,
+            on_bad_lines="error",
+            clean=False,
+            sheet_range="A1:B3",
+        )
+
+
+def test_get_sheet_dataframe_columns(mock_worksheet):
+    worksheet = mock_worksheet([["a", "b", "c", "d"]])
+    worksheet.spreadsheet.values_batch_get.return_value = {
+        "valueRanges": [
+            {"values": [["a", "b"], ["1", "2"], ["3"]]},
+            {"values": [["d"], ["4"]]},
+        ]
+    }
+
+    result = get_sheet_dataframe(
+        worksheet,
+        header=0,
+        parse_dates=True,
+        on_bad_lines="error",
+        clean=False,
+        columns=["d", "a", "b"],
+    )
+
+    ranges = worksheet.spreadsheet.values_batch_get.call_args[0][0]
+    assert ranges == ["'bar'!A:B", "'bar'!D:D"]
+    assert result.columns.tolist() == ["d", "a", "b"]
+    assert result["a"].tolist() == [1, 3]
+    assert result["d"].fillna(0).tolist() == [4, 0]
+
+
+def test_get_sheet_dataframe_columns_missing(mock_worksheet):
+    worksheet = mock_worksheet([["a", "b"]])
+
+    with pytest.raises(GoogleSheetValueError, match="Columns not found"):
+        get_sheet_dataframe(
+            worksheet,
+            header=0,
+            parse_dates=True,
+            on_bad_lines="error",
+            clean=False,
+            columns=["z"],
+        )
+
+
+def test_get_sheet_dataframe_columns_and_range(mock_worksheet):
+    with pytest.raises(GoogleSheetsConfigurationException, match="can't be read"):
+        get_sheet_dataframe(
+            mock_worksheet([]),
+            header=0,
+            parse_dates=True,
+            on_bad_lines="error",
+            clean=False,
+            sheet_range="A1:B3",
+            columns=["a"],
+        )
+
+
+# iter_sheet_dataframes tests
+
+
+def test_iter_sheet_dataframes_private(mock_worksheet):
+    worksheet = mock_worksheet([])
+    worksheet.row_count = 1000
+    worksheet.spreadsheet.values_get.side_effect = [
+        {"values": [["col_1", "col_2"]]},
+        {"values": [["a", "b"], ["c"]]},
+        {"values": [[], ["d", "e", "f"]]},
+        {"values": [["g"]]},
+    ]
+
+    chunks = list(
+        iter_sheet_dataframes(
+            worksheet,
+            header=0,
+            parse_dates=True,
+            on_bad_lines="error",
+            clean=False,
+            chunk_size=2,
+        )
+    )
+
+    ranges = [c[0][0] for c in worksheet.spreadsheet.values_get.call_args_list]
+    assert ranges == ["'bar'!1:1", "'bar'!2:3", "'bar'!4:5", "'bar'!6:7"]
+    assert len(chunks) == 3
+    assert chunks[0]["col_1"].tolist() == ["a", "c"]
+    assert chunks[1].index.tolist() == [2, 3]
+    assert chunks[1].columns.tolist() == ["col_1", "col_2", "Unnamed: 2"]
+    assert chunks[2].index.tolist() == [4]
+
+
+def test_iter_sheet_dataframes_public(mocker):
+    mocker_open_call = mocker.patch(
+        "prefect_google_sheets.utils.dataframe.open_public_sheet"
+    )
+    mocker_read_csv_call = mocker.patch(
+        "prefect_google_sheets.utils.dataframe.read_csv"
+    )
+    mocker_read_csv_call.return_value = iter(["first", "second"])
+
+    chunks = iter_sheet_dataframes(
+        "https://foo",
+        header=0,
+        parse_dates=True,
+        on_bad_lines="error",
+        clean=False,
+        chunk_size=2,
+    )
+
+    assert mocker_open_call.call_count == 0
+    assert list(chunks) == ["first", "second"]
+    assert mocker_open_call.call_args[0][0] == "https://foo"
+    assert mocker_open_call.return_value.__exit__.call_count == 1
+    assert mocker_read_csv_call.call_args.kwargs["chunksize"] == 2
+
+
+def test_iter_sheet_dataframes_wrong_chunk_size():
+    with pytest.raises(GoogleSheetsConfigurationException, match="chunk size"):
+        iter_sheet_dataframes(
+            "https://foo",
+            header=0,
+            parse_dates=True,
+            on_bad_lines="error",
+            clean=False,
+            chunk_size=0,
+        )
+
+
+# get_new_rows_dataframe tests
+
+
+def test_get_new_rows_dataframe(mock_worksheet, tmp_path):
+    worksheet = mock_worksheet([])
+    worksheet.spreadsheet.id = "foo"
+    state_store = SheetStateStore(tmp_path)
+
+    def read(row_count, rows, include_previous_rows):
+        worksheet.row_count = row_count
+        worksheet.spreadsheet.values_batch_get.return_value = {
+            "valueRanges": [{"values": [["col_1"]]}, {"values": rows}]
+        }
+        return get_new_rows_dataframe(
+            worksheet,
+            header=0,
+            parse_dates=True,
+            on_bad_lines="error",
+            clean=False,
+            state_store=state_store,
+            include_previous_rows=include_previous_rows,
+        )
+
+    first = read(10, [["a"], ["b"]], include_previous_rows=True)
+    ranges = worksheet.spreadsheet.values_batch_get.call_args[0][0]
+    assert ranges == ["'bar'!1:1", "'bar'!2:10"]
+    assert first["col_1"].tolist() == ["a", "b"]
+
+    second = read(10, [["c"]], include_previous_rows=False)
+    ranges = worksheet.spreadsheet.values_batch_get.call_args[0][0]
+    assert ranges == ["'bar'!1:1", "'bar'!4:10"]
+    assert second["col_1"].tolist() == ["c"]
+    assert second.index.tolist() == [2]
+
+    third = read(10, [["c"], ["d"]], include_previous_rows=True)
+    ranges = worksheet.spreadsheet.values_batch_get.call_args[0][0]
+    assert ranges == ["'bar'!1:1", "'bar'!4:10"]
+    assert third["col_1"].tolist() == ["a", "b", "c", "d"]
+    assert third.index.tolist() == [0, 1, 2, 3]
+
+    fourth = read(5, [], include_previous_rows=False)
+    ranges = worksheet.spreadsheet.values_batch_get.call_args[0][0]
+    assert ranges == ["'bar'!1:1"]
+    assert fourth.empty is True
+
+
+# get_revision_cached_dataframe tests
+
+
+def test_get_revision_cached_dataframe(tmp_path):
+    gspread_client = Mock()
+    state_store = SheetStateStore(tmp_path)
+    read_dataframe = Mock(side_effect=lambda: DataFrame({"col_1": ["foo"]}))
+
+    def read(revision):
+        gspread_client.request.return_value.json.return_value = revision
+        return get_revision_cached_dataframe(
+            gspread_client, "foo", ("bar", None), read_dataframe, state_store
+        )
+
+    read({"version": "1", "modifiedTime": "2022-10-01T00:00:00Z"})
+    cached = read({"version": "1", "modifiedTime": "2022-10-01T00:00:00Z"})
+    assert read_dataframe.call_count == 1
+    assert cached["col_1"].tolist() == ["foo"]
+
+    read({"version": "2", "modifiedTime": "2022-10-02T00:00:00Z"})
+    assert read_dataframe.call_count == 2
+
+    url = gspread_client.request.call_args[0][1]
+    assert url == "https://www.googleapis.com/drive/v3/files/foo"
+
+
+def test_get_revision_cached_dataframe_no_drive_access(tmp_path):
+    gspread_client = Mock()
+    response = Mock()
+    response.json.return_value = {"error": {"code": 403, "message": "Forbidden"}}
+    gspread_client.request.side_effect = APIError(response)
+    read_dataframe = Mock(return_value=DataFrame({"col_1": ["foo"]}))
+
+    for _ in range(2):
+        get_revision_cached_dataframe(
+            gspread_client, "foo", ("bar",), read_dataframe, SheetStateStore(tmp_path)
+        )
+
+    assert read_dataframe.call_count == 2
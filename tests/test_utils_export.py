@@ -0,0 +1,56 @@
+from contextlib import nullcontext
+from io import BytesIO
+
+import pandas as pd
+import pytest
+
+from prefect_google_sheets.exceptions import GoogleSheetValueError
+from prefect_google_sheets.utils.export import get_public_sheets_dataframes
+
+
+@pytest.fixture
+def xlsx_export(mocker):
+    content = BytesIO()
+    with pd.ExcelWriter(content, engine="openpyxl") as writer:
+        pd.DataFrame({"col_1": ["foo"]}).to_excel(writer, "first", index=False)
+        pd.DataFrame({"col_2": [1, None]}).to_excel(writer, "second", index=False)
+        pd.DataFrame({"col_3": [True]}).to_excel(writer, "third", index=False)
+
+    mocker_open_call = mocker.patch(
+        "prefect_google_sheets.utils.export.open_public_sheet"
+    )
+    mocker_open_call.side_effect = lambda url: nullcontext(BytesIO(content.getvalue()))
+    return mocker_open_call
+
+
+def test_get_public_sheets_dataframes(xlsx_export, tmp_path):
+    result = get_public_sheets_dataframes(
+        "foo", ["first", "second"], header=0, clean=True, cache_directory=tmp_path
+    )
+
+    url = xlsx_export.call_args[0][0]
+    assert url == "https://docs.google.com/spreadsheets/d/foo/export?format=xlsx"
+    assert list(result) == ["first", "second"]
+    assert result["first"]["col_1"].tolist() == ["foo"]
+    assert result["second"]["col_2"].tolist() == [1]
+
+
+def test_get_public_sheets_dataframes_reuses_export(xlsx_export, tmp_path):
+    for google_sheet_names in (["first"], ["third"]):
+        get_public_sheets_dataframes(
+            "foo",
+            google_sheet_names,
+            header=0,
+            clean=False,
+            cache_directory=tmp_path,
+            max_age=60,
+        )
+
+    assert xlsx_export.call_count == 1
+
+
+def test_get_public_sheets_dataframes_missing_sheet(xlsx_export, tmp_path):
+    with pytest.raises(GoogleSheetValueError, match="missing"):
+        get_public_sheets_dataframes(
+            "foo", ["missing"], header=0, clean=False, cache_directory=tmp_path
+        )
@@ -0,0 +1,125 @@
+import gzip
+from datetime import datetime, timedelta
+from io import BytesIO
+from unittest.mock import Mock
+
+import pytest
+import requests
+from urllib3 import HTTPResponse
+
+from prefect_google_sheets.exceptions import (
+    GoogleSheetsConfigurationException,
+    GoogleSheetServiceAccountError,
+)
+from prefect_google_sheets.utils import google
+from prefect_google_sheets.utils.google import (
+    get_gspread_client,
+    get_public_http_session,
+    get_service_account_fingerprint,
+    open_public_sheet,
+    set_public_sheet_timeouts,
+)
+
+# get_gspread_client tests
+
+
+def test_get_service_account_fingerprint_is_stable():
+    first = get_service_account_fingerprint({"a": 1, "b": 2})
+    second = get_service_account_fingerprint('{"b": 2, "a": 1}')
+
+    assert first == second
+    assert first != get_service_account_fingerprint({"a": 1, "b": 2}, ["scope"])
+
+
+def test_get_gspread_client_wrong_sa():
+    exc_message = (
+        "Wrong type for the Google Service Account param. Valid ones: dict, str"
+    )
+    with pytest.raises(GoogleSheetServiceAccountError, match=exc_message):
+        get_gspread_client(["foo"])
+
+
+def test_get_gspread_client_reuses_client(mocker):
+    mocker.patch("prefect_google_sheets.utils.google.generate_google_credentials")
+    mocker_authorize_call = mocker.patch(
+        "prefect_google_sheets.utils.google.gspread.authorize"
+    )
+    mocker_authorize_call.side_effect = lambda credentials, **kwargs: Mock(auth=None)
+
+    first = get_gspread_client({"foo": "bar"})
+    second = get_gspread_client({"foo": "bar"})
+    other = get_gspread_client({"foo": "baz"})
+
+    assert first is second
+    assert first is not other
+    assert mocker_authorize_call.call_count == 2
+
+
+def test_get_gspread_client_evicts_least_recently_used(mocker):
+    mocker.patch("prefect_google_sheets.utils.google.generate_google_credentials")
+    mocker_authorize_call = mocker.patch(
+        "prefect_google_sheets.utils.google.gspread.authorize"
+    )
+    mocker_authorize_call.side_effect = lambda credentials, **kwargs: Mock(auth=None)
+    mocker.patch.object(google, "GSPREAD_CLIENT_CACHE_MAX_SIZE", 2)
+
+    first = get_gspread_client({"sa": 1})
+    get_gspread_client({"sa": 2})
+    assert get_gspread_client({"sa": 1}) is first
+    get_gspread_client({"sa": 3})
+
+    assert get_gspread_client({"sa": 1}) is first
+    assert mocker_authorize_call.call_count == 3
+    get_gspread_client({"sa": 2})
+    assert mocker_authorize_call.call_count == 4
+
+
+def test_get_gspread_client_refreshes_expiring_token(mocker):
+    mocker.patch("prefect_google_sheets.utils.google.generate_google_credentials")
+    credentials = Mock(expiry=datetime.utcnow() + timedelta(minutes=1))
+    mocker_authorize_call = mocker.patch(
+        "prefect_google_sheets.utils.google.gspread.authorize"
+    )
+    mocker_authorize_call.return_value = Mock(auth=credentials)
+
+    get_gspread_client({"foo": "bar"})
+    assert credentials.refresh.called is False
+
+    get_gspread_client({"foo": "bar"})
+    assert credentials.refresh.called is True
+
+
+# open_public_sheet tests
+
+
+def test_get_public_http_session_is_shared():
+    assert get_public_http_session() is get_public_http_session()
+
+
+def test_open_public_sheet(mocker):
+    response = requests.Response()
+    response.status_code = 200
+    response.raw = HTTPResponse(
+        body=BytesIO(gzip.compress(b"col_1\nfoo\n")),
+        headers={"Content-Encoding": "gzip"},
+        preload_content=False,
+    )
+    session = Mock()
+    session.get.return_value = response
+    mocker.patch.object(google, "get_public_http_session", return_value=session)
+    mocker.patch.object(google, "_public_sheet_timeout", (1.0, 2.0))
+
+    with open_public_sheet("https://foo") as stream:
+        assert stream.read() == b"col_1\nfoo\n"
+
+    kwargs = session.get.call_args.kwargs
+    assert kwargs["headers"] == {"Accept-Encoding": "gzip"}
+    assert kwargs["stream"] is True
+    assert kwargs["timeout"] == (1.0, 2.0)
+    assert response.raw.closed is True
+
+
+def test_set_public_sheet_timeouts_not_positive():
+    exc_message = "The public sheet timeouts must be positive."
+    with pytest.raises(GoogleSheetsConfigurationException, match=exc_message):
+        set_public_sheet_timeouts(0, 60)
@@ -0,0 +1,102 @@
+import json
+from datetime import datetime
+from unittest.mock import Mock
+
+import pytest
+
+from prefect_google_sheets.exceptions import GoogleSheetValueError
+from prefect_google_sheets.utils.query import (
+    get_query_dataframe,
+    get_query_params,
+    parse_query_response,
+)
+
+
+def _gviz_response(payload):
+    return (
+        "/*O_o*/\ngoogle.visualization.Query.setResponse(" f"{json.dumps(payload)});"
+    ).encode()
+
+
+GVIZ_TABLE = {
+    "cols": [
+        {"id": "A", "label": "name", "type": "string"},
+        {"id": "C", "label": "amount", "type": "number"},
+        {"id": "D", "label": "", "type": "date"},
+    ],
+    "rows": [
+        {"c": [{"v": "foo"}, {"v": 150.0}, {"v": "Date(2022,0,31)"}]},
+        {"c": [{"v": "bar"}, {"v": 200.0}, None]},
+    ],
+}
+
+
+def test_get_query_params():
+    params = get_query_params("bar", "select A", header=True, sheet_range="A1:C10")
+
+    assert params == {
+        "tqx": "out:json",
+        "sheet": "bar",
+        "headers": 1,
+        "tq": "select A",
+        "range": "A1:C10",
+    }
+
+
+def test_parse_query_response():
+    result = parse_query_response(
+        _gviz_response({"status": "ok", "table": GVIZ_TABLE}), header=True
+    )
+
+    assert result.columns.tolist() == ["name", "amount", "Unnamed: 2"]
+    assert result["amount"].dtype == "int64"
+    assert result["Unnamed: 2"].tolist()[0] == datetime(2022, 1, 31)
+    assert result["Unnamed: 2"].isna().tolist() == [False, True]
+
+
+def test_parse_query_response_no_header():
+    result = parse_query_response(
+        _gviz_response({"status": "ok", "table": GVIZ_TABLE}), header=False
+    )
+
+    assert result.columns.tolist() == [0, 1, 2]
+    assert result[0].tolist() == ["foo", "bar"]
+
+
+def test_parse_query_response_error():
+    content = _gviz_response(
+        {
+            "status": "error",
+            "errors": [{"message": "INVALID_QUERY", "detailed_message": "Bad D"}],
+        }
+    )
+
+    with pytest.raises(ValueError, match="The query failed: Bad D"):
+        parse_query_response(content, header=True)
+
+
+def test_get_query_dataframe_private():
+    gspread_client = Mock()
+    gspread_client.request.return_value.content = _gviz_response(
+        {"status": "ok", "table": GVIZ_TABLE}
+    )
+
+    result = get_query_dataframe(
+        gspread_client, "foo", "bar", "select A, C, D", header=0, clean=False
+    )
+
+    url = gspread_client.request.call_args[0][1]
+    params = gspread_client.request.call_args.kwargs["params"]
+    assert url == "https://docs.google.com/spreadsheets/d/foo/gviz/tq"
+    assert params["tq"] == "select A, C, D"
+    assert result["name"].tolist() == ["foo", "bar"]
+
+
+def test_get_query_dataframe_error():
+    gspread_client = Mock()
+    gspread_client.request.side_effect = Exception("Forbidden")
+
+    with pytest.raises(GoogleSheetValueError, match="Forbidden"):
+        get_query_dataframe(
+            gspread_client, "foo", "bar", "select A", header=0, clean=False
+        )
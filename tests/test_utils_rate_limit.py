@@ -0,0 +1,93 @@
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from prefect_google_sheets.exceptions import GoogleSheetsConfigurationException
+from prefect_google_sheets.utils.google import (
+    RateLimitedClient,
+    set_sheets_api_rate_limit,
+)
+from prefect_google_sheets.utils.rate_limit import (
+    SQLiteTokenBucket,
+    TokenBucket,
+    get_rate_limiter,
+)
+
+# TokenBucket tests
+
+
+def test_token_bucket_reserve():
+    bucket = TokenBucket(rate=1, capacity=2)
+
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == pytest.approx(1, abs=0.1)
+    assert bucket.reserve() == pytest.approx(2, abs=0.1)
+
+
+def test_sqlite_token_bucket_shared_state(tmp_path):
+    path = str(tmp_path / "buckets.db")
+    first = SQLiteTokenBucket(rate=1, capacity=1, path=path, key="foo")
+    second = SQLiteTokenBucket(rate=1, capacity=1, path=path, key="foo")
+    other = SQLiteTokenBucket(rate=1, capacity=1, path=path, key="bar")
+
+    assert first.reserve() == 0
+    assert second.reserve() == pytest.approx(1, abs=0.1)
+    assert other.reserve() == 0
+
+
+async def test_sqlite_token_bucket_aacquire_off_loop(tmp_path, mocker):
+    bucket = SQLiteTokenBucket(
+        rate=1, capacity=1, path=str(tmp_path / "buckets.db"), key="foo"
+    )
+    main_thread = threading.get_ident()
+    reserve = bucket.reserve
+    threads = []
+
+    def record_thread(tokens):
+        threads.append(threading.get_ident())
+        return reserve(tokens)
+
+    mocker.patch.object(bucket, "reserve", side_effect=record_thread)
+
+    await bucket.aacquire()
+
+    assert threads and threads[0] != main_thread
+
+
+# set_sheets_api_rate_limit tests
+
+
+def test_set_sheets_api_rate_limit():
+    service_account = {"client_email": "foo@bar.com"}
+
+    set_sheets_api_rate_limit(service_account, requests_per_minute=120, burst=5)
+    rate_limiter = get_rate_limiter("foo@bar.com")
+    assert rate_limiter.rate == 2
+    assert rate_limiter.capacity == 5
+
+    set_sheets_api_rate_limit(service_account, requests_per_minute=None)
+    assert get_rate_limiter("foo@bar.com") is None
+
+
+def test_set_sheets_api_rate_limit_wrong_rate():
+    exc_message = "The rate limit and its burst must be positive."
+    with pytest.raises(GoogleSheetsConfigurationException, match=exc_message):
+        set_sheets_api_rate_limit({"client_email": "foo"}, requests_per_minute=0)
+
+
+def test_rate_limited_client_acquires(mocker):
+    rate_limiter = Mock()
+    mocker.patch(
+        "prefect_google_sheets.utils.google.get_rate_limiter",
+        return_value=rate_limiter,
+    )
+    session = Mock()
+    session.get.return_value.ok = True
+    client = RateLimitedClient(auth=None, session=session)
+
+    client.request("get", "https://foo")
+
+    assert rate_limiter.acquire.call_count == 1
+    assert session.get.call_count == 1
@@ -0,0 +1,104 @@
+from unittest.mock import Mock
+
+import pytest
+from gspread.exceptions import APIError
+
+from prefect_google_sheets.utils.google import RateLimitedClient
+from prefect_google_sheets.utils.retry import (
+    RetryPolicy,
+    get_retry_counts,
+    is_idempotent_request,
+    parse_retry_after,
+    reset_retry_counts,
+)
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(mocker):
+    reset_retry_counts()
+    yield mocker.patch("prefect_google_sheets.utils.google.time.sleep")
+    reset_retry_counts()
+
+
+def _response(status_code, headers=None):
+    response = Mock(ok=200 <= status_code < 300, status_code=status_code)
+    response.headers = headers or {}
+    response.json.return_value = {"error": {"code": status_code}}
+    return response
+
+
+# RetryPolicy tests
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("12") == 12
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+    assert parse_retry_after("foo") is None
+    assert parse_retry_after(None) is None
+
+
+def test_retry_policy_get_delay(mocker):
+    policy = RetryPolicy(max_retries=3, base_delay=1, max_delay=4, total_timeout=10)
+    mocker.patch("prefect_google_sheets.utils.retry.time.monotonic", return_value=0)
+
+    assert 0 <= policy.get_delay(2, 503, None, started_at=0) <= 4
+    assert policy.get_delay(0, 429, "7", started_at=0) == 7
+    assert policy.get_delay(0, 429, "11", started_at=0) is None
+    assert policy.get_delay(0, 404, None, started_at=0) is None
+    assert policy.get_delay(3, 503, None, started_at=0) is None
+    assert policy.get_delay(0, 429, "7", started_at=0, idempotent=False) == 7
+    assert policy.get_delay(0, 503, None, started_at=0, idempotent=False) is None
+    assert policy.get_delay(0, None, None, started_at=0, idempotent=False) is None
+
+
+def test_is_idempotent_request():
+    append_url = "https://sheets.googleapis.com/v4/spreadsheets/foo/values/bar:append"
+
+    assert is_idempotent_request("post", append_url) is False
+    assert is_idempotent_request("post", f"{append_url}?valueInputOption=RAW") is False
+    assert is_idempotent_request("get", "https://foo/values/bar") is True
+    assert is_idempotent_request("post", "https://foo/values:batchUpdate") is True
+
+
+# RateLimitedClient retry tests
+
+
+def test_rate_limited_client_retries(no_sleep):
+    session = Mock()
+    session.get.side_effect = [
+        _response(429, {"Retry-After": "3"}),
+        _response(503),
+        _response(200),
+    ]
+    client = RateLimitedClient(auth=None, session=session)
+
+    response = client.request("get", "https://foo")
+
+    assert response.ok is True
+    assert session.get.call_count == 3
+    assert no_sleep.call_args_list[0][0][0] == 3
+    assert get_retry_counts() == {429: 1, 503: 1}
+
+
+def test_rate_limited_client_does_not_retry_client_errors(no_sleep):
+    session = Mock()
+    session.get.return_value = _response(404)
+    client = RateLimitedClient(auth=None, session=session)
+
+    with pytest.raises(APIError):
+        client.request("get", "https://foo")
+
+    assert session.get.call_count == 1
+    assert no_sleep.called is False
+
+
+def test_rate_limited_client_does_not_retry_appends_on_server_errors(no_sleep):
+    session = Mock()
+    session.post.side_effect = [_response(429), _response(503), _response(200)]
+    client = RateLimitedClient(auth=None, session=session)
+
+    with pytest.raises(APIError):
+        client.request("post", "https://foo/values/%27bar%27:append")
+
+    assert session.post.call_count == 2
+    assert get_retry_counts() == {429: 1}
@@ -0,0 +1,110 @@
+import io
+from datetime import datetime
+
+import pandas as pd
+
+from prefect_google_sheets.utils.values import (
+    get_sheet_values,
+    get_unformatted_sheet_dataframe,
+    serial_numbers_to_datetimes,
+    trim_values,
+    values_to_columns,
+)
+
+# trim_values tests
+
+
+def test_trim_values():
+    values = [["a", "", "c"], [], ["", ""], ["d"]]
+
+    assert trim_values(values, clean=False) == [
+        ["a", "", "c"],
+        ["", "", ""],
+        ["", "", ""],
+        ["d", "", ""],
+    ]
+    assert trim_values(values, clean=True) == [["a", "c"], ["d", ""]]
+
+
+# get_sheet_values tests
+
+
+def test_get_sheet_values_private(mock_worksheet):
+    worksheet = mock_worksheet([["col_1", "col_2"], ["foo"], [1, 2]])
+
+    result = get_sheet_values(worksheet, header=True, clean=False)
+
+    assert worksheet.spreadsheet.values_get.call_args[0][0] == "'bar'"
+    assert result == [["foo", ""], [1, 2]]
+
+
+def test_get_sheet_values_public_columns(mocker):
+    mocker_open_call = mocker.patch(
+        "prefect_google_sheets.utils.values.open_public_sheet"
+    )
+    mocker_open_call.return_value.__enter__.return_value = io.BytesIO(
+        b"col_1,col_2,col_3\nfoo,bar,baz\n"
+    )
+
+    result = get_sheet_values(
+        "https://foo", header=True, clean=False, columns=["col_3", "col_1"]
+    )
+
+    assert result == [["baz", "foo"]]
+
+
+# values_to_columns tests
+
+
+def test_values_to_columns():
+    values = [["a", "", "a"], ["1"], [], ["2", "", "3", "4"]]
+
+    assert values_to_columns(values, header=True, clean=False) == {
+        "a": ["1", "", "2"],
+        "Unnamed: 1": ["", "", ""],
+        "a.1": ["", "", "3"],
+        "Unnamed: 3": ["", "", "4"],
+    }
+    assert values_to_columns(values, header=True, clean=True) == {
+        "a": ["1", "2"],
+        "a.1": ["", "3"],
+        "Unnamed: 3": ["", "4"],
+    }
+    assert values_to_columns([["1"], ["2", "3"]], header=False, clean=False) == {
+        0: ["1", "2"],
+        1: ["", "3"],
+    }
+
+
+# get_unformatted_sheet_dataframe tests
+
+
+def test_serial_numbers_to_datetimes():
+    result = serial_numbers_to_datetimes(pd.Series([44592.5, None, "n/a", 1]))
+
+    assert result.tolist()[0] == datetime(2022, 1, 31, 12)
+    assert result.isna().tolist() == [False, True, True, False]
+    assert result.tolist()[3] == datetime(1899, 12, 31)
+
+
+def test_get_unformatted_sheet_dataframe(mock_worksheet):
+    worksheet = mock_worksheet(
+        [["id", "amount", "day", ""], [1, 2.5, 44592], [2, "", 44593.25], []]
+    )
+
+    result = get_unformatted_sheet_dataframe(
+        worksheet, header=0, clean=True, serial_date_columns=["day"]
+    )
+
+    params = worksheet.spreadsheet.values_get.call_args.kwargs["params"]
+    assert params == {
+        "valueRenderOption": "UNFORMATTED_VALUE",
+        "dateTimeRenderOption": "SERIAL_NUMBER",
+    }
+    assert result.columns.tolist() == ["id", "amount", "day"]
+    assert result["amount"].dtype == "float64"
+    assert result["amount"].isna().tolist() == [False, True]
+    assert result["day"].tolist() == [
+        datetime(2022, 1, 31),
+        datetime(2022, 2, 1, 6),
+    ]
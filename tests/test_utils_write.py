@@ -0,0 +1,348 @@
+import numpy as np
+import pytest
+from pandas import DataFrame, Timestamp
+
+from prefect_google_sheets.exceptions import GoogleSheetValueError
+from prefect_google_sheets.utils.state import SheetStateStore
+from prefect_google_sheets.utils.write import (
+    BufferedSheetAppender,
+    dataframe_to_values,
+    get_changed_blocks,
+    iter_batch_update_data,
+    upsert_dataframe,
+    write_dataframe,
+)
+
+# dataframe_to_values tests
+
+
+def test_dataframe_to_values():
+    data_frame = DataFrame(
+        {
+            "id": [1, 2],
+            "amount": [1.5, np.nan],
+            "day": [Timestamp("2022-01-31 10:30"), None],
+            "name": ["foo", None],
+        }
+    )
+
+    assert dataframe_to_values(data_frame, include_header=True) == [
+        ["id", "amount", "day", "name"],
+        [1, 1.5, "2022-01-31 10:30:00", "foo"],
+        [2, "", "", ""],
+    ]
+    assert dataframe_to_values(data_frame[["id"]], include_header=False) == [[1], [2]]
+
+
+# iter_batch_update_data tests
+
+
+def test_iter_batch_update_data_cells():
+    rows = [[row, row] for row in range(5)]
+
+    result = list(iter_batch_update_data("bar", [(2, 2, rows)], max_cells=4))
+
+    assert [[r["range"] for r in data] for data in result] == [
+        ["'bar'!B2:C3"],
+        ["'bar'!B4:C5"],
+        ["'bar'!B6:C6"],
+    ]
+    assert result[2][0]["values"] == [[4, 4]]
+
+
+def test_iter_batch_update_data_many_blocks():
+    blocks = [(1, 1, [["a"]]), (3, 2, [["b", "c"]]), (5, 1, [["d"], ["e"]])]
+
+    result = list(iter_batch_update_data("bar", blocks, max_cells=3))
+
+    assert [[r["range"] for r in data] for data in result] == [
+        ["'bar'!A1:A1", "'bar'!B3:C3"],
+        ["'bar'!A5:A6"],
+    ]
+
+
+def test_iter_batch_update_data_bytes():
+    rows = [["x" * 10] for _ in range(4)]
+
+    result = list(iter_batch_update_data("bar", [(1, 1, rows)], max_bytes=30))
+
+    assert [len(data[0]["values"]) for data in result] == [2, 2]
+
+
+# get_changed_blocks tests
+
+
+def test_get_changed_blocks():
+    current_values = [["a", "b", "c"], [1, 2], [4, 5, 6], [7]]
+    values = [["a", "b", "c"], [1, 3, 0], [4, 9, 6], [7, 8, 9.0], [0, 0, 0]]
+
+    result = get_changed_blocks(current_values, values, start_row=2, start_col=2)
+
+    assert result == [
+        (3, 3, [[3, 0]]),
+        (4, 3, [[9]]),
+        (5, 3, [[8, 9.0]]),
+        (6, 2, [[0, 0, 0]]),
+    ]
+
+
+def test_get_changed_blocks_coalesced():
+    current_values = [[1, 2, 3], [1, 2, 3], [1, 2, 3]]
+    values = [[1, 0, 0], [1, 0, 0], [1, 2, 3]]
+
+    result = get_changed_blocks(current_values, values, start_row=1, start_col=1)
+
+    assert result == [(1, 2, [[0, 0], [0, 0]])]
+    assert get_changed_blocks(values, values, start_row=1, start_col=1) == []
+
+
+# write_dataframe tests
+
+
+def test_write_dataframe_resize(mock_worksheet):
+    worksheet = mock_worksheet()
+    data_frame = DataFrame({"col_1": range(3), "col_2": range(3)})
+
+    result = write_dataframe(
+        worksheet,
+        data_frame,
+        include_header=True,
+        start_cell="B2",
+        resize=True,
+        max_cells=4,
+    )
+
+    worksheet.resize.assert_called_once_with(rows=5, cols=3)
+    assert worksheet.spreadsheet.values_batch_update.call_count == 2
+    body = worksheet.spreadsheet.values_batch_update.call_args_list[0][1]["body"]
+    assert body["valueInputOption"] == "USER_ENTERED"
+    assert body["data"][0] == {
+        "range": "'bar'!B2:C3",
+        "values": [["col_1", "col_2"], [0, 0]],
+    }
+    assert result == {"requests": 2, "updated_cells": 8}
+
+
+def test_write_dataframe_error(mock_worksheet):
+    worksheet = mock_worksheet()
+    worksheet.spreadsheet.values_batch_update.side_effect = ValueError("foo")
+
+    with pytest.raises(GoogleSheetValueError, match="Error while writing the Sheet"):
+        write_dataframe(worksheet, DataFrame({"col_1": [1]}), include_header=True)
+
+
+def test_write_dataframe_only_changed_cells(mock_worksheet, tmp_path):
+    worksheet = mock_worksheet()
+    worksheet.spreadsheet.values_get.return_value = {
+        "values": [["col_1", "col_2"], [0, 1], [2]]
+    }
+    state_store = SheetStateStore(tmp_path)
+    data_frame = DataFrame({"col_1": [0, 2], "col_2": [1, 3]})
+
+    result = write_dataframe(
+        worksheet,
+        data_frame,
+        include_header=True,
+        only_changed_cells=True,
+        state_store=state_store,
+    )
+
+    assert worksheet.spreadsheet.values_get.call_args[0][0] == "'bar'!A1:B3"
+    body = worksheet.spreadsheet.values_batch_update.call_args[1]["body"]
+    assert body["data"] == [{"range": "'bar'!B3:B3", "values": [[3]]}]
+    assert result == {"requests": 1, "updated_cells": 1}
+
+    data_frame.loc[0, "col_1"] = 5
+    result = write_dataframe(
+        worksheet,
+        data_frame,
+        include_header=True,
+        only_changed_cells=True,
+        state_store=state_store,
+    )
+
+    worksheet.spreadsheet.values_get.assert_called_once()
+    body = worksheet.spreadsheet.values_batch_update.call_args[1]["body"]
+    assert body["data"] == [{"range": "'bar'!A2:A2", "values": [[5]]}]
+
+
+def test_write_dataframe_only_changed_cells_datetimes(mock_worksheet):
+    worksheet = mock_worksheet()
+    worksheet.spreadsheet.values_get.return_value = {
+        "values": [["day", "amount"], [44592.4375, 1], [44593, 2]]
+    }
+    data_frame = DataFrame(
+        {
+            "day": [Timestamp("2022-01-31 10:30"), Timestamp("2022-02-02")],
+            "amount": [1, 2],
+        }
+    )
+
+    write_dataframe(worksheet, data_frame, include_header=True, only_changed_cells=True)
+
+    params = worksheet.spreadsheet.values_get.call_args[1]["params"]
+    assert params["dateTimeRenderOption"] == "SERIAL_NUMBER"
+    body = worksheet.spreadsheet.values_batch_update.call_args[1]["body"]
+    assert body["data"] == [
+        {"range": "'bar'!A3:A3", "values": [["2022-02-02 00:00:00"]]}
+    ]
+
+
+# upsert_dataframe tests
+
+
+def test_upsert_dataframe(mock_worksheet):
+    worksheet = mock_worksheet()
+    worksheet.spreadsheet.values_get.return_value = {
+        "values": [["id", "name", "note", "amount"]]
+    }
+    worksheet.spreadsheet.values_batch_get.return_value = {
+        "valueRanges": [{"values": [["id"], [1], [2], [3], [4], [], [6]]}]
+    }
+    data_frame = DataFrame(
+        {
+            "amount": [1.5, 2.5, 3.5, 9.5, 6.5],
+            "id": [2, 3, 9, 9, 6],
+            "name": ["b", "c", "i", "j", "f"],
+        }
+    )
+
+    result = upsert_dataframe(worksheet, data_frame, ["id"])
+
+    assert worksheet.spreadsheet.values_batch_get.call_args[0][0] == ["'bar'!A:A"]
+    body = worksheet.spreadsheet.values_batch_update.call_args[1]["body"]
+    assert body["data"] == [
+        {"range": "'bar'!A3:B4", "values": [[2, "b"], [3, "c"]]},
+        {"range": "'bar'!A7:B7", "values": [[6, "f"]]},
+        {"range": "'bar'!D3:D4", "values": [[1.5], [2.5]]},
+        {"range": "'bar'!D7:D7", "values": [[6.5]]},
+    ]
+    worksheet.spreadsheet.values_append.assert_called_once_with(
+        "'bar'",
+        params={"valueInputOption": "USER_ENTERED", "insertDataOption": "INSERT_ROWS"},
+        body={"values": [[9, "j", "", 9.5]]},
+    )
+    assert result == {"requests": 2, "updated_rows": 3, "appended_rows": 1}
+
+
+def test_upsert_dataframe_datetime_key(mock_worksheet):
+    worksheet = mock_worksheet()
+    worksheet.spreadsheet.values_get.return_value = {"values": [["day", "amount"]]}
+    worksheet.spreadsheet.values_batch_get.return_value = {
+        "valueRanges": [{"values": [["day"], [44592], [44593.5]]}]
+    }
+    data_frame = DataFrame(
+        {
+            "day": [Timestamp("2022-02-01 12:00"), Timestamp("2022-02-03")],
+            "amount": [1, 2],
+        }
+    )
+
+    result = upsert_dataframe(worksheet, data_frame, ["day"])
+
+    params = worksheet.spreadsheet.values_batch_get.call_args[1]["params"]
+    assert params["dateTimeRenderOption"] == "SERIAL_NUMBER"
+    body = worksheet.spreadsheet.values_batch_update.call_args[1]["body"]
+    assert body["data"] == [
+        {"range": "'bar'!A3:B3", "values": [["2022-02-01 12:00:00", 1]]}
+    ]
+    assert result["updated_rows"] == 1
+    assert result["appended_rows"] == 1
+
+
+def test_upsert_dataframe_missing_columns(mock_worksheet):
+    worksheet = mock_worksheet()
+    worksheet.spreadsheet.values_get.return_value = {"values": [["id"]]}
+
+    with pytest.raises(GoogleSheetValueError, match="Columns not found"):
+        upsert_dataframe(worksheet, DataFrame({"id": [1], "name": ["a"]}), ["id"])
+
+
+# BufferedSheetAppender tests
+
+
+def test_buffered_sheet_appender_max_rows(mock_worksheet):
+    worksheet = mock_worksheet()
+
+    with BufferedSheetAppender(worksheet, max_rows=2) as appender:
+        appender.append([1, np.int64(2), None])
+        worksheet.spreadsheet.values_append.assert_not_called()
+        appender.extend([[3, np.nan], [5], [7, Timestamp("2022-01-31")]])
+        assert worksheet.spreadsheet.values_append.call_count == 2
+
+    calls = worksheet.spreadsheet.values_append.call_args_list
+    assert [call[1]["body"]["values"] for call in calls] == [
+        [[1, 2, ""], [3, "", ""]],
+        [[5, ""], [7, "2022-01-31 00:00:00"]],
+    ]
+    assert calls[0][0][0] == "'bar'"
+    assert appender.requests == 2
+    assert appender.appended_rows == 4
+    assert appender.rows_per_request == 2.0
+
+
+def test_buffered_sheet_appender_max_bytes_and_wait(mock_worksheet, mocker):
+    worksheet = mock_worksheet()
+    mocker_clock = mocker.patch("prefect_google_sheets.utils.write.clock.monotonic")
+    mocker_clock.return_value = 0.0
+    appender = BufferedSheetAppender(worksheet, max_bytes=25, max_wait=5)
+
+    appender.append(["x" * 20])
+    appender.append(["foo"])
+    mocker_clock.return_value = 4.0
+    appender.append(["bar"])
+    assert worksheet.spreadsheet.values_append.call_count == 1
+    mocker_clock.return_value = 5.0
+    appender.append(["b"])
+
+    assert worksheet.spreadsheet.values_append.call_count == 2
+    body = worksheet.spreadsheet.values_append.call_args[1]["body"]
+    assert body["values"] == [["foo"], ["bar"], ["b"]]
+
+
+def test_buffered_sheet_appender_error(mock_worksheet):
+    worksheet = mock_worksheet()
+    worksheet.spreadsheet.values_append.side_effect = ValueError("foo")
+    appender = BufferedSheetAppender(worksheet)
+    appender.append([1])
+
+    with pytest.raises(GoogleSheetValueError, match="Error while writing the Sheet"):
+        appender.flush()
+
+    worksheet.spreadsheet.values_append.side_effect = None
+    appender.flush()
+    body = worksheet.spreadsheet.values_append.call_args[1]["body"]
+    assert body["values"] == [[1]]
+    assert appender.appended_rows == 1
+
+
+def test_buffered_sheet_appender_error_mid_flush(mock_worksheet):
+    worksheet = mock_worksheet()
+    worksheet.spreadsheet.values_append.side_effect = [{}, ValueError("foo"), {}]
+    appender = BufferedSheetAppender(worksheet, max_rows=1000)
+    appender.extend([[row] * 100 for row in range(600)])
+
+    with pytest.raises(GoogleSheetValueError, match="Error while writing the Sheet"):
+        appender.flush()
+
+    assert appender.requests == 1
+    assert appender.appended_rows == 500
+
+    appender.flush()
+    calls = worksheet.spreadsheet.values_append.call_args_list
+    assert [len(call[1]["body"]["values"]) for call in calls] == [500, 100, 100]
+    assert calls[2][1]["body"]["values"][0][0] == 500
+    assert appender.requests == 2
+    assert appender.appended_rows == 600
+
+
+def test_buffered_sheet_appender_body_error(mock_worksheet):
+    worksheet = mock_worksheet()
+    worksheet.spreadsheet.values_append.side_effect = ValueError("foo")
+
+    with pytest.raises(KeyError):
+        with BufferedSheetAppender(worksheet) as appender:
+            appender.append([1])
+            raise KeyError("bar")
+
+    worksheet.spreadsheet.values_append.assert_not_called()